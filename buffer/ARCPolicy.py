@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:49
+# @Author  : EvanWong
+# @File    : ARCPolicy.py
+# @Project : TestDB
+
+from collections import OrderedDict
+from itertools import chain
+from typing import Iterator, Optional
+
+from buffer.Buffer import Buffer
+from buffer.ReplacementPolicy import ReplacementPolicy
+from file.BlockID import BlockID
+
+
+class ARCPolicy(ReplacementPolicy):
+    """
+    Adaptive replacement cache (Megiddo and Modha, 2003).
+
+    Resident blocks are split between T1, the blocks accessed once recently, and T2, those
+    accessed at least twice; both are LRU lists. The ghost lists B1 and B2 remember the IDs of
+    blocks recently evicted from T1 and T2. A miss on a block remembered in B1 means T1 was too
+    small and moves the target size p of T1 up; a miss on a block in B2 moves it down. Victims
+    are taken from T1 while it exceeds p and from T2 otherwise, so the split between recency and
+    frequency follows the workload without any tuning.
+
+    Pinned buffers are skipped when looking for the least recently used buffer of a list; if the
+    list to evict from holds only pinned buffers, the other list is used.
+
+    Attributes:
+        __capacity (int): The number of buffers in the pool (c).
+        __target (float): The target size of T1 (p).
+        __t1 (OrderedDict[Buffer, None]): The buffers of blocks accessed once, least recently used first.
+        __t2 (OrderedDict[Buffer, None]): The buffers of blocks accessed repeatedly, least recently used first.
+        __b1 (OrderedDict[BlockID, None]): The IDs of blocks evicted from T1, oldest first.
+        __b2 (OrderedDict[BlockID, None]): The IDs of blocks evicted from T2, oldest first.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initializes empty lists sized for the given pool.
+
+        Args:
+            capacity (int): The number of buffers in the pool.
+        """
+        self.__capacity: int = capacity
+        self.__target: float = 0.0
+        self.__t1: OrderedDict[Buffer, None] = OrderedDict()
+        self.__t2: OrderedDict[Buffer, None] = OrderedDict()
+        self.__b1: OrderedDict[BlockID, None] = OrderedDict()
+        self.__b2: OrderedDict[BlockID, None] = OrderedDict()
+
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Moves a hit, also on a buffer in neither list such as one held for a reservation, to the
+        most recently used end of T2. A newly read block goes to T2 if it was remembered in a
+        ghost list, after adapting the target size of T1, and to T1 otherwise.
+
+        Args:
+            buff (Buffer): The pinned buffer.
+            hit (bool): Whether the block was resident.
+        """
+        blk = buff.block
+        if hit:
+            self.__t1.pop(buff, None)
+            self.__t2[buff] = None
+            self.__t2.move_to_end(buff)
+        elif blk in self.__b1:
+            self.__target = min(self.__capacity, self.__target + max(len(self.__b2) / len(self.__b1), 1))
+            del self.__b1[blk]
+            self.__t2[buff] = None
+        elif blk in self.__b2:
+            self.__target = max(0.0, self.__target - max(len(self.__b1) / len(self.__b2), 1))
+            del self.__b2[blk]
+            self.__t2[buff] = None
+        else:
+            self.__t1[buff] = None
+            self.__trim_history()
+
+    def unpinned(self, buff: Buffer):
+        """
+        Does nothing: the lists order buffers by access, not by unpinning.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        pass
+
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Evicts the least recently used unpinned buffer of T1 into B1 if T1 exceeds its target
+        size (or equals it and the requested block is in B2), and of T2 into B2 otherwise.
+
+        Args:
+            blk (BlockID): The block about to be read.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        t1_size = len(self.__t1)
+        if t1_size and (t1_size > self.__target or (blk in self.__b2 and t1_size == int(self.__target))):
+            order = ((self.__t1, self.__b1), (self.__t2, self.__b2))
+        else:
+            order = ((self.__t2, self.__b2), (self.__t1, self.__b1))
+        for resident, ghosts in order:
+            for buff in resident:
+                if not buff.is_pinned:
+                    del resident[buff]
+                    ghosts[buff.block] = None
+                    return buff
+        return None
+
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the buffers of T1 first while it exceeds its target size and of T2 first otherwise,
+        least recently used first.
+
+        Returns:
+            Iterator[Buffer]: The buffers in approximate eviction order.
+        """
+        if self.__t1 and len(self.__t1) > self.__target:
+            return chain(self.__t1, self.__t2)
+        return chain(self.__t2, self.__t1)
+
+    def removed(self, buff: Buffer):
+        """
+        Forgets the buffer without remembering its block.
+
+        Args:
+            buff (Buffer): The emptied buffer.
+        """
+        self.__t1.pop(buff, None)
+        self.__t2.pop(buff, None)
+
+    def resized(self, capacity: int):
+        """
+        Adopts the new pool size, capping the target size of T1 and trimming the ghost lists to it.
+
+        Args:
+            capacity (int): The new number of buffers in the pool.
+        """
+        self.__capacity = capacity
+        self.__target = min(self.__target, capacity)
+        self.__trim_history()
+
+    def __trim_history(self):
+        """
+        Bounds the ghost lists after a new block entered T1: T1 and B1 together hold at most c
+        blocks, and all four lists together at most 2c.
+        """
+        while self.__b1 and len(self.__t1) + len(self.__b1) > self.__capacity:
+            self.__b1.popitem(last=False)
+        while self.__b2 and len(self.__t1) + len(self.__t2) + len(self.__b1) + len(self.__b2) > 2 * self.__capacity:
+            self.__b2.popitem(last=False)
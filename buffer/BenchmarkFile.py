@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 04:40
+# @Author  : EvanWong
+# @File    : BenchmarkFile.py
+# @Project : TestDB
+from file.FileMgr import FileMgr
+from file.Page import Page
+
+
+def create_file(directory: str, block_size: int, num_blocks: int, filename: str):
+    """
+    Fills a benchmark file with blocks each holding its own block number, and syncs it.
+
+    Args:
+        directory (str): The database directory to create the file in.
+        block_size (int): The block size of the file.
+        num_blocks (int): The number of blocks to write.
+        filename (str): The name of the file.
+    """
+    fm = FileMgr(directory, block_size, cache_size=0)
+    p = Page(block_size)
+    for i in range(num_blocks):
+        blk = fm.append(filename)
+        p.set_int(0, i)
+        fm.write(blk, p)
+    fm.sync(filename)
+    fm.close()
@@ -3,8 +3,10 @@
 # @Author  : EvanWong
 # @File    : Buffer.py
 # @Project : TestDB
+from concurrent.futures import Future, wait
 from typing import Optional
 
+from buffer.DirtyPageTable import DirtyPageTable
 from file.BlockID import BlockID
 from file.FileMgr import FileMgr
 from file.Page import Page
@@ -26,15 +28,19 @@ class Buffer:
         __fm (FileMgr): The file manager for reading and writing blocks.
         __lm (LogMgr): The log manager for flushing log records to disk.
         __contents (Page): The content of the buffer, represented by a `Page` object.
+        __dirty_table (Optional[DirtyPageTable]): The table this buffer reports modifications and write-backs to.
+        __read (Optional[Future]): The read ahead that is filling the buffer's page, if any.
+        __read_position (int): The position of the buffer's block within the range read by `__read`.
     """
 
-    def __init__(self, fm: FileMgr, lm: LogMgr):
+    def __init__(self, fm: FileMgr, lm: LogMgr, dirty_table: Optional[DirtyPageTable] = None):
         """
         Initializes a new buffer with an empty page.
 
         Args:
             fm (FileMgr): The file manager for block I/O operations.
             lm (LogMgr): The log manager for managing log records.
+            dirty_table (Optional[DirtyPageTable]): The dirty-page table of the buffer's pool, if any.
         """
         self.__blk: Optional[BlockID] = None
         self.__pins: int = 0
@@ -43,6 +49,9 @@ class Buffer:
         self.__fm: FileMgr = fm
         self.__lm: LogMgr = lm
         self.__contents: Page = Page(fm.block_size)  # Initialize with an empty page buffer
+        self.__dirty_table: Optional[DirtyPageTable] = dirty_table
+        self.__read: Optional[Future] = None
+        self.__read_position: int = 0
 
     @property
     def contents(self) -> Page:
@@ -75,6 +84,8 @@ class Buffer:
         self.__tx_num = tx_num
         if lsn > 0:
             self.__lsn = lsn
+        if self.__dirty_table is not None:
+            self.__dirty_table.mark(self, tx_num)
 
     @property
     def is_pinned(self) -> bool:
@@ -96,21 +107,89 @@ class Buffer:
         """
         return self.__tx_num
 
+    @property
+    def is_modified(self) -> bool:
+        """
+        Checks if the buffer holds modifications that have not been written back.
+
+        Returns:
+            bool: True if the buffer is dirty, False otherwise.
+        """
+        return self.__tx_num >= 0
+
+    @property
+    def lsn(self) -> int:
+        """
+        Returns the Log Sequence Number of the most recent modification to this buffer.
+
+        Returns:
+            int: The LSN, or -1 if no modification was logged.
+        """
+        return self.__lsn
+
     def assign_to_block(self, b: BlockID):
         """
         Assigns a block to this buffer and reads its content.
 
-        This method flushes the buffer's current contents (if modified), then assigns the
-        specified block to this buffer and reads its data into the buffer.
+        If the buffer's current contents were modified, the log records describing them are
+        flushed and the contents are handed to the file manager to be written back on an I/O
+        thread, so reading the new block does not wait for the write of the old one.
 
         Args:
             b (BlockID): The block to assign to this buffer.
         """
-        self.flush()  # Ensure the current content is written to disk if modified
+        self.__drop_read()
+        self.write_back()
         self.__blk = b
         self.__fm.read(self.__blk, self.__contents)  # Load the block's data into the buffer
         self.__pins = 0  # Reset the pin count
 
+    def assign_ahead(self, b: BlockID):
+        """
+        Assigns a block that is about to be read ahead into this buffer, without reading it.
+
+        Modified contents are written back as in `assign_to_block`, after which the page may be
+        handed to the read. The read must then be attached with `set_pending_read`.
+
+        Args:
+            b (BlockID): The block to assign to this buffer.
+        """
+        self.__drop_read()
+        self.write_back()
+        self.__blk = b
+        self.__pins = 0
+
+    def set_pending_read(self, read: Future, position: int):
+        """
+        Records that the buffer's page is being filled by a range read on an I/O thread, or by the
+        thread that pinned the block.
+
+        The page must not be used before `wait_for_read`.
+
+        Args:
+            read (Future): The read; its result is the number of blocks read.
+            position (int): The position of the buffer's block within the range.
+        """
+        self.__read_position = position
+        self.__read = read
+
+    def wait_for_read(self):
+        """
+        Waits until the block read ahead into this buffer has arrived.
+
+        If the read failed or stopped short of the block, the block is read here instead.
+        """
+        read = self.__read
+        if read is None:
+            return
+        try:
+            n = read.result()
+        except RuntimeError:
+            n = 0
+        if n <= self.__read_position:
+            self.__fm.read(self.__blk, self.__contents)
+        self.__read = None
+
     def flush(self):
         """
         Flushes the buffer's contents to disk if it has been modified.
@@ -129,7 +208,33 @@ class Buffer:
         # Write the buffer's contents to disk
         self.__fm.write(self.__blk, self.__contents)
         # Reset the transaction ID to indicate no pending modifications
-        self.__tx_num = -1
+        self.__mark_clean()
+
+    def discard(self):
+        """
+        Detaches the buffer from its block, dropping any modifications without writing them.
+
+        Used when the file of the block has been deleted, e.g. a temporary file after its query.
+        """
+        self.__drop_read()
+        self.__blk = None
+        self.__mark_clean()
+        self.__lsn = -1
+        self.__pins = 0
+
+    def write_back(self):
+        """
+        Writes the buffer's contents back asynchronously if it has been modified.
+
+        The log is still flushed synchronously, so a data page never reaches the disk before
+        the log records of its modifications. The file manager copies the page before returning.
+        Used when the buffer is reassigned, and ahead of that by the background writer.
+        """
+        if self.__tx_num < 0:
+            return
+        self.__lm.flush(self.__lsn)
+        self.__fm.write_async(self.__blk, self.__contents)
+        self.__mark_clean()
 
     def pin(self):
         """
@@ -152,3 +257,19 @@ class Buffer:
         """
         if self.__pins > 0:
             self.__pins -= 1
+
+    def __mark_clean(self):
+        """
+        Records that the buffer holds no unwritten modifications any more.
+        """
+        self.__tx_num = -1
+        if self.__dirty_table is not None:
+            self.__dirty_table.clear(self)
+
+    def __drop_read(self):
+        """
+        Waits for a pending read ahead to stop filling the page, whose contents are about to be replaced.
+        """
+        if self.__read is not None:
+            wait([self.__read])
+            self.__read = None
@@ -3,49 +3,154 @@
 # @Author  : EvanWong
 # @File    : BufferMgr.py
 # @Project : TestDB
+import threading
 import time
-from collections import OrderedDict
-from typing import Optional
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 
+from buffer.ARCPolicy import ARCPolicy
 from buffer.Buffer import Buffer
 from buffer.BufferAbortException import BufferAbortException
+from buffer.BufferPool import BufferPool
+from buffer.BufferRing import BufferRing
+from buffer.ClockPolicy import ClockPolicy
+from buffer.DirtyPageTable import DirtyPageTable
+from buffer.LRUKPolicy import LRUKPolicy
+from buffer.LRUPolicy import LRUPolicy
+from buffer.ReadAhead import ReadAhead
+from buffer.ReplacementPolicy import ReplacementPolicy
+from buffer.ReplacementStrategy import ReplacementStrategy
+from buffer.TwoQPolicy import TwoQPolicy
 from file.BlockID import BlockID
 from file.FileMgr import FileMgr
 from log.LogMgr import LogMgr
 
 
-class BufferMgr:
+class BufferMgr(BufferPool):
     """
-    Manages a pool of buffers for a database system with an LRU (Least Recently Used) replacement strategy.
+    Manages a pool of buffers for a database system with a pluggable replacement strategy.
 
     This class manages a fixed number of buffers that are used to read/write blocks from/to disk.
-    It supports pinning/unpinning blocks, flushing buffers, and uses the LRU strategy for buffer replacement.
+    It supports pinning/unpinning blocks and flushing buffers. A block that is not resident is read
+    into an empty buffer if there is one; otherwise the replacement policy chosen at construction
+    (LRU by default, see `ReplacementStrategy`) picks the unpinned buffer to reassign. Bulk operations
+    pin through a `BufferRing` instead, which keeps reusing a few buffers of their own.
+
+    Blocks are read ahead of sequential readers. The buffer manager detects, per file, readers that
+    pin consecutive blocks (a bulk operation's ring marks its scan sequential from the start) and
+    reads the following blocks with one vectored read on an I/O thread, into buffers taken as for a
+    miss. These buffers stay unpinned, but the replacement policy only learns about them when their
+    block is first pinned; pinning such a block waits for its read if it has not arrived yet. The
+    window grows while the reader keeps using the blocks read ahead and shrinks when they are
+    evicted unused (see `ReadAhead`), and no more than a quarter of the pool holds unused blocks
+    read ahead.
+
+    `write_ahead` writes dirty buffers back before the policy chooses them as victims, so that
+    reading a block rarely has to wait for a log flush first; a `BufferWriter` thread calls it
+    periodically.
+
+    A thread that needs a buffer while all of them are pinned sleeps on a condition variable until
+    `unpin` frees one, for at most `max_wait` seconds. Waiters are served in arrival order: only the
+    longest waiting thread may take a freed buffer, and a newcomer that needs a free buffer queues
+    behind the waiters instead of overtaking them. Pinning a block that is already resident never waits.
+    A block that is not resident is read after the condition is released, so that other threads can
+    pin resident blocks meanwhile; threads pinning the same block wait for its read.
+
+    The resident blocks, hottest first, can be saved with `save_resident` on shutdown and read back
+    into the free buffers of a new pool with `prewarm`, so that a restarted engine does not run cold.
+
+    The pool can be resized while in use with `resize`. A buffer that has to go but is pinned stays
+    until it is unpinned.
+
+    `reserve` keeps a number of blocks of a file resident, e.g. of a catalog table read by every
+    statement, however many other blocks are read meanwhile. Up to that many unpinned buffers of
+    the file are held out of the replacement policy, which learns about them again when they are
+    pinned; they are evicted only when no other buffer is left.
 
     Attributes:
-        __MAX_TIME (int): The maximum time (in seconds) a thread will wait for a buffer before aborting.
-        __buffer_pool (OrderedDict): An ordered dictionary to store buffers in LRU order (most recent to least recent).
+        __fm (FileMgr): The file manager, which writes evicted buffers back asynchronously.
+        __lm (LogMgr): The log manager, flushed before dirty buffers are written ahead of eviction.
+        __buffer_pool (List[Buffer]): All buffers of the pool.
+        __dirty_table (DirtyPageTable): The dirty buffers of every transaction, so that committing a
+            transaction costs the same whatever the size of the pool.
+        __free_buffers (List[Buffer]): The buffers holding no block, used before any block is evicted.
+        __policy (ReplacementPolicy): The policy choosing the buffer to reassign.
+        __buffer_table (Dict[BlockID, Buffer]): The buffer holding each block, so that finding the buffer
+            of a block costs the same whatever the size of the pool.
         __num_available (int): The number of available (unpinned) buffers in the pool.
+        __max_wait (float): The maximum time (in seconds) a thread will wait for a buffer before aborting.
+        __condition (threading.Condition): Guards the pool; notified whenever a buffer may have become free.
+        __waiters (Deque[int]): The tickets of the threads waiting for a buffer, in arrival order.
+        __next_ticket (int): The ticket handed to the next waiting thread.
+        __waits (int): The number of pins that had to wait for a buffer.
+        __timeouts (int): The number of pins that gave up waiting.
+        __wait_time (float): The total time, in seconds, spent waiting for buffers.
+        __hits (int): The number of pins that found their block resident.
+        __misses (int): The number of pins that read their block.
+        __dirty_evictions (int): The number of pins that had to write a dirty victim back first.
+        __max_read_ahead (int): The largest number of blocks read ahead of a reader; 0 disables reading ahead.
+        __read_aheads (Dict[str, ReadAhead]): The read-ahead state of every file read without a ring.
+        __prefetched (OrderedDict[Buffer, ReadAhead]): The buffers holding a block read ahead that was
+            not pinned yet, oldest first, with the read-ahead state that requested it.
+        __prefetches (int): The number of blocks read ahead.
+        __prefetch_hits (int): The number of blocks read ahead that were pinned before being evicted.
+        __stripe (int): The size of the stripes of blocks assigned to the pool by a partitioned manager;
+            reading ahead stops at the end of a stripe. 0 if the pool holds whole files.
+        __excess (int): The number of buffers still to be removed by a shrink, as soon as they are unpinned.
+        __quotas (Dict[str, int]): The number of buffers reserved for each file with a reservation.
+        __reserved (Dict[str, Dict[Buffer, None]]): The unpinned buffers held out of the policy for
+            each file with a reservation, in the order they were unpinned.
     """
 
-    __MAX_TIME: int = 10  # Maximum wait time for buffer pinning (seconds)
+    DEFAULT_READ_AHEAD = 32  # Default largest number of blocks read ahead of a sequential reader
+    RESERVED_SHARE = 0.25  # Largest share of the pool that reservations hold together
 
-    def __init__(self, fm: FileMgr, lm: LogMgr, num_buffs: int):
+    def __init__(self, fm: FileMgr, lm: LogMgr, num_buffs: int, max_wait: float = BufferPool.DEFAULT_MAX_WAIT,
+                 strategy: ReplacementStrategy = ReplacementStrategy.LRU, read_ahead: int = DEFAULT_READ_AHEAD,
+                 stripe: int = 0):
         """
-        Initializes the buffer manager with a fixed number of buffers and sets up the LRU cache.
+        Initializes the buffer manager with a fixed number of buffers and the given replacement policy.
 
         Args:
             fm (FileMgr): The file manager for reading/writing blocks.
             lm (LogMgr): The log manager for managing log records.
             num_buffs (int): The number of buffers to allocate in the pool.
+            max_wait (float): The maximum time, in seconds, a pin waits for a free buffer.
+            strategy (ReplacementStrategy): The replacement policy.
+            read_ahead (int): The largest number of blocks read ahead of a sequential reader; it is
+                also limited to an eighth of the pool. 0 disables reading ahead.
+            stripe (int): If positive, the pool is a partition of a `PartitionedBufferMgr`, which assigns
+                files to partitions in stripes of this many blocks; reading ahead stops at the end of a stripe.
         """
-        self.__buffer_pool: OrderedDict = OrderedDict()  # OrderedDict for LRU
+        self.__fm: FileMgr = fm
+        self.__lm: LogMgr = lm
+        self.__max_wait: float = max_wait
+        self.__condition: threading.Condition = threading.Condition()
+        self.__waiters: Deque[int] = deque()
+        self.__next_ticket: int = 0
+        self.__waits: int = 0
+        self.__timeouts: int = 0
+        self.__wait_time: float = 0.0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__dirty_evictions: int = 0
+        self.__dirty_table: DirtyPageTable = DirtyPageTable()
+        self.__buffer_pool: List[Buffer] = [Buffer(fm, lm, self.__dirty_table) for _ in range(num_buffs)]
+        self.__free_buffers: List[Buffer] = self.__buffer_pool[::-1]  # Handed out in pool order
+        self.__buffer_table: Dict[BlockID, Buffer] = {}
+        self.__policy: ReplacementPolicy = self.__create_policy(strategy, num_buffs)
         self.__num_available: int = num_buffs
-
-        # Initialize buffers and add them to the LRU pool
-        for _ in range(num_buffs):
-            buffer = Buffer(fm, lm)
-            self.__buffer_pool[buffer] = None  # Value can be ignored, keys are buffers
-        self.__num_available = num_buffs
+        self.__max_read_ahead: int = read_ahead
+        self.__read_aheads: Dict[str, ReadAhead] = {}
+        self.__prefetched: OrderedDict[Buffer, ReadAhead] = OrderedDict()
+        self.__prefetches: int = 0
+        self.__prefetch_hits: int = 0
+        self.__stripe: int = stripe
+        self.__excess: int = 0
+        self.__quotas: Dict[str, int] = {}
+        self.__reserved: Dict[str, Dict[Buffer, None]] = {}
 
     @property
     def available(self) -> int:
@@ -57,40 +162,380 @@ class BufferMgr:
         """
         return self.__num_available
 
+    @property
+    def buffer_count(self) -> int:
+        """
+        Returns the total number of buffers in the pool.
+
+        Returns:
+            int: The number of buffers.
+        """
+        return len(self.__buffer_pool)
+
+    @property
+    def waits(self) -> int:
+        """
+        Returns the number of pins that had to wait for a buffer, including those that timed out.
+
+        Returns:
+            int: The number of waits.
+        """
+        return self.__waits
+
+    @property
+    def timeouts(self) -> int:
+        """
+        Returns the number of pins that gave up waiting and raised BufferAbortException.
+
+        Returns:
+            int: The number of timeouts.
+        """
+        return self.__timeouts
+
+    @property
+    def wait_time(self) -> float:
+        """
+        Returns the total time spent waiting for buffers.
+
+        Returns:
+            float: The wait time in seconds, summed over all waiting pins.
+        """
+        return self.__wait_time
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of pins that found their block in a buffer.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of pins that had to read their block from disk.
+
+        Returns:
+            int: The number of misses.
+        """
+        return self.__misses
+
+    @property
+    def dirty_evictions(self) -> int:
+        """
+        Returns the number of pins that found their victim dirty and had to write it back.
+
+        Returns:
+            int: The number of dirty evictions.
+        """
+        return self.__dirty_evictions
+
+    @property
+    def prefetches(self) -> int:
+        """
+        Returns the number of blocks read ahead of sequential readers.
+
+        Returns:
+            int: The number of blocks read ahead.
+        """
+        return self.__prefetches
+
+    @property
+    def prefetch_hits(self) -> int:
+        """
+        Returns the number of blocks read ahead that were pinned before being evicted. They are
+        also counted as hits.
+
+        Returns:
+            int: The number of blocks read ahead and used.
+        """
+        return self.__prefetch_hits
+
+    @property
+    def dirty_count(self) -> int:
+        """
+        Returns the number of buffers holding modifications that were not written back.
+
+        The count is taken without locking, so it is only an estimate while other threads run.
+
+        Returns:
+            int: The number of dirty buffers.
+        """
+        return len(self.__dirty_table)
+
     def flush_all(self, tx_num: int):
         """
         Flushes all buffers modified by a specific transaction.
 
+        The buffers are looked up in the dirty-page table rather than by scanning the pool. The
+        log is flushed once, up to the latest of their modifications, and the blocks are then
+        written sorted by file and block number, so that the disk sees them in sequential order.
+
+        Buffers of the transaction that were evicted earlier may still be being written back, so
+        the method also waits for all pending asynchronous writes: when it returns, every page the
+        transaction modified has been handed to the operating system. Blocks of temporary files
+        are not flushed; they are written back only if evicted.
+
         Args:
             tx_num (int): The transaction ID whose buffers should be flushed.
         """
-        for buffer in self.__buffer_pool:
-            if buffer.modifying_tx == tx_num:
-                buffer.flush()
+        with self.__condition:
+            buffers = [buffer for buffer in self.__dirty_table.buffers(tx_num)
+                       if not FileMgr.is_temp(buffer.block.filename)]
+            if buffers:
+                buffers.sort(key=lambda b: (b.block.filename, b.block.number))
+                self.__lm.flush(max(buffer.lsn for buffer in buffers))
+                for buffer in buffers:
+                    buffer.flush()
+        self.__fm.wait_for_writes()
+
+    def write_ahead(self, max_pages: int, scan_depth: int) -> int:
+        """
+        Writes back dirty, unpinned buffers that the replacement policy would evict soon.
+
+        The first `scan_depth` buffers in eviction order are examined and at most `max_pages` of
+        them are written. The log is flushed up to their modifications without holding the lock,
+        then each buffer that is still unpinned and dirty is handed to the file manager, which
+        writes it asynchronously. A buffer modified meanwhile is written after one more log flush.
+
+        Args:
+            max_pages (int): The maximum number of buffers to write.
+            scan_depth (int): The number of buffers to examine, those closest to eviction.
+
+        Returns:
+            int: The number of buffers written.
+        """
+        with self.__condition:
+            candidates = [buffer for buffer in islice(self.__policy.candidates(), scan_depth)
+                          if buffer.is_modified and not buffer.is_pinned][:max_pages]
+            if not candidates:
+                return 0
+            lsn = max(buffer.lsn for buffer in candidates)
+        self.__lm.flush(lsn)
+        written = 0
+        with self.__condition:
+            for buffer in candidates:
+                if buffer.is_modified and not buffer.is_pinned:
+                    buffer.write_back()
+                    written += 1
+        return written
+
+    def discard_file(self, filename: str):
+        """
+        Detaches every buffer holding a block of the given file, dropping unwritten modifications.
+
+        Used before a file is deleted, so that no buffer writes a block of it back afterward.
+        The blocks of the file must not be pinned.
+
+        Args:
+            filename (str): The name of the file.
+        """
+        with self.__condition:
+            for buffer in self.__buffer_pool:
+                if buffer.block is not None and buffer.block.filename == filename and not buffer.is_pinned:
+                    del self.__buffer_table[buffer.block]
+                    self.__untrack(buffer)
+                    buffer.discard()
+                    self.__free_buffers.append(buffer)
+            self.__read_aheads.pop(filename, None)
+
+    def resize(self, num_buffs: int):
+        """
+        Grows or shrinks the pool while it is in use.
+
+        Growing adds empty buffers, which waiting threads take right away. Shrinking removes
+        empty buffers first, then buffers holding blocks read ahead and never pinned, then
+        unpinned buffers in the replacement policy's eviction order, then buffers held for
+        reservations, writing modifications back as eviction does. If too many buffers are
+        pinned, the rest are removed as they are unpinned, so `buffer_count` reaches the new
+        size only then.
+
+        Args:
+            num_buffs (int): The new number of buffers.
+
+        Raises:
+            ValueError: If the number of buffers is not positive.
+        """
+        if num_buffs < 1:
+            raise ValueError("num_buffs must be positive.")
+        with self.__condition:
+            change = num_buffs - (len(self.__buffer_pool) - self.__excess)
+            if change > 0:
+                kept = min(change, self.__excess)  # Buffers a previous shrink has not removed yet stay
+                self.__excess -= kept
+                added = [Buffer(self.__fm, self.__lm, self.__dirty_table) for _ in range(change - kept)]
+                self.__buffer_pool.extend(added)
+                self.__free_buffers.extend(added)
+                self.__num_available += len(added)
+                if added and self.__waiters:
+                    self.__condition.notify_all()
+            else:
+                self.__excess -= change
+                while self.__excess and self.__free_buffers:
+                    self.__retire(self.__free_buffers.pop())
+                while self.__excess and self.__prefetched:
+                    buff = next(iter(self.__prefetched))
+                    self.__untrack(buff)
+                    self.__retire(buff)
+                victims = [buff for buff in self.__policy.candidates() if not buff.is_pinned][:self.__excess]
+                for buff in victims:
+                    self.__policy.removed(buff)
+                    self.__retire(buff)
+                while self.__excess:
+                    buff = self.__evict_reserved()
+                    if buff is None:
+                        break
+                    self.__retire(buff)
+            self.__policy.resized(num_buffs)
+
+    def resident_blocks(self) -> List[BlockID]:
+        """
+        Returns the blocks of permanent files held by the pool, hottest first: the pinned ones,
+        then those held for reservations, then the others in the reverse of the replacement
+        policy's eviction order. Blocks read ahead and never pinned are left out.
+
+        Returns:
+            List[BlockID]: The resident blocks, hottest first.
+        """
+        with self.__condition:
+            pinned = [buffer for buffer in self.__buffer_pool if buffer.block is not None and buffer.is_pinned]
+            reserved = [buffer for held in self.__reserved.values() for buffer in held]
+            unpinned = [buffer for buffer in self.__policy.candidates() if not buffer.is_pinned]
+            return [buffer.block for buffer in pinned + reserved + unpinned[::-1]
+                    if not FileMgr.is_temp(buffer.block.filename)]
+
+    def prewarm(self, blocks: List[BlockID]) -> int:
+        """
+        Reads blocks into the free buffers, e.g. the blocks that were resident before a restart.
+
+        No resident block is evicted: when there are more blocks than free buffers, only the
+        hottest, the first ones given, are read. Resident blocks and blocks beyond the end of their
+        file are skipped. The blocks are read sorted by file and block number, each run of
+        consecutive blocks with one vectored read on an I/O thread; pinning a block whose read has
+        not arrived yet waits for it. The replacement policy sees every block as accessed once,
+        the hottest last.
+
+        Args:
+            blocks (List[BlockID]): The blocks to read, hottest first. Their files must exist.
+
+        Returns:
+            int: The number of blocks read.
+        """
+        with self.__condition:
+            chosen: Dict[BlockID, Buffer] = {}
+            lengths: Dict[str, int] = {}
+            for blk in blocks:
+                if len(chosen) == len(self.__free_buffers):
+                    break
+                if blk in chosen or blk in self.__buffer_table:
+                    continue
+                if blk.filename not in lengths:
+                    lengths[blk.filename] = self.__fm.block_num(blk.filename)
+                if blk.number < lengths[blk.filename]:
+                    chosen[blk] = None
+            for blk in chosen:
+                buff = chosen[blk] = self.__free_buffers.pop()
+                buff.assign_ahead(blk)
+                self.__buffer_table[blk] = buff
+            for buff in reversed(chosen.values()):  # Coldest first, so the hottest are evicted last
+                self.__policy.pinned(buff, False)
+                self.__policy.unpinned(buff)
+
+            run_start, frames = None, []
+            for blk in sorted(chosen, key=lambda b: (b.filename, b.number)):
+                if frames and (blk.filename != run_start.filename or blk.number != run_start.number + len(frames)):
+                    self.__start_read(run_start.filename, run_start.number, frames)
+                    frames = []
+                if not frames:
+                    run_start = blk
+                frames.append(chosen[blk])
+            if frames:
+                self.__start_read(run_start.filename, run_start.number, frames)
+            return len(chosen)
 
     def unpin(self, buff: Buffer):
         """
         Unpins a buffer, making it eligible for replacement if no longer pinned.
 
+        Threads waiting for a buffer are woken up when the buffer becomes free.
+
         Args:
             buff (Buffer): The buffer to unpin.
         """
-        # print("Buffer Mgr called unpin")
-        buff.unpin()
-        if not buff.is_pinned:
-            self.__num_available += 1
-            # Move the buffer to the end to mark it as least recently used
-            self.__buffer_pool.move_to_end(buff)
+        with self.__condition:
+            buff.unpin()
+            if not buff.is_pinned:
+                self.__num_available += 1
+                if self.__excess:
+                    self.__policy.removed(buff)
+                    self.__retire(buff)  # A shrink is waiting for this buffer
+                    return
+                if not self.__hold(buff):
+                    self.__policy.unpinned(buff)
+                if self.__waiters:
+                    self.__condition.notify_all()
+
+    def new_ring(self) -> BufferRing:
+        """
+        Creates a buffer ring for a bulk operation, holding BufferRing.DEFAULT_SIZE buffers, but
+        at most an eighth of the pool.
+
+        Returns:
+            BufferRing: The new ring.
+        """
+        return BufferRing(max(1, min(BufferRing.DEFAULT_SIZE, self.buffer_count // 8)))
+
+    def reserve(self, filename: str, frames: int) -> int:
+        """
+        Keeps up to the given number of blocks of a file resident while other blocks are read.
+
+        Reservations together hold at most RESERVED_SHARE of the pool; a reservation is reduced to
+        what the others leave. Lowering a reservation hands the buffers beyond it back to the
+        replacement policy, and 0 cancels it.
+
+        Args:
+            filename (str): The name of the file.
+            frames (int): The number of buffers to reserve.
+
+        Returns:
+            int: The number of buffers reserved.
 
-    def pin(self, blk: BlockID) -> Buffer:
+        Raises:
+            ValueError: If the number of buffers is negative.
+        """
+        if frames < 0:
+            raise ValueError("frames must not be negative.")
+        with self.__condition:
+            others = sum(quota for name, quota in self.__quotas.items() if name != filename)
+            limit = int((len(self.__buffer_pool) - self.__excess) * self.RESERVED_SHARE)
+            frames = max(0, min(frames, limit - others))
+            held = self.__reserved.get(filename, {})
+            while len(held) > frames:
+                buff = next(iter(held))
+                del held[buff]
+                self.__policy.pinned(buff, False)  # The policy sees the block as accessed once
+                self.__policy.unpinned(buff)
+            if frames:
+                self.__quotas[filename] = frames
+            else:
+                self.__quotas.pop(filename, None)
+                self.__reserved.pop(filename, None)
+            return frames
+
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None) -> Buffer:
         """
         Pins a block to a buffer, making it unavailable for replacement.
 
         If the block is not already in a buffer, this method attempts to allocate an available buffer
-        or waits until a buffer becomes available within a maximum time limit.
+        or waits, in arrival order with other waiting threads, until a buffer becomes available
+        within a maximum time limit.
 
         Args:
             blk (BlockID): The block to pin.
+            ring (Optional[BufferRing]): The ring of a bulk operation, whose buffers are reused
+                instead of evicting blocks of the pool.
 
         Returns:
             Buffer: The buffer containing the pinned block.
@@ -98,55 +543,276 @@ class BufferMgr:
         Raises:
             BufferAbortException: If no buffer becomes available within the maximum wait time.
         """
-        start_time = time.time()
-        buff = self.__try_pin(blk)
+        with self.__condition:
+            pinned = self.__try_pin(blk, not self.__waiters, ring)  # Newcomers do not overtake waiting threads
+            if pinned is None:
+                pinned = self.__wait_for_buffer(blk, ring)
+        buff, read = pinned
+        if read is not None:
+            self.__read_block(buff, read)
+        buff.wait_for_read()  # A block read by another thread or read ahead may still be on its way
+        return buff
 
-        while buff is None and not self.__waiting_too_long(start_time):
-            time.sleep(0.1)  # Sleep for a while
-            buff = self.__try_pin(blk)
+    def __read_block(self, buff: Buffer, read: Future):
+        """
+        Reads the block of a buffer just assigned to it by a miss, outside the condition, and
+        completes the read that pins of the block by other threads wait for.
 
-        if buff is None:
-            raise BufferAbortException("Buffer pinning failed: No buffer available within the maximum wait time.")
+        If the read fails, the buffer is unpinned; the next pin of the block reads it again.
 
-        return buff
+        Args:
+            buff (Buffer): The pinned buffer assigned to the block.
+            read (Future): The read attached to the buffer.
 
-    def __waiting_too_long(self, start_time: float) -> bool:
+        Raises:
+            RuntimeError: If the block cannot be read.
+        """
+        try:
+            self.__fm.read(buff.block, buff.contents)
+        except RuntimeError as e:
+            read.set_exception(e)
+            self.unpin(buff)
+            raise
+        read.set_result(1)
+
+    def __wait_for_buffer(self, blk: BlockID, ring: Optional[BufferRing]) -> Tuple[Buffer, Optional[Future]]:
         """
-        Checks if the waiting time for a buffer exceeds the maximum limit.
+        Waits until the block can be pinned, taking a freed buffer only when no thread has waited longer.
+
+        Must be called while holding the condition.
 
         Args:
-            start_time (float): The timestamp when the waiting started.
+            blk (BlockID): The block to pin.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
 
         Returns:
-            bool: True if the waiting time exceeds the limit, False otherwise.
-        """
-        return time.time() - start_time > self.__MAX_TIME
+            Tuple[Buffer, Optional[Future]]: The buffer assigned to the block, and the read the caller
+                must perform if the block was not resident (see `__try_pin`).
 
-    def __try_pin(self, blk: BlockID) -> Optional[Buffer]:
+        Raises:
+            BufferAbortException: If no buffer becomes available within the maximum wait time.
+        """
+        ticket = self.__next_ticket
+        self.__next_ticket += 1
+        self.__waiters.append(ticket)
+        start_time = time.monotonic()
+        deadline = start_time + self.__max_wait
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.__timeouts += 1
+                    raise BufferAbortException(
+                        "Buffer pinning failed: No buffer available within the maximum wait time.")
+                self.__condition.wait(remaining)
+                pinned = self.__try_pin(blk, self.__waiters[0] == ticket, ring)
+                if pinned is not None:
+                    return pinned
+        finally:
+            self.__waiters.remove(ticket)
+            self.__waits += 1
+            self.__wait_time += time.monotonic() - start_time
+            if self.__waiters and self.__num_available > 0:
+                self.__condition.notify_all()  # Let the next waiter take a remaining free buffer
+
+    def __try_pin(self, blk: BlockID, may_replace: bool = True,
+                  ring: Optional[BufferRing] = None) -> Optional[Tuple[Buffer, Optional[Future]]]:
         """
         Tries to pin a block by finding an existing buffer or allocating a new one.
 
+        A block that is not resident is not read here, so that the condition is not held during
+        the read: the buffer is assigned to the block with a pending read, which the caller performs
+        after releasing the condition, and which pins of the block by other threads wait for. Only
+        a dirty victim's log records are still flushed here, before its contents are handed to the
+        file manager to be written on an I/O thread; `write_ahead` makes this rare.
+
         Args:
             blk (BlockID): The block to pin.
+            may_replace (bool): Whether an unpinned buffer may be reassigned if the block is not resident.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
 
         Returns:
-            Buffer | None: The buffer containing the pinned block, or None if no buffer is available.
+            Tuple[Buffer, Optional[Future]] | None: The pinned buffer and the read the caller must
+                perform (None if the block was resident), or None if no buffer is available.
         """
+        read = None
         buff = self.__find_existing_buffer(blk)
-        if buff is None:
-            buff = self.__choose_unpinned_buffer()
-            if buff is None:
-                print("Try pin failed")
-                return None  # No buffer available
-            buff.assign_to_block(blk)  # Assign the block to the chosen buffer
+        hit = buff is not None
+        if not hit:
+            if not may_replace:
+                return None  # Waiting for an older waiter to be served
+            buff = self.__ring_buffer(ring)
+            if buff is not None:
+                self.__untrack(buff)  # The ring evicts its own block
+            else:
+                buff = self.__choose_unpinned_buffer(blk)
+                if buff is None:
+                    return None  # No buffer available
+            if buff.block is not None:
+                del self.__buffer_table[buff.block]
+            if buff.is_modified:
+                self.__dirty_evictions += 1
+            buff.assign_ahead(blk)  # Assign the block to the chosen buffer, to be read by the caller
+            read = Future()
+            buff.set_pending_read(read, 0)
+            self.__buffer_table[blk] = buff
+            if ring is not None:
+                ring.put(buff)
+            self.__misses += 1
+            read_ahead = ring.read_ahead if ring is not None else self.__read_aheads.get(blk.filename)
+            if read_ahead is None:
+                read_ahead = self.__read_aheads[blk.filename] = ReadAhead()
+        else:
+            self.__hits += 1
+            read_ahead = self.__prefetched.pop(buff, None) if self.__prefetched else None
+            if read_ahead is not None:
+                self.__prefetch_hits += 1
+                hit = False  # The policy learns about a block read ahead when it is first pinned
+            elif self.__reserved:
+                self.__release(buff)  # The policy learns about a block held for a reservation as a hit
 
         if not buff.is_pinned:
             self.__num_available -= 1
         buff.pin()
-        # Move the buffer to the front to mark it as recently used
-        self.__buffer_pool.move_to_end(buff, last=False)
+        self.__policy.pinned(buff, hit)
+        if read_ahead is not None and not self.__waiters:  # Buffers are not taken from waiting threads
+            self.__read_ahead(blk, read_ahead, ring)
+        return buff, read
+
+    def __read_ahead(self, blk: BlockID, read_ahead: ReadAhead, ring: Optional[BufferRing]):
+        """
+        Reports an access to the read-ahead state of its reader and reads ahead the blocks it asks for.
+
+        Resident blocks are skipped; each run of other blocks is read with one vectored read. Reading
+        ahead stops early at the end of the file or when no buffer can be taken.
+
+        Args:
+            blk (BlockID): The block just read or pinned for the first time after being read ahead.
+            read_ahead (ReadAhead): The read-ahead state of the reader.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
+        """
+        max_window = min(self.__max_read_ahead, len(self.__buffer_pool) // 8)
+        if ring is not None:
+            max_window = min(max_window, ring.size - 1)  # The slot of the pinned block is not reusable
+        first, count = read_ahead.access(blk.number, max_window, ring is not None)
+        if count == 0:
+            return
+        end = min(first + count, self.__fm.block_num(blk.filename))
+        if self.__stripe:
+            end = min(end, (blk.number // self.__stripe + 1) * self.__stripe)
+        run_start, frames = first, []
+        for blk_num in range(first, end):
+            ahead = BlockID(blk.filename, blk_num)
+            if ahead in self.__buffer_table:
+                self.__start_read(blk.filename, run_start, frames)
+                run_start, frames = blk_num + 1, []
+                continue
+            frame = self.__read_ahead_frame(ahead, ring)
+            if frame is None:
+                end = blk_num
+                break
+            if frame.block is not None:
+                del self.__buffer_table[frame.block]
+            if frame.is_modified:
+                self.__dirty_evictions += 1
+            frame.assign_ahead(ahead)
+            self.__buffer_table[ahead] = frame
+            self.__prefetched[frame] = read_ahead
+            self.__prefetches += 1
+            if ring is not None:
+                ring.put(frame)
+            frames.append(frame)
+        self.__start_read(blk.filename, run_start, frames)
+        if end < first + count:
+            read_ahead.cut(end)
+
+    def __read_ahead_frame(self, blk: BlockID, ring: Optional[BufferRing]) -> Optional[Buffer]:
+        """
+        Takes a buffer to read a block ahead into: the ring's, an empty one, the oldest buffer read
+        ahead if a quarter of the pool already holds unused blocks read ahead, or the policy's victim.
+
+        Args:
+            blk (BlockID): The block about to be read ahead.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
+
+        Returns:
+            Buffer | None: An unpinned buffer no longer tracked by the policy, or None if there is none.
+        """
+        buff = self.__ring_buffer(ring)
+        if buff is not None:
+            self.__untrack(buff)
+        elif self.__free_buffers:
+            buff = self.__free_buffers.pop()
+        elif len(self.__prefetched) >= len(self.__buffer_pool) // 4:
+            buff, read_ahead = self.__prefetched.popitem(last=False)
+            read_ahead.wasted()
+        else:
+            buff = self.__policy.choose_victim(blk)
+            if buff is not None:
+                self.__policy.removed(buff)  # Some policies keep tracking a victim until it is pinned again
         return buff
 
+    def __start_read(self, filename: str, first: int, frames: List[Buffer]):
+        """
+        Reads a run of consecutive blocks, on an I/O thread, into the buffers assigned to them.
+
+        Args:
+            filename (str): The name of the file.
+            first (int): The number of the first block of the run.
+            frames (List[Buffer]): The buffers assigned to the blocks of the run, in block order.
+        """
+        if not frames:
+            return
+        read = self.__fm.read_range_async(filename, first, len(frames), [buff.contents for buff in frames])
+        for i, buff in enumerate(frames):
+            buff.set_pending_read(read, i)
+
+    def __retire(self, buff: Buffer):
+        """
+        Removes an unpinned buffer, no longer tracked by the policy, from the pool for a shrink,
+        writing its modifications back.
+
+        Args:
+            buff (Buffer): The buffer to remove.
+        """
+        if buff.block is not None:
+            del self.__buffer_table[buff.block]
+            buff.write_back()
+        self.__buffer_pool.remove(buff)
+        self.__num_available -= 1
+        self.__excess -= 1
+
+    def __ring_buffer(self, ring: Optional[BufferRing]) -> Optional[Buffer]:
+        """
+        Returns the buffer the ring may reuse, if it belongs to this pool. A ring shared by the
+        partitions of a `PartitionedBufferMgr` also holds buffers of the other partitions.
+
+        Args:
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
+
+        Returns:
+            Buffer | None: The ring's reusable buffer, or None.
+        """
+        buff = ring.reusable() if ring is not None else None
+        if buff is not None and self.__buffer_table.get(buff.block) is not buff:
+            return None
+        return buff
+
+    def __untrack(self, buff: Buffer):
+        """
+        Stops tracking an unpinned buffer whose block is about to be dropped. A block read ahead
+        and never pinned counts as wasted; any other block is removed from the policy, unless it
+        is held for a reservation.
+
+        Args:
+            buff (Buffer): The buffer.
+        """
+        read_ahead = self.__prefetched.pop(buff, None)
+        if read_ahead is not None:
+            read_ahead.wasted()
+        elif not self.__release(buff):
+            self.__policy.removed(buff)
+
     def __find_existing_buffer(self, blk: BlockID) -> Optional[Buffer]:
         """
         Finds a buffer that already contains the specified block.
@@ -157,23 +823,98 @@ class BufferMgr:
         Returns:
             Buffer | None: The buffer containing the block, or None if not found.
         """
-        for buff in self.__buffer_pool:
-            if buff.block == blk:
-                # Move the accessed buffer to the front to mark it as recently used
-                self.__buffer_pool.move_to_end(buff, last=False)
-                return buff
-        return None
+        return self.__buffer_table.get(blk)
 
-    def __choose_unpinned_buffer(self) -> Optional[Buffer]:
+    def __choose_unpinned_buffer(self, blk: BlockID) -> Optional[Buffer]:
         """
-        Selects an unpinned buffer for replacement using the LRU strategy.
+        Selects a buffer for the block: an empty one if any, otherwise the replacement policy's victim,
+        or as a last resort the oldest buffer holding a block read ahead that was never pinned, and
+        then a buffer held for a reservation.
+
+        Args:
+            blk (BlockID): The block about to be read.
 
         Returns:
             Buffer | None: An unpinned buffer, or None if no unpinned buffer is available.
         """
-        # Find the least recently used buffer (the one at the end of the OrderedDict)
-        for buff in self.__buffer_pool:
-            if not buff.is_pinned:
-                self.__buffer_pool.move_to_end(buff, last=False)  # Move it to the front after being used
+        if self.__free_buffers:
+            return self.__free_buffers.pop()
+        victim = self.__policy.choose_victim(blk)
+        if victim is None and self.__prefetched:  # Only buffers read ahead are left
+            victim, read_ahead = self.__prefetched.popitem(last=False)
+            read_ahead.wasted()
+        if victim is None and self.__reserved:  # Only buffers held for reservations are left
+            victim = self.__evict_reserved()
+        return victim
+
+    def __hold(self, buff: Buffer) -> bool:
+        """
+        Holds a buffer just unpinned out of the policy if its file has a reservation that is not full.
+
+        Args:
+            buff (Buffer): The unpinned buffer, tracked by the policy.
+
+        Returns:
+            bool: True if the buffer is now held for the reservation.
+        """
+        quota = self.__quotas.get(buff.block.filename)
+        if quota is None:
+            return False
+        held = self.__reserved.setdefault(buff.block.filename, {})
+        if len(held) >= quota:
+            return False
+        self.__policy.removed(buff)
+        held[buff] = None
+        return True
+
+    def __release(self, buff: Buffer) -> bool:
+        """
+        Stops holding a buffer for its file's reservation, e.g. because it is pinned again.
+
+        Args:
+            buff (Buffer): A buffer holding a block.
+
+        Returns:
+            bool: True if the buffer was held, in which case the policy does not track it.
+        """
+        held = self.__reserved.get(buff.block.filename)
+        if held is None or buff not in held:
+            return False
+        del held[buff]
+        return True
+
+    def __evict_reserved(self) -> Optional[Buffer]:
+        """
+        Takes the buffer held the longest for the reservation of some file.
+
+        Returns:
+            Buffer | None: An unpinned buffer no longer held, or None if no buffer is held.
+        """
+        for held in self.__reserved.values():
+            if held:
+                buff = next(iter(held))
+                del held[buff]
                 return buff
         return None
+
+    @staticmethod
+    def __create_policy(strategy: ReplacementStrategy, num_buffs: int) -> ReplacementPolicy:
+        """
+        Creates the replacement policy for the given strategy.
+
+        Args:
+            strategy (ReplacementStrategy): The replacement strategy.
+            num_buffs (int): The number of buffers in the pool.
+
+        Returns:
+            ReplacementPolicy: The policy.
+        """
+        if strategy == ReplacementStrategy.CLOCK:
+            return ClockPolicy()
+        if strategy == ReplacementStrategy.LRU_K:
+            return LRUKPolicy()
+        if strategy == ReplacementStrategy.TWO_Q:
+            return TwoQPolicy(num_buffs)
+        if strategy == ReplacementStrategy.ARC:
+            return ARCPolicy(num_buffs)
+        return LRUPolicy()
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 05:10
+# @Author  : EvanWong
+# @File    : BufferPool.py
+# @Project : TestDB
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from buffer.Buffer import Buffer
+from buffer.BufferRing import BufferRing
+from file.BlockID import BlockID
+
+
+class BufferPool(ABC):
+    """
+    Abstract base class for the buffer managers transactions pin blocks through: a single pool
+    (`BufferMgr`), a pool split into independently latched partitions (`PartitionedBufferMgr`)
+    and a pool in shared memory (`SharedBufferMgr`).
+
+    Besides pinning, a buffer pool writes back the buffers of committing transactions, reports
+    its statistics, and saves its resident blocks on shutdown so that a restarted engine can read
+    them back with `prewarm`. Pools that do not support an operation, such as resizing, say so in
+    their implementation of it.
+    """
+
+    DEFAULT_MAX_WAIT = 10.0  # Default maximum wait time for buffer pinning (seconds)
+
+    @property
+    @abstractmethod
+    def available(self) -> int:
+        """
+        Returns the number of available (unpinned) buffers.
+
+        Returns:
+            int: The number of available buffers.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def buffer_count(self) -> int:
+        """
+        Returns the total number of buffers.
+
+        Returns:
+            int: The number of buffers.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def waits(self) -> int:
+        """
+        Returns the number of pins that had to wait for a buffer, including those that timed out.
+
+        Returns:
+            int: The number of waits.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def timeouts(self) -> int:
+        """
+        Returns the number of pins that gave up waiting and raised BufferAbortException.
+
+        Returns:
+            int: The number of timeouts.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def wait_time(self) -> float:
+        """
+        Returns the total time spent waiting for buffers.
+
+        Returns:
+            float: The wait time in seconds, summed over all waiting pins.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def hits(self) -> int:
+        """
+        Returns the number of pins that found their block in a buffer.
+
+        Returns:
+            int: The number of hits.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def misses(self) -> int:
+        """
+        Returns the number of pins that had to read their block from disk.
+
+        Returns:
+            int: The number of misses.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def dirty_evictions(self) -> int:
+        """
+        Returns the number of pins that found their victim dirty and had to write it back.
+
+        Returns:
+            int: The number of dirty evictions.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def prefetches(self) -> int:
+        """
+        Returns the number of blocks read ahead of sequential readers.
+
+        Returns:
+            int: The number of blocks read ahead.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def prefetch_hits(self) -> int:
+        """
+        Returns the number of blocks read ahead that were pinned before being evicted.
+
+        Returns:
+            int: The number of blocks read ahead and used.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def dirty_count(self) -> int:
+        """
+        Returns the number of buffers holding modifications that were not written back.
+
+        Returns:
+            int: The number of dirty buffers.
+        """
+        pass
+
+    @abstractmethod
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None) -> Buffer:
+        """
+        Pins a block to a buffer, reading it if it is not resident and waiting for a buffer if
+        all of them are pinned.
+
+        Args:
+            blk (BlockID): The block to pin.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
+
+        Returns:
+            Buffer: The buffer containing the pinned block.
+
+        Raises:
+            BufferAbortException: If no buffer becomes available within the maximum wait time.
+        """
+        pass
+
+    @abstractmethod
+    def unpin(self, buff: Buffer):
+        """
+        Unpins a buffer, making it eligible for replacement if no longer pinned.
+
+        Args:
+            buff (Buffer): The buffer to unpin.
+        """
+        pass
+
+    @abstractmethod
+    def flush_all(self, tx_num: int):
+        """
+        Writes back all buffers modified by a transaction, after flushing the log up to their modifications.
+
+        Args:
+            tx_num (int): The transaction ID whose buffers should be flushed.
+        """
+        pass
+
+    @abstractmethod
+    def write_ahead(self, max_pages: int, scan_depth: int) -> int:
+        """
+        Writes back dirty, unpinned buffers that would be evicted soon.
+
+        Args:
+            max_pages (int): The maximum number of buffers to write.
+            scan_depth (int): The number of buffers to examine, those closest to eviction.
+
+        Returns:
+            int: The number of buffers written.
+        """
+        pass
+
+    @abstractmethod
+    def discard_file(self, filename: str):
+        """
+        Detaches every buffer holding a block of the given file, dropping unwritten modifications.
+        The blocks of the file must not be pinned.
+
+        Args:
+            filename (str): The name of the file.
+        """
+        pass
+
+    @abstractmethod
+    def resize(self, num_buffs: int):
+        """
+        Grows or shrinks the pool while it is in use.
+
+        Args:
+            num_buffs (int): The new number of buffers.
+
+        Raises:
+            ValueError: If the pool cannot have that many buffers.
+        """
+        pass
+
+    @abstractmethod
+    def new_ring(self) -> BufferRing:
+        """
+        Creates a buffer ring for a bulk operation.
+
+        Returns:
+            BufferRing: The new ring.
+        """
+        pass
+
+    @abstractmethod
+    def reserve(self, filename: str, frames: int) -> int:
+        """
+        Keeps up to the given number of blocks of a file resident while other blocks are read.
+
+        Args:
+            filename (str): The name of the file.
+            frames (int): The number of buffers to reserve; 0 cancels the reservation.
+
+        Returns:
+            int: The number of buffers reserved.
+
+        Raises:
+            ValueError: If the number of buffers is negative.
+        """
+        pass
+
+    @abstractmethod
+    def resident_blocks(self) -> List[BlockID]:
+        """
+        Returns the blocks of permanent files held by the pool, hottest first.
+
+        Returns:
+            List[BlockID]: The resident blocks, hottest first.
+        """
+        pass
+
+    @abstractmethod
+    def prewarm(self, blocks: List[BlockID]) -> int:
+        """
+        Reads blocks into the free buffers without evicting resident blocks, e.g. the blocks that
+        were resident before a restart. Resident blocks and blocks beyond the end of their file are skipped.
+
+        Args:
+            blocks (List[BlockID]): The blocks to read, hottest first. Their files must exist.
+
+        Returns:
+            int: The number of blocks read.
+        """
+        pass
+
+    def save_resident(self, path: str):
+        """
+        Writes the resident blocks, hottest first, to a file that `load_resident` reads back.
+
+        The file is replaced atomically, one block per line as the file name and block number
+        separated by a tab.
+
+        Args:
+            path (str): The file to write.
+        """
+        temp = path + '.tmp'
+        with open(temp, 'w') as f:
+            f.writelines(f"{blk.filename}\t{blk.number}\n" for blk in self.resident_blocks())
+        os.replace(temp, path)
+
+    @staticmethod
+    def load_resident(path: str) -> List[BlockID]:
+        """
+        Reads the blocks saved by `save_resident`. A missing or damaged file yields no blocks, as
+        the list is only a hint.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            List[BlockID]: The saved blocks, hottest first.
+        """
+        try:
+            with open(path) as f:
+                return [BlockID(filename, int(number)) for filename, number in
+                        (line.rstrip('\n').rsplit('\t', 1) for line in f)]
+        except (OSError, ValueError):
+            return []
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 21:48
+# @Author  : EvanWong
+# @File    : BufferRing.py
+# @Project : TestDB
+
+from typing import List, Optional
+
+from buffer.Buffer import Buffer
+from buffer.ReadAhead import ReadAhead
+from file.BlockID import BlockID
+
+
+class BufferRing:
+    """
+    A small circle of buffers reused by a bulk operation, such as a large sequential scan, so that
+    the blocks it reads once do not evict the working set of the rest of the system.
+
+    When a block pinned through the ring is not resident, the buffer manager reads it into the
+    buffer in the ring's current slot, provided that buffer is unpinned and still holds the block
+    the ring read into it. Otherwise, e.g. while the ring is filling up or after another
+    transaction pinned or took over the buffer, a buffer is taken from the pool as usual and
+    replaces the slot's buffer. Either way the ring then moves on to its next slot. Pins of
+    resident blocks are not affected.
+
+    A ring also serves as a hint that its scan reads the file sequentially: the buffer manager
+    reads blocks ahead of it from its first miss on, into the ring's buffers, with a read-ahead
+    state of its own.
+
+    Rings are created by `BufferMgr.new_ring` and used by a single scan; the buffer manager
+    only touches them while holding its lock.
+
+    Attributes:
+        __buffers (List[Optional[Buffer]]): The buffer of every slot.
+        __blocks (List[Optional[BlockID]]): The block the ring read into the buffer of every slot.
+        __current (int): The slot used by the next miss.
+        __read_ahead (ReadAhead): The read-ahead state of the scan; a ring declares its scan sequential.
+    """
+
+    DEFAULT_SIZE = 16  # Default number of buffers in a ring
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        """
+        Initializes an empty ring.
+
+        Args:
+            size (int): The number of buffers the ring cycles through.
+        """
+        self.__buffers: List[Optional[Buffer]] = [None] * size
+        self.__blocks: List[Optional[BlockID]] = [None] * size
+        self.__current: int = 0
+        self.__read_ahead: ReadAhead = ReadAhead()
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of buffers the ring cycles through.
+
+        Returns:
+            int: The size of the ring.
+        """
+        return len(self.__buffers)
+
+    @property
+    def read_ahead(self) -> ReadAhead:
+        """
+        Returns the read-ahead state of the scan using the ring.
+
+        Returns:
+            ReadAhead: The state, kept per ring so that concurrent scans of a file do not disturb each other.
+        """
+        return self.__read_ahead
+
+    def reusable(self) -> Optional[Buffer]:
+        """
+        Returns the buffer of the current slot if the ring may reuse it.
+
+        Returns:
+            Optional[Buffer]: The buffer, if it is unpinned and still holds the block the ring read into it.
+        """
+        buff = self.__buffers[self.__current]
+        if buff is None or buff.is_pinned or buff.block != self.__blocks[self.__current]:
+            return None
+        return buff
+
+    def put(self, buff: Buffer):
+        """
+        Records that the buffer received a block for the ring, and moves on to the next slot.
+
+        Args:
+            buff (Buffer): The buffer, which holds its new block.
+        """
+        self.__buffers[self.__current] = buff
+        self.__blocks[self.__current] = buff.block
+        self.__current = (self.__current + 1) % len(self.__buffers)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 22:31
+# @Author  : EvanWong
+# @File    : BufferWriter.py
+# @Project : TestDB
+
+import threading
+from typing import Optional
+
+from buffer.BufferPool import BufferPool
+
+
+class BufferWriter:
+    """
+    A background thread that writes dirty buffers back before they are chosen for eviction.
+
+    Every `interval` seconds the writer looks at the share of dirty buffers in the pool. At or
+    below `dirty_ratio` it does nothing. Above it, the writer examines the buffers closest to
+    eviction, a quarter of the pool or, if more, LOOKAHEAD times the number of blocks read since
+    the previous round, and writes at most `max_pages` of the dirty, unpinned ones among them,
+    which bounds the I/O rate to `max_pages` blocks per interval. Above `flush_ratio`, e.g. during a
+    bulk load, it examines the whole pool and writes as many dirty buffers as it finds. Pins
+    that need a buffer then find clean victims and read their block without writing first.
+
+    Attributes:
+        __bm (BufferPool): The buffer manager whose buffers are written.
+        __interval (float): The time, in seconds, between two rounds.
+        __max_pages (int): The maximum number of buffers written per round below the flush ratio.
+        __dirty_ratio (float): The share of dirty buffers above which the writer starts writing.
+        __flush_ratio (float): The share of dirty buffers above which the page limit is lifted.
+        __stop_requested (threading.Event): Set to stop the thread.
+        __thread (Optional[threading.Thread]): The writer thread, while it runs.
+        __rounds (int): The number of rounds that wrote buffers.
+        __pages_written (int): The number of buffers written.
+        __last_reads (int): The number of blocks the buffer manager had read, on a miss or ahead, at the previous round.
+    """
+
+    LOOKAHEAD = 2.0  # Buffers examined per block read during the previous interval
+
+    DEFAULT_INTERVAL = 0.2  # Default time between two rounds (seconds)
+    DEFAULT_MAX_PAGES = 100  # Default number of buffers written per round
+    DEFAULT_DIRTY_RATIO = 0.1  # Default share of dirty buffers tolerated without writing
+    DEFAULT_FLUSH_RATIO = 0.5  # Default share of dirty buffers above which every dirty buffer is written
+
+    def __init__(self, bm: BufferPool, interval: float = DEFAULT_INTERVAL, max_pages: int = DEFAULT_MAX_PAGES,
+                 dirty_ratio: float = DEFAULT_DIRTY_RATIO, flush_ratio: float = DEFAULT_FLUSH_RATIO):
+        """
+        Initializes a writer; it does not run before `start` is called.
+
+        Args:
+            bm (BufferPool): The buffer manager whose buffers are written.
+            interval (float): The time, in seconds, between two rounds.
+            max_pages (int): The maximum number of buffers written per round below the flush ratio.
+            dirty_ratio (float): The share of dirty buffers above which the writer starts writing.
+            flush_ratio (float): The share of dirty buffers above which the page limit is lifted.
+
+        Raises:
+            ValueError: If the interval or page limit is not positive or the ratios are not
+                ordered between 0 and 1.
+        """
+        if interval <= 0 or max_pages < 1:
+            raise ValueError("the writer interval and page limit must be positive.")
+        if not 0 <= dirty_ratio <= flush_ratio <= 1:
+            raise ValueError("the dirty ratios must satisfy 0 <= dirty_ratio <= flush_ratio <= 1.")
+        self.__bm: BufferPool = bm
+        self.__interval: float = interval
+        self.__max_pages: int = max_pages
+        self.__dirty_ratio: float = dirty_ratio
+        self.__flush_ratio: float = flush_ratio
+        self.__stop_requested: threading.Event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__rounds: int = 0
+        self.__pages_written: int = 0
+        self.__last_reads: int = bm.misses + bm.prefetches
+
+    def start(self):
+        """
+        Starts the writer thread, unless it is running already.
+        """
+        if self.__thread is None:
+            self.__stop_requested.clear()
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def stop(self):
+        """
+        Stops the writer thread and waits for its current round to finish.
+        """
+        if self.__thread is not None:
+            self.__stop_requested.set()
+            self.__thread.join()
+            self.__thread = None
+
+    def write_round(self) -> int:
+        """
+        Performs one round: writes dirty buffers if the dirty share of the pool calls for it.
+
+        Returns:
+            int: The number of buffers written.
+        """
+        buffers = self.__bm.buffer_count
+        total = self.__bm.misses + self.__bm.prefetches  # Every block read took a buffer
+        reads, self.__last_reads = total - self.__last_reads, total
+        ratio = self.__bm.dirty_count / buffers
+        if ratio <= self.__dirty_ratio:
+            return 0
+        if ratio > self.__flush_ratio:
+            written = self.__bm.write_ahead(buffers, buffers)
+        else:
+            depth = max(self.__max_pages, buffers // 4, int(reads * self.LOOKAHEAD))
+            written = self.__bm.write_ahead(self.__max_pages, depth)
+        if written:
+            self.__rounds += 1
+            self.__pages_written += written
+        return written
+
+    @property
+    def rounds(self) -> int:
+        """
+        Returns the number of rounds that wrote at least one buffer.
+
+        Returns:
+            int: The number of rounds.
+        """
+        return self.__rounds
+
+    @property
+    def pages_written(self) -> int:
+        """
+        Returns the number of buffers written by the writer.
+
+        Returns:
+            int: The number of buffers written.
+        """
+        return self.__pages_written
+
+    def __run(self):
+        """
+        The body of the writer thread: a round every interval until stopped.
+        """
+        while not self.__stop_requested.wait(self.__interval):
+            self.write_round()
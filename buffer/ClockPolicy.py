@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:18
+# @Author  : EvanWong
+# @File    : ClockPolicy.py
+# @Project : TestDB
+
+from typing import Dict, Iterator, List, Optional
+
+from buffer.Buffer import Buffer
+from buffer.ReplacementPolicy import ReplacementPolicy
+from file.BlockID import BlockID
+
+
+class ClockPolicy(ReplacementPolicy):
+    """
+    Clock (second chance) replacement, an approximation of LRU that keeps no ordering.
+
+    The buffers form a circle with a reference bit each, set on every pin. To choose a victim,
+    a hand sweeps the circle: a pinned buffer is skipped, a referenced one loses its bit and is
+    skipped, and the first unpinned, unreferenced buffer is the victim. Every buffer is passed at
+    most twice, so a sweep ends even if all buffers are pinned.
+
+    Attributes:
+        __buffers (List[Buffer]): The buffers holding a block, in clock order.
+        __positions (Dict[Buffer, int]): The position of every buffer in the circle.
+        __referenced (List[bool]): The reference bit of every position.
+        __hand (int): The position the next sweep starts at.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty clock.
+        """
+        self.__buffers: List[Buffer] = []
+        self.__positions: Dict[Buffer, int] = {}
+        self.__referenced: List[bool] = []
+        self.__hand: int = 0
+
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Sets the buffer's reference bit, adding it to the circle if it just received its block.
+
+        Args:
+            buff (Buffer): The pinned buffer.
+            hit (bool): Whether the block was resident.
+        """
+        position = self.__positions.get(buff)
+        if position is None:
+            self.__positions[buff] = len(self.__buffers)
+            self.__buffers.append(buff)
+            self.__referenced.append(True)
+        else:
+            self.__referenced[position] = True
+
+    def unpinned(self, buff: Buffer):
+        """
+        Does nothing: the sweep checks the pin count itself.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        pass
+
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Sweeps the clock for an unpinned buffer whose reference bit is clear.
+
+        The victim keeps its position; the bit is set again when the new block is pinned.
+
+        Args:
+            blk (BlockID): The block about to be read; not used by CLOCK.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        for _ in range(2 * len(self.__buffers)):
+            position = self.__hand
+            self.__hand = (self.__hand + 1) % len(self.__buffers)
+            buff = self.__buffers[position]
+            if buff.is_pinned:
+                continue
+            if self.__referenced[position]:
+                self.__referenced[position] = False  # Second chance
+                continue
+            return buff
+        return None
+
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the buffers in the order the hand will pass them.
+
+        Returns:
+            Iterator[Buffer]: The buffers, starting at the hand.
+        """
+        count = len(self.__buffers)
+        for i in range(count):
+            yield self.__buffers[(self.__hand + i) % count]
+
+    def removed(self, buff: Buffer):
+        """
+        Takes the buffer out of the circle by moving the last buffer into its position.
+
+        Args:
+            buff (Buffer): The emptied buffer.
+        """
+        position = self.__positions.pop(buff, None)
+        if position is None:
+            return
+        last = self.__buffers.pop()
+        referenced = self.__referenced.pop()
+        if last is not buff:
+            self.__buffers[position] = last
+            self.__referenced[position] = referenced
+            self.__positions[last] = position
+        if self.__hand >= len(self.__buffers):
+            self.__hand = 0
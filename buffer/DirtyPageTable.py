@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 23:05
+# @Author  : EvanWong
+# @File    : DirtyPageTable.py
+# @Project : TestDB
+
+import threading
+from typing import TYPE_CHECKING, Dict, List, Set
+
+if TYPE_CHECKING:
+    from buffer.Buffer import Buffer  # Buffer reports to the table, so it cannot be imported at runtime
+
+
+class DirtyPageTable:
+    """
+    Tracks the dirty buffers of the pool, grouped by the transaction that last modified them.
+
+    Buffers report themselves when a transaction modifies them and when their contents are
+    written back or dropped, so committing a transaction only looks at the buffers it dirtied
+    instead of the whole pool. Buffers are modified by transaction threads without holding the
+    buffer manager's lock, so the table has a lock of its own.
+
+    Attributes:
+        __by_tx (Dict[int, Set[Buffer]]): The dirty buffers of every transaction.
+        __owner (Dict[Buffer, int]): The transaction that last modified every dirty buffer.
+        __lock (threading.Lock): Guards both dictionaries.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty table.
+        """
+        self.__by_tx: Dict[int, Set['Buffer']] = {}
+        self.__owner: Dict['Buffer', int] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def mark(self, buff: 'Buffer', tx_num: int):
+        """
+        Records that a transaction modified a buffer, moving it from the transaction that
+        modified it before, if any.
+
+        Args:
+            buff (Buffer): The modified buffer.
+            tx_num (int): The ID of the modifying transaction.
+        """
+        with self.__lock:
+            previous = self.__owner.get(buff)
+            if previous == tx_num:
+                return
+            if previous is not None:
+                self.__discard(buff, previous)
+            self.__owner[buff] = tx_num
+            self.__by_tx.setdefault(tx_num, set()).add(buff)
+
+    def clear(self, buff: 'Buffer'):
+        """
+        Records that a buffer is clean again, because it was written back or its contents dropped.
+
+        Args:
+            buff (Buffer): The buffer.
+        """
+        with self.__lock:
+            tx_num = self.__owner.pop(buff, None)
+            if tx_num is not None:
+                self.__discard(buff, tx_num)
+
+    def buffers(self, tx_num: int) -> List['Buffer']:
+        """
+        Returns the buffers a transaction dirtied that were not written back yet.
+
+        Args:
+            tx_num (int): The ID of the transaction.
+
+        Returns:
+            List[Buffer]: A snapshot of the transaction's dirty buffers, in no particular order.
+        """
+        with self.__lock:
+            return list(self.__by_tx.get(tx_num, ()))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of dirty buffers.
+
+        Returns:
+            int: The number of dirty buffers of all transactions.
+        """
+        return len(self.__owner)
+
+    def __discard(self, buff: 'Buffer', tx_num: int):
+        """
+        Removes a buffer from the set of a transaction, dropping the set once it is empty.
+
+        Args:
+            buff (Buffer): The buffer.
+            tx_num (int): The ID of the transaction.
+        """
+        buffers = self.__by_tx[tx_num]
+        buffers.discard(buff)
+        if not buffers:
+            del self.__by_tx[tx_num]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:26
+# @Author  : EvanWong
+# @File    : LRUKPolicy.py
+# @Project : TestDB
+
+import heapq
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from buffer.Buffer import Buffer
+from buffer.ReplacementPolicy import ReplacementPolicy
+from file.BlockID import BlockID
+
+
+class LRUKPolicy(ReplacementPolicy):
+    """
+    LRU-K replacement: the victim is the buffer whose block's K-th most recent access lies
+    furthest back (O'Neil, O'Neil and Weikum, 1993).
+
+    Blocks accessed fewer than K times have an infinite backward K-distance and are evicted
+    first, least recently used first, so a scan touching many blocks once cannot push out blocks
+    that are used repeatedly. Access times are counted in pins. The access history of evicted
+    blocks is retained for up to HISTORY_FACTOR times the number of resident blocks, so a block
+    read again soon after its eviction is recognised as frequently used.
+
+    The unpinned buffers sit in a heap ordered by their eviction priority, which cannot change
+    while a buffer is unpinned. Entries of buffers that were pinned again are left in the heap
+    and skipped when they surface.
+
+    Attributes:
+        __k (int): The number of accesses remembered per block.
+        __time (int): The number of accesses so far, the clock of the access history.
+        __history (OrderedDict[BlockID, List[int]]): The times of the last K accesses of every
+            remembered block, most recent last; blocks are kept least recently accessed first.
+        __resident (Set[Buffer]): The buffers holding a block, pinned or not; they bound the history.
+        __heap (List[Tuple[int, int, int, Buffer]]): The candidates as (K-th last access, last
+            access, sequence number, buffer); an unknown K-th access counts as -1.
+        __entries (Dict[Buffer, int]): The sequence number of the valid heap entry of every unpinned buffer.
+        __sequence (int): The sequence number of the next heap entry.
+    """
+
+    HISTORY_FACTOR = 2  # Blocks of access history retained per resident block
+
+    def __init__(self, k: int = 2):
+        """
+        Initializes an empty policy.
+
+        Args:
+            k (int): The number of accesses remembered per block.
+        """
+        self.__k: int = k
+        self.__time: int = 0
+        self.__history: OrderedDict[BlockID, List[int]] = OrderedDict()
+        self.__resident: Set[Buffer] = set()
+        self.__heap: List[Tuple[int, int, int, Buffer]] = []
+        self.__entries: Dict[Buffer, int] = {}
+        self.__sequence: int = 0
+
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Records the access in the block's history and withdraws the buffer from the candidates.
+
+        Args:
+            buff (Buffer): The pinned buffer.
+            hit (bool): Whether the block was resident; not used, as the resident buffers are tracked.
+        """
+        self.__resident.add(buff)
+        self.__entries.pop(buff, None)
+        self.__time += 1
+        history = self.__history.get(buff.block)
+        if history is None:
+            history = self.__history[buff.block] = []
+            while len(self.__history) > max(len(self.__resident), 1) * self.HISTORY_FACTOR:
+                self.__history.popitem(last=False)
+        else:
+            self.__history.move_to_end(buff.block)
+        history.append(self.__time)
+        if len(history) > self.__k:
+            del history[0]
+
+    def unpinned(self, buff: Buffer):
+        """
+        Adds the buffer to the candidates with the priority given by its block's history.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        history = self.__history.get(buff.block, [])
+        kth = history[0] if len(history) == self.__k else -1
+        last = history[-1] if history else -1
+        self.__sequence += 1
+        self.__entries[buff] = self.__sequence
+        heapq.heappush(self.__heap, (kth, last, self.__sequence, buff))
+        if len(self.__heap) > 2 * len(self.__entries) + 64:
+            self.__heap = [e for e in self.__heap if self.__entries.get(e[3]) == e[2]]
+            heapq.heapify(self.__heap)
+
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Returns the unpinned buffer with the largest backward K-distance.
+
+        Args:
+            blk (BlockID): The block about to be read; not used by LRU-K.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        while self.__heap:
+            _, _, sequence, buff = heapq.heappop(self.__heap)
+            if self.__entries.get(buff) == sequence:
+                del self.__entries[buff]
+                self.__resident.discard(buff)
+                return buff
+        return None
+
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the unpinned buffers, largest backward K-distance first.
+
+        Returns:
+            Iterator[Buffer]: The buffers in eviction order.
+        """
+        return (buff for _, _, sequence, buff in sorted(self.__heap) if self.__entries.get(buff) == sequence)
+
+    def removed(self, buff: Buffer):
+        """
+        Forgets the buffer, whether or not it was handed to `unpinned`; the history of its block is kept.
+
+        Args:
+            buff (Buffer): The emptied buffer.
+        """
+        self.__entries.pop(buff, None)
+        self.__resident.discard(buff)
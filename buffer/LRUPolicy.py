@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:12
+# @Author  : EvanWong
+# @File    : LRUPolicy.py
+# @Project : TestDB
+
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from buffer.Buffer import Buffer
+from buffer.ReplacementPolicy import ReplacementPolicy
+from file.BlockID import BlockID
+
+
+class LRUPolicy(ReplacementPolicy):
+    """
+    Least recently used replacement: the victim is the buffer that was unpinned longest ago.
+
+    Only unpinned buffers are kept, in the order they were unpinned, so choosing a victim takes
+    the first of them and costs the same whatever the size of the pool.
+
+    Attributes:
+        __unpinned (OrderedDict): The unpinned buffers, least recently used first.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty policy.
+        """
+        self.__unpinned: OrderedDict[Buffer, None] = OrderedDict()
+
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Removes the buffer from the candidates while it is pinned.
+
+        Args:
+            buff (Buffer): The pinned buffer.
+            hit (bool): Whether the block was resident; not used by LRU.
+        """
+        self.__unpinned.pop(buff, None)
+
+    def unpinned(self, buff: Buffer):
+        """
+        Makes the buffer the most recently used candidate.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        self.__unpinned[buff] = None
+
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Returns the least recently used unpinned buffer.
+
+        Args:
+            blk (BlockID): The block about to be read; not used by LRU.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        if not self.__unpinned:
+            return None
+        return self.__unpinned.popitem(last=False)[0]
+
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the unpinned buffers, least recently used first.
+
+        Returns:
+            Iterator[Buffer]: The buffers in eviction order.
+        """
+        return iter(self.__unpinned)
+
+    def removed(self, buff: Buffer):
+        """
+        Forgets the buffer.
+
+        Args:
+            buff (Buffer): The emptied buffer.
+        """
+        self.__unpinned.pop(buff, None)
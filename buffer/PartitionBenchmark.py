@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 01:35
+# @Author  : EvanWong
+# @File    : PartitionBenchmark.py
+# @Project : TestDB
+import os
+import random
+import tempfile
+import threading
+import time
+
+from buffer.BenchmarkFile import create_file
+from buffer.BufferMgr import BufferMgr
+from buffer.PartitionedBufferMgr import PartitionedBufferMgr
+from file.BlockID import BlockID
+from file.DirectChannel import DirectChannel
+from file.FileMgr import FileMgr
+from file.IOMode import IOMode
+from log.LogMgr import LogMgr
+
+BLOCK_SIZE = 4096
+NUM_BLOCKS = 4096
+POOL_SIZE = 1024
+PINS = 20000
+HOT_SHARE = 0.5  # Share of pins going to the hot blocks, which fit into the pool
+HOT_BLOCKS = 512
+PARTITIONS = 8
+THREADS = [1, 2, 4, 8]
+FILENAME = "bench.tbl"
+IO_MODE = IOMode.DIRECT if DirectChannel.supported() else IOMode.BUFFERED
+
+
+def run(directory: str, threads: int, partitions: int) -> float:
+    """
+    Splits PINS pins among threads, each pinning random blocks, mostly hot ones, and reading
+    their first integer.
+
+    Args:
+        directory (str): The database directory holding the file.
+        threads (int): The number of threads.
+        partitions (int): The number of partitions of the pool; 1 uses a plain `BufferMgr`.
+
+    Returns:
+        float: The number of pins per second.
+    """
+    fm = FileMgr(directory, BLOCK_SIZE, IO_MODE, cache_size=0)
+    lm = LogMgr(fm, "simpledb.log")
+    if partitions > 1:
+        bm = PartitionedBufferMgr(fm, lm, POOL_SIZE, read_ahead=0, partitions=partitions)
+    else:
+        bm = BufferMgr(fm, lm, POOL_SIZE, read_ahead=0)
+
+    def worker(seed: int):
+        rnd = random.Random(seed)
+        for _ in range(PINS // threads):
+            hot = rnd.random() < HOT_SHARE
+            n = rnd.randrange(HOT_BLOCKS) if hot else rnd.randrange(HOT_BLOCKS, NUM_BLOCKS)
+            buff = bm.pin(BlockID(FILENAME, n))
+            assert buff.contents.get_int(0) == n, "the pin returned the wrong block"
+            bm.unpin(buff)
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    fm.close()
+    return PINS / elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        db_directory = os.path.join(base_directory, "partitionbench")
+        create_file(db_directory, BLOCK_SIZE, NUM_BLOCKS, FILENAME)
+
+        print(f"{PINS} pins of {NUM_BLOCKS} blocks, {HOT_SHARE:.0%} to {HOT_BLOCKS} hot ones, "
+              f"pool of {POOL_SIZE} buffers, {IO_MODE.name} I/O, pins/s")
+        print(f"{'threads':>8}{'single pool':>14}{f'{PARTITIONS} partitions':>16}")
+        for count in THREADS:
+            single = run(db_directory, count, 1)
+            partitioned = run(db_directory, count, PARTITIONS)
+            print(f"{count:>8}{single:>14,.0f}{partitioned:>16,.0f}")
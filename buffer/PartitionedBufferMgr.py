@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 01:05
+# @Author  : EvanWong
+# @File    : PartitionedBufferMgr.py
+# @Project : TestDB
+from itertools import chain, zip_longest
+from typing import List, Optional
+
+from buffer.Buffer import Buffer
+from buffer.BufferMgr import BufferMgr
+from buffer.BufferPool import BufferPool
+from buffer.BufferRing import BufferRing
+from buffer.ReplacementStrategy import ReplacementStrategy
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from log.LogMgr import LogMgr
+
+
+class PartitionedBufferMgr(BufferPool):
+    """
+    A buffer manager whose pool is split into partitions, each an independent `BufferMgr` with
+    its own lock, free list, replacement policy, dirty-page table and read-ahead state.
+
+    A block always goes to the same partition, chosen by hashing its file name and the stripe of
+    STRIPE consecutive blocks it lies in. Threads pinning blocks of different partitions never
+    wait for each other's lock, in particular not while another partition reads a block from
+    disk. Keeping stripes together lets each partition still read ahead of sequential scans, up
+    to the end of a stripe; a ring is shared by all partitions, each reusing only its own buffers.
+
+    The buffers are divided evenly and a partition cannot borrow buffers from the others: a pin
+    waits, and may time out, when every buffer of its partition is pinned, even if other
+    partitions have unpinned buffers. Statistics are summed over the partitions.
+
+    Attributes:
+        __partitions (List[BufferMgr]): The partitions.
+    """
+
+    DEFAULT_PARTITIONS = 8  # Default number of partitions
+    STRIPE = 32  # Number of consecutive blocks of a file kept in the same partition
+
+    def __init__(self, fm: FileMgr, lm: LogMgr, num_buffs: int, max_wait: float = BufferPool.DEFAULT_MAX_WAIT,
+                 strategy: ReplacementStrategy = ReplacementStrategy.LRU,
+                 read_ahead: int = BufferMgr.DEFAULT_READ_AHEAD, partitions: int = DEFAULT_PARTITIONS):
+        """
+        Initializes the partitions, dividing the buffers evenly among them.
+
+        Args:
+            fm (FileMgr): The file manager for reading/writing blocks.
+            lm (LogMgr): The log manager for managing log records.
+            num_buffs (int): The total number of buffers.
+            max_wait (float): The maximum time, in seconds, a pin waits for a free buffer.
+            strategy (ReplacementStrategy): The replacement policy of every partition.
+            read_ahead (int): The largest number of blocks a partition reads ahead of a sequential reader.
+            partitions (int): The number of partitions; there are no more partitions than buffers.
+
+        Raises:
+            ValueError: If the number of partitions is not positive.
+        """
+        if partitions < 1:
+            raise ValueError("partitions must be positive.")
+        count = max(1, min(partitions, num_buffs))
+        self.__partitions: List[BufferMgr] = [
+            BufferMgr(fm, lm, num_buffs // count + (1 if i < num_buffs % count else 0), max_wait, strategy,
+                      read_ahead, self.STRIPE)
+            for i in range(count)]
+
+    @property
+    def partitions(self) -> int:
+        """
+        Returns the number of partitions.
+
+        Returns:
+            int: The number of partitions.
+        """
+        return len(self.__partitions)
+
+    @property
+    def available(self) -> int:
+        """
+        Returns the number of unpinned buffers over all partitions.
+
+        Returns:
+            int: The number of available buffers.
+        """
+        return sum(p.available for p in self.__partitions)
+
+    @property
+    def buffer_count(self) -> int:
+        """
+        Returns the total number of buffers.
+
+        Returns:
+            int: The number of buffers.
+        """
+        return sum(p.buffer_count for p in self.__partitions)
+
+    @property
+    def waits(self) -> int:
+        """
+        Returns the number of pins that had to wait for a buffer.
+
+        Returns:
+            int: The number of waits.
+        """
+        return sum(p.waits for p in self.__partitions)
+
+    @property
+    def timeouts(self) -> int:
+        """
+        Returns the number of pins that gave up waiting.
+
+        Returns:
+            int: The number of timeouts.
+        """
+        return sum(p.timeouts for p in self.__partitions)
+
+    @property
+    def wait_time(self) -> float:
+        """
+        Returns the total time spent waiting for buffers.
+
+        Returns:
+            float: The wait time in seconds.
+        """
+        return sum(p.wait_time for p in self.__partitions)
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of pins that found their block in a buffer.
+
+        Returns:
+            int: The number of hits.
+        """
+        return sum(p.hits for p in self.__partitions)
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of pins that had to read their block from disk.
+
+        Returns:
+            int: The number of misses.
+        """
+        return sum(p.misses for p in self.__partitions)
+
+    @property
+    def dirty_evictions(self) -> int:
+        """
+        Returns the number of pins that found their victim dirty and had to write it back.
+
+        Returns:
+            int: The number of dirty evictions.
+        """
+        return sum(p.dirty_evictions for p in self.__partitions)
+
+    @property
+    def prefetches(self) -> int:
+        """
+        Returns the number of blocks read ahead of sequential readers.
+
+        Returns:
+            int: The number of blocks read ahead.
+        """
+        return sum(p.prefetches for p in self.__partitions)
+
+    @property
+    def prefetch_hits(self) -> int:
+        """
+        Returns the number of blocks read ahead that were pinned before being evicted.
+
+        Returns:
+            int: The number of blocks read ahead and used.
+        """
+        return sum(p.prefetch_hits for p in self.__partitions)
+
+    @property
+    def dirty_count(self) -> int:
+        """
+        Returns the number of buffers holding modifications that were not written back.
+
+        Returns:
+            int: The number of dirty buffers.
+        """
+        return sum(p.dirty_count for p in self.__partitions)
+
+    def flush_all(self, tx_num: int):
+        """
+        Flushes the buffers modified by a transaction in every partition.
+
+        Args:
+            tx_num (int): The transaction ID whose buffers should be flushed.
+        """
+        for p in self.__partitions:
+            p.flush_all(tx_num)
+
+    def write_ahead(self, max_pages: int, scan_depth: int) -> int:
+        """
+        Writes back dirty, unpinned buffers close to eviction, sharing the limits among the partitions.
+
+        Args:
+            max_pages (int): The maximum number of buffers to write.
+            scan_depth (int): The number of buffers to examine.
+
+        Returns:
+            int: The number of buffers written.
+        """
+        count = len(self.__partitions)
+        return sum(p.write_ahead(-(-max_pages // count), -(-scan_depth // count)) for p in self.__partitions)
+
+    def discard_file(self, filename: str):
+        """
+        Detaches every buffer holding a block of the given file in every partition.
+
+        Args:
+            filename (str): The name of the file.
+        """
+        for p in self.__partitions:
+            p.discard_file(filename)
+
+    def resize(self, num_buffs: int):
+        """
+        Grows or shrinks every partition, dividing the new number of buffers evenly among them.
+
+        Args:
+            num_buffs (int): The new total number of buffers.
+
+        Raises:
+            ValueError: If there would be fewer buffers than partitions.
+        """
+        count = len(self.__partitions)
+        if num_buffs < count:
+            raise ValueError("num_buffs must be at least the number of partitions.")
+        for i, p in enumerate(self.__partitions):
+            p.resize(num_buffs // count + (1 if i < num_buffs % count else 0))
+
+    def resident_blocks(self) -> List[BlockID]:
+        """
+        Returns the blocks of permanent files held by the partitions, taking the hottest block of
+        each partition in turn, as the hotness of blocks of different partitions is not comparable.
+
+        Returns:
+            List[BlockID]: The resident blocks, hottest first.
+        """
+        ranked = zip_longest(*(p.resident_blocks() for p in self.__partitions))
+        return [blk for blk in chain.from_iterable(ranked) if blk is not None]
+
+    def prewarm(self, blocks: List[BlockID]) -> int:
+        """
+        Reads blocks into the free buffers of their partitions.
+
+        Args:
+            blocks (List[BlockID]): The blocks to read, hottest first. Their files must exist.
+
+        Returns:
+            int: The number of blocks read.
+        """
+        routed: List[List[BlockID]] = [[] for _ in self.__partitions]
+        for blk in blocks:
+            routed[self.__index(blk)].append(blk)
+        return sum(p.prewarm(part) for p, part in zip(self.__partitions, routed))
+
+    def new_ring(self) -> BufferRing:
+        """
+        Creates a buffer ring for a bulk operation, sized for a single partition.
+
+        Returns:
+            BufferRing: The new ring.
+        """
+        return self.__partitions[-1].new_ring()  # The last partition is the smallest
+
+    def reserve(self, filename: str, frames: int) -> int:
+        """
+        Reserves buffers for a file in every partition. A small file lies in a single stripe, hence
+        in a single partition, so each partition reserves the whole number of buffers.
+
+        Args:
+            filename (str): The name of the file.
+            frames (int): The number of buffers to reserve in each partition.
+
+        Returns:
+            int: The number of buffers reserved in every partition.
+
+        Raises:
+            ValueError: If the number of buffers is negative.
+        """
+        return min([p.reserve(filename, frames) for p in self.__partitions])
+
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None) -> Buffer:
+        """
+        Pins a block in its partition.
+
+        Args:
+            blk (BlockID): The block to pin.
+            ring (Optional[BufferRing]): The ring of a bulk operation, if any.
+
+        Returns:
+            Buffer: The buffer containing the pinned block.
+
+        Raises:
+            BufferAbortException: If the partition has no buffer available within the maximum wait time.
+        """
+        return self.__partitions[self.__index(blk)].pin(blk, ring)
+
+    def unpin(self, buff: Buffer):
+        """
+        Unpins a buffer in the partition holding its block.
+
+        Args:
+            buff (Buffer): The buffer to unpin.
+        """
+        self.__partitions[self.__index(buff.block)].unpin(buff)
+
+    def __index(self, blk: BlockID) -> int:
+        """
+        Returns the index of the partition a block belongs to.
+
+        Args:
+            blk (BlockID): The block.
+
+        Returns:
+            int: The index of the partition holding the block whenever it is resident.
+        """
+        return hash((blk.filename, blk.number // self.STRIPE)) % len(self.__partitions)
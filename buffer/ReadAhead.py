@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 23:40
+# @Author  : EvanWong
+# @File    : ReadAhead.py
+# @Project : TestDB
+
+from typing import Tuple
+
+
+class ReadAhead:
+    """
+    Detects sequential reading of a file and sizes the window of blocks read ahead of the reader.
+
+    The buffer manager reports every block that had to be read and every first pin of a block
+    read ahead. Once SEQUENTIAL_RUN consecutive blocks were accessed, or right away for a reader
+    that declared itself sequential, the blocks following the reader are read ahead. The window
+    starts at MIN_WINDOW blocks and doubles each time the reader has consumed half of the blocks
+    read ahead, up to the limit given by the buffer manager; a block read ahead but evicted
+    before it was used halves it again. A jump to another block starts over.
+
+    Attributes:
+        __next (int): The block a sequential reader accesses next.
+        __run (int): The number of consecutive blocks accessed so far.
+        __window (int): The current window, in blocks; 0 while reading does not look sequential.
+        __ahead (int): The block following the last one read ahead.
+    """
+
+    MIN_WINDOW = 4  # Initial number of blocks read ahead
+    SEQUENTIAL_RUN = 2  # Number of consecutive blocks after which reading is considered sequential
+
+    def __init__(self):
+        """
+        Initializes the state of a reader that has not accessed any block yet.
+        """
+        self.__next: int = -1
+        self.__run: int = 0
+        self.__window: int = 0
+        self.__ahead: int = 0
+
+    @property
+    def window(self) -> int:
+        """
+        Returns the current read-ahead window.
+
+        Returns:
+            int: The number of blocks read ahead of the reader; 0 if reading does not look sequential.
+        """
+        return self.__window
+
+    def access(self, blk_num: int, max_window: int, sequential: bool = False) -> Tuple[int, int]:
+        """
+        Records that a block was read or that a block read ahead was pinned for the first time,
+        and returns the blocks that should be read ahead now.
+
+        Args:
+            blk_num (int): The number of the accessed block.
+            max_window (int): The largest window the buffer manager allows; 0 disables reading ahead.
+            sequential (bool): Whether the reader declared that it reads the file sequentially.
+
+        Returns:
+            Tuple[int, int]: The first block to read ahead and the number of blocks, 0 if none.
+        """
+        if blk_num == self.__next:
+            self.__run += 1
+        else:
+            self.__run = 1
+            self.__window = 0
+            self.__ahead = blk_num + 1
+        self.__next = blk_num + 1
+        if max_window <= 0 or (self.__run < self.SEQUENTIAL_RUN and not sequential):
+            return self.__ahead, 0
+
+        self.__ahead = max(self.__ahead, self.__next)
+        if self.__window and self.__ahead - self.__next > self.__window // 2:
+            return self.__ahead, 0  # Enough blocks are still ahead of the reader
+        self.__window = min(max_window, max(self.MIN_WINDOW, self.__window * 2))
+        first = self.__ahead
+        self.__ahead = max(first, self.__next + self.__window)
+        return first, self.__ahead - first
+
+    def cut(self, blk_num: int):
+        """
+        Records that reading ahead stopped before the given block, e.g. at the end of the file,
+        so that the blocks from there on are read ahead again once the reader gets close.
+
+        Args:
+            blk_num (int): The first block that was not read ahead.
+        """
+        self.__ahead = min(self.__ahead, max(blk_num, self.__next))
+
+    def wasted(self):
+        """
+        Records that a block read ahead was evicted before the reader got to it, halving the window.
+        """
+        self.__window //= 2
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 00:20
+# @Author  : EvanWong
+# @File    : ReadAheadBenchmark.py
+# @Project : TestDB
+import os
+import tempfile
+import time
+
+from buffer.BenchmarkFile import create_file
+from buffer.BufferMgr import BufferMgr
+from file.BlockID import BlockID
+from file.DirectChannel import DirectChannel
+from file.FileMgr import FileMgr
+from file.IOMode import IOMode
+from file.Page import Page
+from log.LogMgr import LogMgr
+
+BLOCK_SIZE = 4096
+NUM_BLOCKS = 8192
+POOL_SIZE = 512
+RUN_LENGTH = 32
+WORK_PER_BLOCK = 64
+FILENAME = "bench.tbl"
+MODES = [IOMode.BUFFERED] + ([IOMode.DIRECT] if DirectChannel.supported() else [])
+SCANS = [("scan, no read-ahead", 0, False),
+         ("scan, read-ahead", BufferMgr.DEFAULT_READ_AHEAD, False),
+         ("ring scan, no read-ahead", 0, True),
+         ("ring scan, read-ahead", BufferMgr.DEFAULT_READ_AHEAD, True)]
+
+
+def evict_file(directory: str):
+    """
+    Asks the operating system to drop the test file from its page cache, so that the next scan is cold.
+
+    Args:
+        directory (str): The database directory holding the file.
+    """
+    fd = os.open(os.path.join(directory, FILENAME), os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def run_bandwidth(directory: str, io_mode: IOMode) -> float:
+    """
+    Reads the cold test file with read_range runs of RUN_LENGTH blocks and nothing else, the
+    bandwidth a scan can approach.
+
+    Args:
+        directory (str): The database directory holding the file.
+        io_mode (IOMode): The I/O backend of the file manager.
+
+    Returns:
+        float: The number of blocks read per second.
+    """
+    evict_file(directory)
+    fm = FileMgr(directory, BLOCK_SIZE, io_mode, cache_size=0)
+    pages = [Page(BLOCK_SIZE) for _ in range(RUN_LENGTH)]
+    start = time.perf_counter()
+    n = 0
+    while n < NUM_BLOCKS:
+        n += fm.read_range(FILENAME, n, RUN_LENGTH, pages)
+    elapsed = time.perf_counter() - start
+    fm.close()
+    return NUM_BLOCKS / elapsed
+
+
+def run_scan(directory: str, io_mode: IOMode, read_ahead: int, bulk: bool) -> float:
+    """
+    Scans the cold test file through a buffer manager, pinning one block at a time and reading
+    WORK_PER_BLOCK integers from each, as a table scan does with its records.
+
+    Args:
+        directory (str): The database directory holding the file.
+        io_mode (IOMode): The I/O backend of the file manager.
+        read_ahead (int): The buffer manager's read-ahead limit; 0 disables reading ahead.
+        bulk (bool): Whether the scan pins through a buffer ring.
+
+    Returns:
+        float: The number of blocks scanned per second.
+    """
+    evict_file(directory)
+    fm = FileMgr(directory, BLOCK_SIZE, io_mode, cache_size=0)
+    bm = BufferMgr(fm, LogMgr(fm, "simpledb.log"), POOL_SIZE, read_ahead=read_ahead)
+    ring = bm.new_ring() if bulk else None
+    start = time.perf_counter()
+    for n in range(NUM_BLOCKS):
+        buff = bm.pin(BlockID(FILENAME, n), ring)
+        page = buff.contents
+        assert page.get_int(0) == n, "the scan returned the wrong block"
+        for offset in range(0, WORK_PER_BLOCK * 4, 4):
+            page.get_int(offset)
+        bm.unpin(buff)
+    elapsed = time.perf_counter() - start
+    fm.close()
+    return NUM_BLOCKS / elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        db_directory = os.path.join(base_directory, "readaheadbench")
+        create_file(db_directory, BLOCK_SIZE, NUM_BLOCKS, FILENAME)
+
+        print(f"Cold scans of {NUM_BLOCKS} blocks of {BLOCK_SIZE} bytes, pool of {POOL_SIZE} buffers, blocks/s")
+        print(f"{'':>26}" + "".join(f"{mode.name:>12}" for mode in MODES))
+        bandwidths = [run_bandwidth(db_directory, mode) for mode in MODES]
+        print(f"{'read_range (bandwidth)':>26}" + "".join(f"{rate:>12,.0f}" for rate in bandwidths))
+        for label, read_ahead, bulk in SCANS:
+            rates = [run_scan(db_directory, mode, read_ahead, bulk) for mode in MODES]
+            print(f"{label:>26}" + "".join(f"{rate:>12,.0f}" for rate in rates))
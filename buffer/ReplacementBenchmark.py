@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 21:10
+# @Author  : EvanWong
+# @File    : ReplacementBenchmark.py
+# @Project : TestDB
+import os
+import random
+import tempfile
+import time
+from typing import List, Tuple
+
+from buffer.BufferMgr import BufferMgr
+from buffer.ReplacementStrategy import ReplacementStrategy
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from log.LogMgr import LogMgr
+
+BLOCK_SIZE = 400
+NUM_BLOCKS = 2000
+POOL_SIZE = 100
+TRACE_LENGTH = 50000
+HOT_BLOCKS = 80
+SCAN_LENGTH = 400
+SCAN_EVERY = 1000
+ZIPF_SKEW = 1.0
+FILENAME = "bench.tbl"
+
+
+def scan_heavy_trace(seed: int = 1) -> List[int]:
+    """
+    Builds a trace of point lookups on a hot set that fits in the pool, interrupted every
+    SCAN_EVERY accesses by a sequential scan of SCAN_LENGTH blocks, several times the pool size.
+
+    Args:
+        seed (int): The seed of the random generator.
+
+    Returns:
+        List[int]: The block numbers accessed, in order.
+    """
+    rnd = random.Random(seed)
+    trace: List[int] = []
+    while len(trace) < TRACE_LENGTH:
+        trace.extend(rnd.randrange(HOT_BLOCKS) for _ in range(SCAN_EVERY))
+        start = rnd.randrange(HOT_BLOCKS, NUM_BLOCKS - SCAN_LENGTH)
+        trace.extend(range(start, start + SCAN_LENGTH))
+    return trace[:TRACE_LENGTH]
+
+
+def point_lookup_trace(seed: int = 1) -> List[int]:
+    """
+    Builds a trace of independent lookups whose block numbers follow a Zipf distribution.
+
+    Args:
+        seed (int): The seed of the random generator.
+
+    Returns:
+        List[int]: The block numbers accessed, in order.
+    """
+    rnd = random.Random(seed)
+    weights = [1 / (rank + 1) ** ZIPF_SKEW for rank in range(NUM_BLOCKS)]
+    blocks = list(range(NUM_BLOCKS))
+    rnd.shuffle(blocks)  # Hot blocks are spread over the file
+    return rnd.choices(blocks, weights, k=TRACE_LENGTH)
+
+
+def replay(directory: str, strategy: ReplacementStrategy, trace: List[int]) -> Tuple[float, float]:
+    """
+    Pins and unpins the blocks of a trace through a buffer manager using the given policy.
+
+    Args:
+        directory (str): The database directory holding the test file.
+        strategy (ReplacementStrategy): The replacement policy.
+        trace (List[int]): The block numbers to access.
+
+    Returns:
+        Tuple[float, float]: The hit rate and the number of accesses per second.
+    """
+    fm = FileMgr(directory, BLOCK_SIZE, cache_size=0)
+    lm = LogMgr(fm, "bench.log")
+    bm = BufferMgr(fm, lm, POOL_SIZE, strategy=strategy)
+    blocks = [BlockID(FILENAME, n) for n in range(NUM_BLOCKS)]
+    start = time.perf_counter()
+    for n in trace:
+        bm.unpin(bm.pin(blocks[n]))
+    elapsed = time.perf_counter() - start
+    return bm.hits / len(trace), len(trace) / elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as base_directory:
+        directory = os.path.join(base_directory, "replacementbench")
+        fm = FileMgr(directory, BLOCK_SIZE)
+        for _ in range(NUM_BLOCKS):
+            fm.append(FILENAME)
+        fm.close()
+
+        print(f"{NUM_BLOCKS} blocks, {POOL_SIZE} buffers, {TRACE_LENGTH} accesses per trace")
+        for name, trace in (("scan-heavy", scan_heavy_trace()), ("point-lookup", point_lookup_trace())):
+            print(f"\n{name} workload")
+            for strategy in ReplacementStrategy:
+                hit_rate, rate = replay(directory, strategy, trace)
+                print(f"  {strategy.name:6} hit rate {hit_rate:6.1%}   {rate:10.0f} accesses/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:08
+# @Author  : EvanWong
+# @File    : ReplacementPolicy.py
+# @Project : TestDB
+
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+from buffer.Buffer import Buffer
+from file.BlockID import BlockID
+
+
+class ReplacementPolicy(ABC):
+    """
+    Abstract base class for the strategies deciding which buffer the buffer manager reassigns.
+
+    A policy only sees buffers that hold a block: the buffer manager hands out empty buffers
+    itself before asking the policy for a victim. It tells the policy about every pin, about
+    buffers becoming unpinned and about buffers it empties, and asks it to choose a victim when
+    a block has to be read while no buffer is empty. A victim must be unpinned. All calls are
+    made while holding the buffer manager's lock, so policies need no locking of their own.
+    """
+
+    @abstractmethod
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Records an access: the buffer was pinned.
+
+        Args:
+            buff (Buffer): The pinned buffer, which holds the accessed block.
+            hit (bool): False if the block was just read into the buffer, True if it was resident,
+                including when the policy stopped tracking the buffer through `removed`.
+        """
+        pass
+
+    @abstractmethod
+    def unpinned(self, buff: Buffer):
+        """
+        Records that the buffer's pin count dropped to zero, so it may be chosen as a victim.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        pass
+
+    @abstractmethod
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Chooses an unpinned buffer whose block is evicted to make room for the given block.
+
+        The victim is reported again through `pinned`, with `hit` False, once it holds the new block.
+
+        Args:
+            blk (BlockID): The block about to be read.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        pass
+
+    @abstractmethod
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the tracked buffers, those the policy would evict soonest first.
+
+        Pinned buffers may be included. For policies whose choice depends on the requested block
+        the order is a best guess. Used by the background writer to write dirty buffers back
+        before they are chosen as victims; the policy must not be called while iterating.
+
+        Returns:
+            Iterator[Buffer]: The buffers in approximate eviction order.
+        """
+        pass
+
+    @abstractmethod
+    def removed(self, buff: Buffer):
+        """
+        Stops tracking a buffer that the buffer manager emptied, e.g. because its file was deleted.
+
+        Args:
+            buff (Buffer): The unpinned buffer, which still holds its block.
+        """
+        pass
+
+    def resized(self, capacity: int):
+        """
+        Records that the pool now holds the given number of buffers. Buffers that left the pool
+        were reported through `removed` first. Does nothing unless the policy is sized by the pool.
+
+        Args:
+            capacity (int): The new number of buffers in the pool.
+        """
+        pass
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:05
+# @Author  : EvanWong
+# @File    : ReplacementStrategy.py
+# @Project : TestDB
+
+from enum import Enum
+
+
+class ReplacementStrategy(Enum):
+    """
+    Enumeration of the buffer replacement policies supported by the buffer manager.
+
+        - LRU: evicts the buffer that was unpinned longest ago.
+        - CLOCK: approximates LRU with a reference bit per buffer and a sweeping hand.
+        - LRU_K: evicts the buffer whose K-th most recent access (K = 2) lies furthest back, so
+          blocks touched only once, e.g. by a scan, go before blocks that are used repeatedly.
+        - TWO_Q: admits new blocks to a small FIFO queue and promotes only blocks re-referenced
+          after leaving it to the main LRU queue.
+        - ARC: balances a recency list and a frequency list, adapting their sizes to the workload
+          from the history of recently evicted blocks.
+    """
+    LRU = 0  # Represents least recently used replacement.
+    CLOCK = 1  # Represents the clock (second chance) algorithm.
+    LRU_K = 2  # Represents LRU-2.
+    TWO_Q = 3  # Represents the full 2Q algorithm.
+    ARC = 4  # Represents adaptive replacement.
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 02:55
+# @Author  : EvanWong
+# @File    : SharedBuffer.py
+# @Project : TestDB
+import os
+import struct
+from typing import Optional
+
+from buffer.DirtyPageTable import DirtyPageTable
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from file.PageView import PageView
+from log.LogMgr import LogMgr
+
+_OWNER = struct.Struct('=i')
+
+
+class SharedBuffer:
+    """
+    A process's handle on a frame of a `SharedBufferMgr`, offering transactions the interface of `Buffer`.
+
+    The page lives in shared memory and is read and written in place. The block, pin count and
+    modifications recorded here are those of the calling process: a frame modified by this
+    process is marked as owned by it in the frame's descriptor, so that no other process evicts
+    it, and only this process writes it back, after flushing its own log.
+
+    Attributes:
+        __fm (FileMgr): The file manager of this process.
+        __lm (LogMgr): The log manager of this process.
+        __index (int): The index of the frame in the pool.
+        __contents (PageView): The frame's page.
+        __owner (memoryview): The owner field of the frame's descriptor: the ID of the process
+            holding unwritten modifications of the frame, 0 if none.
+        __dirty_table (DirtyPageTable): The dirty-page table of this process.
+        __blk (Optional[BlockID]): The block the frame held when this process last pinned it.
+        __pins (int): The number of pins this process holds on the frame.
+        __tx_num (int): The transaction of this process that last modified the frame, -1 if none.
+        __lsn (int): The LSN of the latest of those modifications, -1 if none was logged.
+    """
+
+    def __init__(self, fm: FileMgr, lm: LogMgr, index: int, page: memoryview, owner: memoryview,
+                 dirty_table: DirtyPageTable):
+        """
+        Initializes a handle on a frame that this process has not pinned yet.
+
+        Args:
+            fm (FileMgr): The file manager of this process.
+            lm (LogMgr): The log manager of this process.
+            index (int): The index of the frame in the pool.
+            page (memoryview): The frame's page in shared memory.
+            owner (memoryview): The owner field of the frame's descriptor.
+            dirty_table (DirtyPageTable): The dirty-page table of this process.
+        """
+        self.__fm: FileMgr = fm
+        self.__lm: LogMgr = lm
+        self.__index: int = index
+        self.__contents: PageView = PageView(page)
+        self.__owner: memoryview = owner
+        self.__dirty_table: DirtyPageTable = dirty_table
+        self.__blk: Optional[BlockID] = None
+        self.__pins: int = 0
+        self.__tx_num: int = -1
+        self.__lsn: int = -1
+
+    @property
+    def index(self) -> int:
+        """
+        Returns the index of the frame in the pool.
+
+        Returns:
+            int: The frame index.
+        """
+        return self.__index
+
+    @property
+    def contents(self) -> PageView:
+        """
+        Returns the frame's page.
+
+        Returns:
+            PageView: The page, in shared memory.
+        """
+        return self.__contents
+
+    @property
+    def block(self) -> Optional[BlockID]:
+        """
+        Returns the block the frame held when this process last pinned it; the current block while pinned.
+
+        Returns:
+            BlockID: The block, or None if this process never pinned the frame.
+        """
+        return self.__blk
+
+    def set_modified(self, tx_num: int, lsn: int):
+        """
+        Marks the frame as modified by a transaction of this process and a log record.
+
+        Args:
+            tx_num (int): The transaction ID that modified the frame.
+            lsn (int): The Log Sequence Number of the modification.
+        """
+        self.__tx_num = tx_num
+        if lsn > 0:
+            self.__lsn = lsn
+        self.__dirty_table.mark(self, tx_num)
+        _OWNER.pack_into(self.__owner, 0, os.getpid())
+
+    @property
+    def is_pinned(self) -> bool:
+        """
+        Checks if this process has pinned the frame.
+
+        Returns:
+            bool: True if this process holds a pin on the frame.
+        """
+        return self.__pins > 0
+
+    @property
+    def modifying_tx(self) -> int:
+        """
+        Returns the ID of the transaction of this process that last modified the frame.
+
+        Returns:
+            int: The transaction ID, or -1 if the frame holds no modifications of this process.
+        """
+        return self.__tx_num
+
+    @property
+    def is_modified(self) -> bool:
+        """
+        Checks if the frame holds modifications of this process that have not been written back.
+
+        Returns:
+            bool: True if the frame is dirty, False otherwise.
+        """
+        return self.__tx_num >= 0
+
+    @property
+    def lsn(self) -> int:
+        """
+        Returns the Log Sequence Number of the most recent modification by this process.
+
+        Returns:
+            int: The LSN, or -1 if no modification was logged.
+        """
+        return self.__lsn
+
+    def attach(self, blk: BlockID):
+        """
+        Records the block the frame holds as this process pins it for the first time since
+        it last held no pin on it; other processes may have reassigned the frame meanwhile.
+
+        Args:
+            blk (BlockID): The block the frame holds.
+        """
+        self.__blk = blk
+
+    def pin(self):
+        """
+        Records a pin of this process on the frame.
+        """
+        self.__pins += 1
+
+    def unpin(self):
+        """
+        Releases a pin of this process on the frame.
+        """
+        self.__pins -= 1
+
+    def flush(self):
+        """
+        Writes the frame back synchronously if this process modified it, flushing its log first.
+        The write must reach the file before any other process may read the block again.
+        """
+        if self.__tx_num < 0:
+            return
+        self.__lm.flush(self.__lsn)
+        self.__fm.write(self.__blk, self.__contents)
+        self.__mark_clean()
+
+    def discard(self):
+        """
+        Forgets the frame's block, dropping modifications of this process without writing them.
+        """
+        self.__blk = None
+        self.__mark_clean()
+        self.__lsn = -1
+        self.__pins = 0
+
+    def __mark_clean(self):
+        """
+        Records that the frame holds no unwritten modifications of this process any more.
+        """
+        if self.__tx_num >= 0:
+            self.__tx_num = -1
+            _OWNER.pack_into(self.__owner, 0, 0)
+            self.__dirty_table.clear(self)
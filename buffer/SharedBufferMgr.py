@@ -0,0 +1,796 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 03:10
+# @Author  : EvanWong
+# @File    : SharedBufferMgr.py
+# @Project : TestDB
+import multiprocessing
+import os
+import struct
+import time
+import zlib
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+from buffer.BufferAbortException import BufferAbortException
+from buffer.BufferPool import BufferPool
+from buffer.BufferRing import BufferRing
+from buffer.DirtyPageTable import DirtyPageTable
+from buffer.SharedBuffer import SharedBuffer
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from log.LogMgr import LogMgr
+
+# Layout of the shared segment: a header, a descriptor per frame, the hash table and the pages.
+_HEADER = struct.Struct('=ii')  # Clock hand, number of processes waiting on the condition
+_FRAME = struct.Struct('=iIiBBxxi64s')  # Block number, hash, pins, state, reference bit, owner, file name
+_KEY = struct.Struct('=iI')  # Block number and hash, at the start of a descriptor
+_STATUS = struct.Struct('=iBBxxi')  # Pins, state, reference bit and owner, at STATUS_OFFSET
+_I32 = struct.Struct('=i')
+
+STATUS_OFFSET = 8  # Offset of the pin count in a descriptor
+STATE_OFFSET = 12  # Offset of the state in a descriptor
+USAGE_OFFSET = 13  # Offset of the reference bit in a descriptor
+OWNER_OFFSET = 16  # Offset of the owner in a descriptor
+NAME_OFFSET = 20  # Offset of the file name in a descriptor
+WAITING_OFFSET = 4  # Offset of the number of waiting processes in the header
+
+EMPTY = 0  # The frame holds no block
+VALID = 1  # The frame holds its block
+READING = 2  # The frame's block is being read; pinning it waits
+WRITING = 3  # The frame's block is being written back for an eviction; pinning it waits
+
+PoolHandle = Tuple[str, int, int, multiprocessing.Condition]
+
+
+class SharedBufferMgr(BufferPool):
+    """
+    A buffer pool in shared memory, shared by the processes working on one database directory so
+    that they do not each cache their own copy of the blocks they read.
+
+    One process creates the pool; the others attach to it with `attach` and the creator's
+    `handle`, passed to them when they are started. The segment holds a descriptor per frame
+    (block, pins of all processes, state, reference bit and owning process), an open-addressing
+    hash table from blocks to frames, and the pages. A `multiprocessing.Condition` is the latch
+    of the descriptors and the table; pages are read and written without holding it. A block that
+    is not resident is read into the frame chosen by a clock sweep, while other processes pinning
+    it wait. If the sweep chooses a frame the evicting process modified, the frame is marked as
+    being written, written back without the latch while pins of its block wait, and the sweep
+    starts over.
+
+    Every process logs through its own `LogMgr`, so a frame modified by a process is written back
+    only by that process, when its transaction commits or when it evicts the frame; the clock
+    sweep of the other processes skips it while that process is running. Once it has exited, its
+    modifications, which were never committed, are dropped when the frame is evicted or its file
+    discarded. Pins are counted per frame, not per process, so pins left by an exited process are
+    not released. For the same reason the file managers must not cache
+    blocks: a block written by one process would stay stale in the caches of the others. The lock
+    table and the log are still private to each process, so processes must not modify the same
+    data concurrently. Temporary files are named after the process using them (see
+    `FileMgr.next_temp_name`), so they never share frames.
+
+    Pins ignore rings, blocks are not read ahead, `reserve` reserves no buffers and the pool cannot
+    be resized. Statistics are those of the calling process.
+
+    Attributes:
+        __shm (SharedMemory): The shared segment.
+        __buf (memoryview): The segment's memory.
+        __creator (bool): Whether this process created the segment and unlinks it on close.
+        __fm (FileMgr): The file manager of this process.
+        __lm (LogMgr): The log manager of this process.
+        __latch (multiprocessing.Condition): Guards descriptors, hash table and clock hand of all processes.
+        __num_buffs (int): The number of frames.
+        __mask (int): The number of hash buckets minus one; the number of buckets is a power of two.
+        __buckets (int): The offset of the hash table.
+        __pages (int): The offset of the first page.
+        __pid (int): The ID of this process, recorded as owner of the frames it modifies.
+        __names (Dict[str, Tuple[bytes, int]]): The encoded names of files and their checksums.
+        __buffers (List[Optional[SharedBuffer]]): This process's handles on the frames, created on first pin.
+        __dirty (DirtyPageTable): The frames this process modified, by transaction.
+    """
+
+    NAME_SIZE = 64  # Longest file name, in encoded bytes
+    PAGE_ALIGNMENT = 4096  # Alignment of the pages in the segment
+
+    def __init__(self, fm: FileMgr, lm: LogMgr, num_buffs: int, max_wait: float = BufferPool.DEFAULT_MAX_WAIT,
+                 handle: Optional[PoolHandle] = None):
+        """
+        Creates a shared pool, or attaches to an existing one if a handle is given.
+
+        Args:
+            fm (FileMgr): The file manager of this process; it must not cache blocks.
+            lm (LogMgr): The log manager of this process.
+            num_buffs (int): The number of frames.
+            max_wait (float): The maximum time, in seconds, a pin waits for a free frame.
+            handle (Optional[PoolHandle]): The handle of the pool to attach to.
+
+        Raises:
+            ValueError: If the file manager caches blocks, or the handle is of a pool with a different
+                block size or number of frames.
+        """
+        if fm.cache.enabled:
+            raise ValueError("The file manager of a shared buffer pool must not cache blocks.")
+        self.__fm: FileMgr = fm
+        self.__lm: LogMgr = lm
+        self.__max_wait: float = max_wait
+        self.__num_buffs: int = num_buffs
+        self.__mask: int = (1 << (2 * num_buffs - 1).bit_length()) - 1  # At most half of the buckets are used
+        self.__buckets: int = _HEADER.size + num_buffs * _FRAME.size
+        pages = self.__buckets + (self.__mask + 1) * _I32.size
+        self.__pages: int = -(-pages // self.PAGE_ALIGNMENT) * self.PAGE_ALIGNMENT
+        size = self.__pages + num_buffs * fm.block_size
+        if handle is None:
+            self.__shm: SharedMemory = SharedMemory(create=True, size=size)
+            self.__creator: bool = True
+            self.__latch = multiprocessing.Condition()
+            self.__buf: memoryview = self.__shm.buf
+            _HEADER.pack_into(self.__buf, 0, 0, 0)
+            for i in range(num_buffs):
+                _FRAME.pack_into(self.__buf, self.__frame(i), -1, 0, 0, EMPTY, 0, 0, b'')
+            self.__buf[self.__buckets: self.__pages] = b'\xff' * (self.__pages - self.__buckets)  # -1: free
+        else:
+            name, count, block_size, self.__latch = handle
+            if count != num_buffs or block_size != fm.block_size:
+                raise ValueError("The pool has a different block size or number of frames.")
+            # Processes started by multiprocessing share the creator's resource tracker, which holds the
+            # segment once however many processes register it and forgets it when the creator unlinks it
+            self.__shm = SharedMemory(name)
+            self.__creator = False
+            self.__buf = self.__shm.buf
+        self.__pid: int = os.getpid()
+        self.__names: Dict[str, Tuple[bytes, int]] = {}
+        self.__buffers: List[Optional[SharedBuffer]] = [None] * num_buffs
+        self.__dirty: DirtyPageTable = DirtyPageTable()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__waits: int = 0
+        self.__timeouts: int = 0
+        self.__wait_time: float = 0.0
+        self.__dirty_evictions: int = 0
+
+    @staticmethod
+    def attach(fm: FileMgr, lm: LogMgr, handle: PoolHandle,
+               max_wait: float = BufferPool.DEFAULT_MAX_WAIT) -> 'SharedBufferMgr':
+        """
+        Attaches to a pool created by another process.
+
+        Args:
+            fm (FileMgr): The file manager of this process; it must not cache blocks.
+            lm (LogMgr): The log manager of this process.
+            handle (PoolHandle): The `handle` of the pool.
+            max_wait (float): The maximum time, in seconds, a pin waits for a free frame.
+
+        Returns:
+            SharedBufferMgr: This process's manager of the pool.
+        """
+        return SharedBufferMgr(fm, lm, handle[1], max_wait, handle)
+
+    @property
+    def handle(self) -> PoolHandle:
+        """
+        Returns what another process needs to attach to the pool: the segment name, the number of
+        frames, the block size and the latch. It must be passed to processes as they are started.
+
+        Returns:
+            PoolHandle: The handle.
+        """
+        return self.__shm.name, self.__num_buffs, self.__fm.block_size, self.__latch
+
+    @property
+    def available(self) -> int:
+        """
+        Returns the number of frames no process has pinned.
+
+        Returns:
+            int: The number of available frames.
+        """
+        with self.__latch:
+            return sum(1 for i in range(self.__num_buffs) if self.__pins(i) == 0)
+
+    @property
+    def buffer_count(self) -> int:
+        """
+        Returns the number of frames.
+
+        Returns:
+            int: The number of frames.
+        """
+        return self.__num_buffs
+
+    @property
+    def waits(self) -> int:
+        """
+        Returns the number of pins of this process that had to wait.
+
+        Returns:
+            int: The number of waits.
+        """
+        return self.__waits
+
+    @property
+    def timeouts(self) -> int:
+        """
+        Returns the number of pins of this process that gave up waiting.
+
+        Returns:
+            int: The number of timeouts.
+        """
+        return self.__timeouts
+
+    @property
+    def wait_time(self) -> float:
+        """
+        Returns the total time pins of this process spent waiting.
+
+        Returns:
+            float: The wait time in seconds.
+        """
+        return self.__wait_time
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of pins of this process that found their block resident, possibly
+        read by another process.
+
+        Returns:
+            int: The number of hits.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of pins of this process that read their block.
+
+        Returns:
+            int: The number of misses.
+        """
+        return self.__misses
+
+    @property
+    def dirty_evictions(self) -> int:
+        """
+        Returns the number of frames this process wrote back to evict them.
+
+        Returns:
+            int: The number of dirty evictions.
+        """
+        return self.__dirty_evictions
+
+    @property
+    def prefetches(self) -> int:
+        """
+        Returns the number of blocks read ahead, always 0 as shared pools do not read ahead.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    @property
+    def prefetch_hits(self) -> int:
+        """
+        Returns the number of blocks read ahead that were pinned, always 0.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    @property
+    def dirty_count(self) -> int:
+        """
+        Returns the number of frames holding modifications of this process that were not written back.
+
+        Returns:
+            int: The number of dirty frames.
+        """
+        return len(self.__dirty)
+
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None) -> SharedBuffer:
+        """
+        Pins a block to a frame, reading it if no process has it resident.
+
+        Args:
+            blk (BlockID): The block to pin.
+            ring (Optional[BufferRing]): Ignored; shared pools do not support rings.
+
+        Returns:
+            SharedBuffer: This process's handle on the frame holding the block.
+
+        Raises:
+            BufferAbortException: If no frame becomes available within the maximum wait time.
+            ValueError: If the encoded file name is longer than NAME_SIZE bytes.
+        """
+        name, checksum = self.__name(blk.filename)
+        key = zlib.crc32(_I32.pack(blk.number), checksum)
+        start_time = time.monotonic()
+        waited = False
+        with self.__latch:
+            while True:
+                i = self.__lookup(name, blk.number, key)
+                if i >= 0 and self.__buf[self.__frame(i) + STATE_OFFSET] == VALID:
+                    self.__hits += 1
+                    pins, state, _, owner = _STATUS.unpack_from(self.__buf, self.__frame(i) + STATUS_OFFSET)
+                    _STATUS.pack_into(self.__buf, self.__frame(i) + STATUS_OFFSET, pins + 1, state, 1, owner)
+                    read = False
+                    break
+                if i < 0:
+                    i = self.__choose_victim()
+                    if i >= 0 and self.__buffers[i] is not None and self.__buffers[i].is_modified:
+                        self.__write_back(self.__buffers[i])
+                        continue  # Another process may have read the block meanwhile
+                    if i >= 0:
+                        self.__claim(i, blk, name, key)
+                        self.__misses += 1
+                        read = True
+                        break
+                remaining = start_time + self.__max_wait - time.monotonic()
+                if remaining <= 0:
+                    self.__timeouts += 1
+                    raise BufferAbortException(
+                        "Buffer pinning failed: No buffer available within the maximum wait time.")
+                waited = True
+                self.__wait(remaining)  # For a frame to be unpinned, or for another process's read or write
+            buff = self.__buffer(i)
+            if not buff.is_pinned:
+                buff.attach(blk)
+            buff.pin()
+        if waited:
+            self.__waits += 1
+            self.__wait_time += time.monotonic() - start_time
+        if read:
+            self.__read(buff)
+        return buff
+
+    def unpin(self, buff: SharedBuffer):
+        """
+        Unpins a frame, waking processes waiting for one once no process has it pinned.
+
+        Args:
+            buff (SharedBuffer): The buffer to unpin.
+        """
+        with self.__latch:
+            buff.unpin()
+            offset = self.__frame(buff.index) + STATUS_OFFSET
+            pins = _I32.unpack_from(self.__buf, offset)[0] - 1
+            _I32.pack_into(self.__buf, offset, pins)
+            if pins == 0:
+                self.__notify()
+
+    def flush_all(self, tx_num: int):
+        """
+        Writes back the frames a transaction of this process modified, sorted by file and block
+        number, after flushing the log once up to the latest of their modifications. The frames
+        are pinned meanwhile, so no thread of this process evicts them.
+
+        Args:
+            tx_num (int): The transaction ID whose frames should be flushed.
+        """
+        buffers = [buff for buff in self.__dirty.buffers(tx_num) if not FileMgr.is_temp(buff.block.filename)]
+        if not buffers:
+            return
+        with self.__latch:
+            for buff in buffers:
+                self.__add_pins(buff.index, 1)
+        try:
+            buffers.sort(key=lambda b: (b.block.filename, b.block.number))
+            self.__lm.flush(max(buff.lsn for buff in buffers))
+            for buff in buffers:
+                buff.flush()
+        finally:
+            with self.__latch:
+                for buff in buffers:
+                    self.__add_pins(buff.index, -1)
+                self.__notify()
+
+    def write_ahead(self, max_pages: int, scan_depth: int) -> int:
+        """
+        Does nothing: frames are written back by the process that modified them, on commit or eviction.
+
+        Args:
+            max_pages (int): The maximum number of buffers to write.
+            scan_depth (int): The number of buffers to examine.
+
+        Returns:
+            int: 0, the number of buffers written.
+        """
+        return 0
+
+    def discard_file(self, filename: str):
+        """
+        Empties the unpinned frames holding blocks of the given file, dropping modifications of this
+        process. Frames modified by other processes are left to them.
+
+        Args:
+            filename (str): The name of the file.
+        """
+        name = self.__name(filename)[0].rstrip(b'\0')
+        with self.__latch:
+            for i in range(self.__num_buffs):
+                offset = self.__frame(i)
+                pins, state, _, owner = _STATUS.unpack_from(self.__buf, offset + STATUS_OFFSET)
+                if state == VALID and pins == 0 and self.__evictable(owner) and self.__name_at(i) == name:
+                    if self.__buffers[i] is not None:
+                        self.__buffers[i].discard()
+                    self.__empty(i)
+
+    def resize(self, num_buffs: int):
+        """
+        Rejects any change of size: the frames of the shared segment are mapped by every process.
+
+        Args:
+            num_buffs (int): The new number of buffers.
+
+        Raises:
+            ValueError: If the number of buffers is not the number of frames.
+        """
+        if num_buffs != self.__num_buffs:
+            raise ValueError(f"A shared buffer pool keeps its {self.__num_buffs} frames.")
+
+    def new_ring(self) -> BufferRing:
+        """
+        Creates a ring of a single buffer for a bulk operation; pins ignore it.
+
+        Returns:
+            BufferRing: The new ring.
+        """
+        return BufferRing(1)
+
+    def reserve(self, filename: str, frames: int) -> int:
+        """
+        Reserves no buffers: the clock sweep is shared by all processes and has no reservations.
+
+        Args:
+            filename (str): The name of the file.
+            frames (int): The number of buffers to reserve.
+
+        Returns:
+            int: 0, the number of buffers reserved.
+
+        Raises:
+            ValueError: If the number of buffers is negative.
+        """
+        if frames < 0:
+            raise ValueError("frames must not be negative.")
+        return 0
+
+    def resident_blocks(self) -> List[BlockID]:
+        """
+        Returns the blocks of permanent files held by the pool, hottest first: the pinned ones,
+        then those referenced since the clock hand last passed them, then the others.
+
+        Returns:
+            List[BlockID]: The resident blocks, hottest first.
+        """
+        ranked = []
+        with self.__latch:
+            for i in range(self.__num_buffs):
+                number = _KEY.unpack_from(self.__buf, self.__frame(i))[0]
+                pins, state, usage, _ = _STATUS.unpack_from(self.__buf, self.__frame(i) + STATUS_OFFSET)
+                if state in (VALID, WRITING):
+                    filename = self.__name_at(i).decode('utf-8')
+                    if not FileMgr.is_temp(filename):
+                        ranked.append((pins == 0, -usage, BlockID(filename, number)))
+        ranked.sort(key=lambda entry: entry[:2])
+        return [blk for _, _, blk in ranked]
+
+    def prewarm(self, blocks: List[BlockID]) -> int:
+        """
+        Reads blocks into the empty frames, the hottest first, skipping resident blocks and blocks
+        beyond the end of their file. The blocks are read one at a time by this process.
+
+        Args:
+            blocks (List[BlockID]): The blocks to read, hottest first. Their files must exist.
+
+        Returns:
+            int: The number of blocks read.
+        """
+        with self.__latch:
+            empty = sum(1 for i in range(self.__num_buffs) if self.__buf[self.__frame(i) + STATE_OFFSET] == EMPTY)
+        misses = self.__misses
+        for blk in blocks:
+            if self.__misses - misses == empty:
+                break
+            if blk.number < self.__fm.block_num(blk.filename):
+                self.unpin(self.pin(blk))
+        return self.__misses - misses
+
+    def close(self):
+        """
+        Detaches this process from the pool, dropping its unwritten modifications; the creator also
+        removes the segment, which stays mapped in the processes still attached. This process must
+        not use its buffers any more.
+
+        Raises:
+            BufferError: If buffers of this process are still referenced.
+        """
+        for i in range(self.__num_buffs):
+            if self.__buffers[i] is not None:
+                self.__buffers[i].discard()  # Also removes it from the dirty-page table, which references it
+        self.__buffers = []
+        self.__buf = None
+        self.__shm.close()
+        if self.__creator:
+            self.__shm.unlink()
+
+    def __name(self, filename: str) -> Tuple[bytes, int]:
+        """
+        Returns the encoded name of a file, padded to NAME_SIZE bytes, and its checksum.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            Tuple[bytes, int]: The padded name and its CRC-32, which seeds the hash of its blocks.
+
+        Raises:
+            ValueError: If the encoded name is longer than NAME_SIZE bytes.
+        """
+        entry = self.__names.get(filename)
+        if entry is None:
+            encoded = filename.encode('utf-8')
+            if len(encoded) > self.NAME_SIZE:
+                raise ValueError(f"File name too long for a shared buffer pool: {filename}")
+            entry = self.__names[filename] = (encoded.ljust(self.NAME_SIZE, b'\0'), zlib.crc32(encoded))
+        return entry
+
+    def __name_at(self, i: int) -> bytes:
+        """
+        Returns the encoded name of the file whose block frame i holds, without padding.
+
+        Args:
+            i (int): The frame index.
+
+        Returns:
+            bytes: The encoded name.
+        """
+        offset = self.__frame(i) + NAME_OFFSET
+        return bytes(self.__buf[offset: offset + self.NAME_SIZE]).rstrip(b'\0')
+
+    def __frame(self, i: int) -> int:
+        """
+        Returns the offset of the descriptor of frame i.
+
+        Args:
+            i (int): The frame index.
+
+        Returns:
+            int: The offset in the segment.
+        """
+        return _HEADER.size + i * _FRAME.size
+
+    def __pins(self, i: int) -> int:
+        """
+        Returns the number of pins all processes hold on frame i.
+
+        Args:
+            i (int): The frame index.
+
+        Returns:
+            int: The pin count.
+        """
+        return _I32.unpack_from(self.__buf, self.__frame(i) + STATUS_OFFSET)[0]
+
+    def __add_pins(self, i: int, delta: int):
+        """
+        Adds to the pin count of frame i.
+
+        Args:
+            i (int): The frame index.
+            delta (int): The number of pins to add, negative to remove pins.
+        """
+        _I32.pack_into(self.__buf, self.__frame(i) + STATUS_OFFSET, self.__pins(i) + delta)
+
+    def __buffer(self, i: int) -> SharedBuffer:
+        """
+        Returns this process's handle on frame i, creating it on first use.
+
+        Args:
+            i (int): The frame index.
+
+        Returns:
+            SharedBuffer: The handle.
+        """
+        buff = self.__buffers[i]
+        if buff is None:
+            page = self.__pages + i * self.__fm.block_size
+            owner = self.__frame(i) + OWNER_OFFSET
+            buff = self.__buffers[i] = SharedBuffer(self.__fm, self.__lm, i,
+                                                    self.__buf[page: page + self.__fm.block_size],
+                                                    self.__buf[owner: owner + _I32.size], self.__dirty)
+        return buff
+
+    def __lookup(self, name: bytes, number: int, key: int) -> int:
+        """
+        Finds the frame holding a block, probing the hash table linearly from the block's bucket.
+
+        Args:
+            name (bytes): The padded name of the block's file.
+            number (int): The block number.
+            key (int): The hash of the block.
+
+        Returns:
+            int: The frame index, or -1 if no frame holds the block.
+        """
+        j = key & self.__mask
+        while True:
+            i = _I32.unpack_from(self.__buf, self.__buckets + j * _I32.size)[0]
+            if i < 0:
+                return -1
+            offset = self.__frame(i)
+            if _KEY.unpack_from(self.__buf, offset) == (number, key) and \
+                    self.__buf[offset + NAME_OFFSET: offset + NAME_OFFSET + self.NAME_SIZE] == name:
+                return i
+            j = (j + 1) & self.__mask
+
+    def __insert(self, i: int, key: int):
+        """
+        Enters frame i into the hash table, in the first free bucket from the block's bucket on.
+
+        Args:
+            i (int): The frame index.
+            key (int): The hash of the frame's block.
+        """
+        j = key & self.__mask
+        while _I32.unpack_from(self.__buf, self.__buckets + j * _I32.size)[0] >= 0:
+            j = (j + 1) & self.__mask
+        _I32.pack_into(self.__buf, self.__buckets + j * _I32.size, i)
+
+    def __remove(self, i: int):
+        """
+        Removes frame i from the hash table, moving later entries of the probe sequence back so
+        that lookups still find them without tombstones.
+
+        Args:
+            i (int): The frame index.
+        """
+        mask, buckets = self.__mask, self.__buckets
+        j = _KEY.unpack_from(self.__buf, self.__frame(i))[1] & mask
+        while _I32.unpack_from(self.__buf, buckets + j * _I32.size)[0] != i:
+            j = (j + 1) & mask
+        _I32.pack_into(self.__buf, buckets + j * _I32.size, -1)
+        k = (j + 1) & mask
+        while True:
+            moved = _I32.unpack_from(self.__buf, buckets + k * _I32.size)[0]
+            if moved < 0:
+                return
+            home = _KEY.unpack_from(self.__buf, self.__frame(moved))[1] & mask
+            if (j < k and (home <= j or home > k)) or (j > k and j >= home > k):  # Home not in (j, k]
+                _I32.pack_into(self.__buf, buckets + j * _I32.size, moved)
+                _I32.pack_into(self.__buf, buckets + k * _I32.size, -1)
+                j = k
+            k = (k + 1) & mask
+
+    def __choose_victim(self) -> int:
+        """
+        Sweeps the clock hand over the frames for an empty frame or an unpinned frame whose
+        reference bit is clear, clearing the bits it passes. Frames being read or written and
+        frames modified by other running processes are skipped.
+
+        Returns:
+            int: The frame index, or -1 if no frame can be evicted.
+        """
+        hand = _I32.unpack_from(self.__buf, 0)[0]
+        victim = -1
+        for _ in range(2 * self.__num_buffs):  # A second round finds the frames whose bits were cleared
+            i = hand
+            hand = hand + 1 if hand + 1 < self.__num_buffs else 0
+            pins, state, usage, owner = _STATUS.unpack_from(self.__buf, self.__frame(i) + STATUS_OFFSET)
+            if state == EMPTY:
+                victim = i
+                break
+            if pins or state != VALID or not self.__evictable(owner):
+                continue
+            if usage:
+                self.__buf[self.__frame(i) + USAGE_OFFSET] = 0
+                continue
+            victim = i
+            break
+        _I32.pack_into(self.__buf, 0, hand)
+        return victim
+
+    def __evictable(self, owner: int) -> bool:
+        """
+        Returns whether this process may evict a frame with the given owner: one holding no
+        modifications, modifications of this process, or those of a process that has exited.
+
+        Args:
+            owner (int): The owner recorded in the frame's descriptor.
+
+        Returns:
+            bool: True if the frame may be evicted.
+        """
+        return owner in (0, self.__pid) or not FileMgr.process_running(owner)
+
+    def __claim(self, i: int, blk: BlockID, name: bytes, key: int):
+        """
+        Assigns a block to the victim frame i, pinned once and marked as being read. The frame
+        holds no unwritten modifications, except those of an exited process, which are dropped.
+
+        Args:
+            i (int): The frame index.
+            blk (BlockID): The block.
+            name (bytes): The padded name of the block's file.
+            key (int): The hash of the block.
+        """
+        if self.__buf[self.__frame(i) + STATE_OFFSET] != EMPTY:
+            self.__remove(i)
+        _FRAME.pack_into(self.__buf, self.__frame(i), blk.number, key, 1, READING, 1, 0, name)
+        self.__insert(i, key)
+
+    def __write_back(self, buff: SharedBuffer):
+        """
+        Writes back a victim frame this process modified. Must be called while holding the latch,
+        which is released during the write: the frame is marked as being written meanwhile, so
+        no process pins or evicts it, and marked valid again afterwards.
+
+        Args:
+            buff (SharedBuffer): The handle on the frame.
+
+        Raises:
+            RuntimeError: If the frame cannot be written.
+        """
+        self.__dirty_evictions += 1
+        state = self.__frame(buff.index) + STATE_OFFSET
+        self.__buf[state] = WRITING
+        self.__latch.release()
+        try:
+            buff.flush()
+        finally:
+            self.__latch.acquire()
+            self.__buf[state] = VALID
+            self.__notify()
+
+    def __read(self, buff: SharedBuffer):
+        """
+        Reads the block of a claimed frame without holding the latch, then marks it valid and
+        wakes the processes waiting for it. If the read fails, the frame is emptied again.
+
+        Args:
+            buff (SharedBuffer): The handle on the frame, pinned by this process.
+
+        Raises:
+            RuntimeError: If the block cannot be read.
+        """
+        try:
+            self.__fm.read(buff.block, buff.contents)
+        except Exception:
+            with self.__latch:
+                buff.discard()
+                self.__empty(buff.index)
+                self.__notify()
+            raise
+        with self.__latch:
+            self.__buf[self.__frame(buff.index) + STATE_OFFSET] = VALID
+            self.__notify()
+
+    def __empty(self, i: int):
+        """
+        Removes frame i from the hash table and marks it empty.
+
+        Args:
+            i (int): The frame index.
+        """
+        self.__remove(i)
+        _FRAME.pack_into(self.__buf, self.__frame(i), -1, 0, 0, EMPTY, 0, 0, b'')
+
+    def __wait(self, timeout: float):
+        """
+        Waits on the latch, counted in the header so that unpins know to notify.
+
+        Args:
+            timeout (float): The longest wait, in seconds.
+        """
+        _I32.pack_into(self.__buf, WAITING_OFFSET, _I32.unpack_from(self.__buf, WAITING_OFFSET)[0] + 1)
+        try:
+            self.__latch.wait(timeout)
+        finally:
+            _I32.pack_into(self.__buf, WAITING_OFFSET, _I32.unpack_from(self.__buf, WAITING_OFFSET)[0] - 1)
+
+    def __notify(self):
+        """
+        Wakes the waiting threads of all processes, if there are any.
+        """
+        if _I32.unpack_from(self.__buf, WAITING_OFFSET)[0]:
+            self.__latch.notify_all()
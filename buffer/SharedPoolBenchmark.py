@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 03:55
+# @Author  : EvanWong
+# @File    : SharedPoolBenchmark.py
+# @Project : TestDB
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from typing import Optional, Tuple
+
+from buffer.BenchmarkFile import create_file
+from buffer.BufferMgr import BufferMgr
+from buffer.SharedBufferMgr import SharedBufferMgr
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from log.LogMgr import LogMgr
+
+BLOCK_SIZE = 4096
+NUM_BLOCKS = 4096
+POOL_SIZE = 1024  # Frames of the shared pool; a private pool gets its share of them
+PINS = 20000  # Pins of each worker
+HOT_SHARE = 0.8  # Share of pins going to the hot blocks, which fit into the shared pool
+HOT_BLOCKS = 768
+WORKERS = [1, 2, 4]
+FILENAME = "bench.tbl"
+
+
+def worker(directory: str, seed: int, pool_size: int, handle, results: multiprocessing.Queue):
+    """
+    Pins random blocks, mostly hot ones, through a private pool of pool_size buffers, or through
+    the shared pool if a handle is given, and reports the number of blocks it read.
+    """
+    fm = FileMgr(directory, BLOCK_SIZE, cache_size=0)
+    lm = LogMgr(fm, f"worker{seed}.log")
+    bm = SharedBufferMgr.attach(fm, lm, handle) if handle else BufferMgr(fm, lm, pool_size, read_ahead=0)
+    rnd = random.Random(seed)
+    for _ in range(PINS):
+        n = rnd.randrange(HOT_BLOCKS) if rnd.random() < HOT_SHARE else rnd.randrange(HOT_BLOCKS, NUM_BLOCKS)
+        buff = bm.pin(BlockID(FILENAME, n))
+        assert buff.contents.get_int(0) == n, "the pin returned the wrong block"
+        bm.unpin(buff)
+    results.put(bm.misses)
+    del buff
+    if handle:
+        bm.close()
+    fm.close()
+
+
+def run(directory: str, workers: int, shared: bool) -> Tuple[int, float]:
+    """
+    Runs workers processes, sharing one pool of POOL_SIZE frames or each with a private pool
+    of POOL_SIZE / workers buffers, so that both use the same memory.
+
+    Args:
+        directory (str): The database directory holding the file.
+        workers (int): The number of worker processes.
+        shared (bool): Whether the workers share a pool.
+
+    Returns:
+        Tuple[int, float]: The number of blocks read by all workers and the elapsed time in seconds.
+    """
+    pool: Optional[SharedBufferMgr] = None
+    if shared:
+        fm = FileMgr(directory, BLOCK_SIZE, cache_size=0)
+        pool = SharedBufferMgr(fm, LogMgr(fm, "simpledb.log"), POOL_SIZE)
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=worker, args=(directory, seed, POOL_SIZE // workers,
+                                                              pool.handle if pool else None, results))
+                 for seed in range(workers)]
+    start = time.perf_counter()
+    for p in processes:
+        p.start()
+    reads = sum(results.get() for _ in processes)
+    for p in processes:
+        p.join()
+    elapsed = time.perf_counter() - start
+    if pool:
+        pool.close()
+    return reads, elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        db_directory = os.path.join(base_directory, "sharedpoolbench")
+        create_file(db_directory, BLOCK_SIZE, NUM_BLOCKS, FILENAME)
+
+        print(f"{PINS} pins per worker of {NUM_BLOCKS} blocks, {HOT_SHARE:.0%} to {HOT_BLOCKS} hot ones, "
+              f"{POOL_SIZE} frames in all")
+        print(f"{'workers':>8}{'private reads':>15}{'time':>8}{'shared reads':>14}{'time':>8}")
+        for count in WORKERS:
+            private_reads, private_time = run(db_directory, count, False)
+            shared_reads, shared_time = run(db_directory, count, True)
+            print(f"{count:>8}{private_reads:>15,}{private_time:>7.2f}s{shared_reads:>14,}{shared_time:>7.2f}s")
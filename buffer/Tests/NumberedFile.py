@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 04:40
+# @Author  : EvanWong
+# @File    : NumberedFile.py
+# @Project : TestDB
+from file.FileMgr import FileMgr
+from file.Page import Page
+
+
+def make_file(num_blocks: int, directory: str, **options) -> FileMgr:
+    """
+    Creates a file manager over a file named "testfile" whose blocks hold their own block number.
+
+    Args:
+        num_blocks (int): The number of blocks of the file.
+        directory (str): The database directory.
+        **options: Further arguments of the file manager; its cache is disabled unless cache_size is given.
+
+    Returns:
+        FileMgr: The file manager, with a block size of 400.
+    """
+    options.setdefault("cache_size", 0)
+    fm = FileMgr(directory, 400, **options)
+    p = Page(fm.block_size)
+    for i in range(num_blocks):
+        p.set_int(0, i)
+        fm.write(fm.append("testfile"), p)
+    return fm
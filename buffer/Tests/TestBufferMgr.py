@@ -3,10 +3,17 @@
 # @Author  : EvanWong
 # @File    : TestBufferMgr.py
 # @Project : TestDB
+import threading
+import time
+
 from buffer.BufferAbortException import BufferAbortException
 from buffer.BufferMgr import BufferMgr
+from buffer.ReplacementStrategy import ReplacementStrategy
+from buffer.Tests.NumberedFile import make_file
 from file.BlockID import BlockID
 from file.FileMgr import FileMgr
+from file.Page import Page
+from file.Tests.TempDirectory import temp_directory
 from log.LogMgr import LogMgr
 
 
@@ -19,49 +26,369 @@ def test_buffer_manager():
     and proper exception handling when buffers are exhausted.
     """
     # Initialize FileMgr, LogMgr, and BufferMgr
-    fm = FileMgr("buffertest", 400)
-    lm = LogMgr(fm, "simpledb.log")
-    bm = BufferMgr(fm, lm, 3)  # Buffer pool with 3 buffers
+    with temp_directory("buffertest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 3)  # Buffer pool with 3 buffers
+
+        # Array to hold references to pinned buffers
+        buff = [None] * 6
 
-    # Array to hold references to pinned buffers
-    buff = [None] * 6
+        # Pin three blocks into the buffer pool
+        buff[0] = bm.pin(BlockID("testfile", 0))  # Pin block 0
+        buff[1] = bm.pin(BlockID("testfile", 1))  # Pin block 1
+        buff[2] = bm.pin(BlockID("testfile", 2))  # Pin block 2
 
-    # Pin three blocks into the buffer pool
-    buff[0] = bm.pin(BlockID("testfile", 0))  # Pin block 0
-    buff[1] = bm.pin(BlockID("testfile", 1))  # Pin block 1
-    buff[2] = bm.pin(BlockID("testfile", 2))  # Pin block 2
+        # Unpin block 1 and make it available
+        bm.unpin(buff[1])
+        buff[1] = None
 
-    # Unpin block 1 and make it available
-    bm.unpin(buff[1])
-    buff[1] = None
+        # Re-pin block 0, which should already be in the buffer
+        buff[3] = bm.pin(BlockID("testfile", 0))
 
-    # Re-pin block 0, which should already be in the buffer
-    buff[3] = bm.pin(BlockID("testfile", 0))
+        # Attempt to pin block 1 again, using an available buffer
+        buff[4] = bm.pin(BlockID("testfile", 1))
 
-    # Attempt to pin block 1 again, using an available buffer
-    buff[4] = bm.pin(BlockID("testfile", 1))
+        print("Available buffers:", bm.available)
 
-    print("Available buffers:", bm.available)
+        # Attempt to pin block 3 when all buffers are pinned (should raise exception)
+        try:
+            print("Attempting to pin block 3...")
+            buff[5] = bm.pin(BlockID("testfile", 3))
+        except BufferAbortException as e:
+            print("Exception: No available buffers\n")
 
-    # Attempt to pin block 3 when all buffers are pinned (should raise exception)
-    try:
-        print("Attempting to pin block 3...")
+        # Unpin block 2 to make a buffer available
+        bm.unpin(buff[2])
+        buff[2] = None
+
+        # Pin block 3 successfully after freeing a buffer
         buff[5] = bm.pin(BlockID("testfile", 3))
-    except BufferAbortException as e:
-        print("Exception: No available buffers\n")
 
-    # Unpin block 2 to make a buffer available
-    bm.unpin(buff[2])
-    buff[2] = None
+        print("Final Buffer Allocation:")
+        for i, buffer in enumerate(buff):
+            if buffer is not None:
+                print(f"buff[{i}] pinned to block {buffer.block}")
+
+
+def test_block_lookup():
+    """
+    Checks that pinning a resident block returns its buffer, and that a block whose buffer was
+    reassigned is read again from disk rather than found in its old buffer.
+    """
+    with temp_directory("lookuptest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 2)
+        blocks = [fm.append("testfile") for _ in range(3)]
+
+        buff = bm.pin(blocks[0])
+        buff.contents.set_int(0, 42)
+        buff.set_modified(1, -1)
+        bm.unpin(buff)
+        assert bm.pin(blocks[0]) is buff
+        bm.unpin(buff)
+
+        # Pinning two other blocks reuses the buffer of block 0, which is written back
+        for blk in blocks[1:]:
+            bm.unpin(bm.pin(blk))
+        assert buff.block != blocks[0]
+        buff = bm.pin(blocks[0])
+        assert buff.block == blocks[0] and buff.contents.get_int(0) == 42
+        bm.unpin(buff)
+
+
+def test_buffer_wait():
+    """
+    Checks that threads waiting for a buffer are served in arrival order as soon as one is
+    unpinned, and that a pin gives up after the configured wait.
+    """
+    with temp_directory("waittest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 1, max_wait=5)
+        blocks = [fm.append("testfile") for _ in range(3)]
+        held = bm.pin(blocks[0])
+        order = []
+
+        def waiter(blk: BlockID):
+            buff = bm.pin(blk)
+            order.append(blk.number)
+            time.sleep(0.01)
+            bm.unpin(buff)
+
+        threads = []
+        for blk in blocks[1:]:
+            threads.append(threading.Thread(target=waiter, args=(blk,)))
+            threads[-1].start()
+            time.sleep(0.05)  # Let the thread start waiting before the next one arrives
+        start = time.monotonic()
+        bm.unpin(held)
+        for t in threads:
+            t.join()
+        assert order == [1, 2]
+        assert time.monotonic() - start < 1
+        assert bm.waits == 2 and bm.timeouts == 0 and bm.wait_time > 0
+
+        bm2 = BufferMgr(fm, lm, 1, max_wait=0.1)
+        bm2.pin(blocks[0])
+        try:
+            bm2.pin(blocks[1])
+            assert False, "the pin should time out"
+        except BufferAbortException:
+            pass
+        assert bm2.timeouts == 1
+
+
+def test_flush_all():
+    """
+    Checks that committing a transaction writes only the buffers it dirtied, sorted by block, and
+    that buffers leave the dirty-page table once they are written back.
+    """
+    written = []
+
+    class RecordingFileMgr(FileMgr):
+        def write(self, blk, p):
+            if blk.filename == "testfile":  # Ignore log writes
+                written.append(blk)
+            super().write(blk, p)
+
+    with temp_directory("flushtest") as directory:
+        fm = RecordingFileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 8)
+        blocks = [fm.append("testfile") for _ in range(6)]
+        for i in (4, 1, 5, 2):  # Dirtied out of block order
+            buff = bm.pin(blocks[i])
+            buff.set_modified(1 if i != 5 else 2, lm.append(bytearray(4)))
+            bm.unpin(buff)
+        assert bm.dirty_count == 4
+
+        written.clear()
+        bm.flush_all(1)
+        assert [blk.number for blk in written] == [1, 2, 4]
+        assert bm.dirty_count == 1
+        bm.flush_all(1)
+        assert len(written) == 3  # Nothing is left to write
+
+        # Evicting the last dirty buffer writes it back and removes it from the table
+        bm2 = BufferMgr(fm, lm, 1)
+        buff = bm2.pin(blocks[0])
+        buff.set_modified(3, -1)
+        bm2.unpin(buff)
+        assert bm2.dirty_count == 1
+        bm2.unpin(bm2.pin(blocks[3]))
+        assert bm2.dirty_count == 0
+
+
+def test_prewarm():
+    """
+    Saves the resident blocks, hottest first, and reads them back into the free buffers of a
+    new pool, skipping resident blocks and blocks beyond the end of the file.
+    """
+    with temp_directory("prewarmtest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        p = Page(fm.block_size)
+        for i in range(20):
+            p.set_int(0, i)
+            fm.write(fm.append("testfile"), p)
+        bm = BufferMgr(fm, lm, 8, read_ahead=0)
+        for n in (3, 9, 5, 12, 7, 9):
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        assert [blk.number for blk in bm.resident_blocks()] == [9, 7, 12, 5, 3]
+
+        with temp_directory("warm") as path:
+            bm.save_resident(path)
+            blocks = BufferMgr.load_resident(path)
+            assert blocks == bm.resident_blocks()
+            assert BufferMgr.load_resident(path + ".missing") == []
+
+            bm = BufferMgr(fm, lm, 4, read_ahead=0)
+            bm.unpin(bm.pin(BlockID("testfile", 7)))
+            assert bm.prewarm(blocks + [BlockID("testfile", 50)]) == 3  # Block 3 does not fit any more
+            assert [blk.number for blk in bm.resident_blocks()] == [9, 12, 5, 7]
+            for n in (5, 9, 12):
+                buff = bm.pin(BlockID("testfile", n))
+                assert buff.contents.get_int(0) == n
+                bm.unpin(buff)
+            assert bm.misses == 1 and bm.hits == 3
+
+
+def test_resize():
+    """
+    Grows and shrinks a pool in use with every replacement policy: growing wakes a waiting
+    thread, shrinking writes evicted modifications back and removes pinned buffers only once
+    they are unpinned.
+    """
+    with temp_directory("resizetest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        blocks = [fm.append("testfile") for _ in range(8)]
+        for strategy in ReplacementStrategy:
+            bm = BufferMgr(fm, lm, 4, strategy=strategy, read_ahead=0)
+            pinned = [bm.pin(blocks[0]), bm.pin(blocks[1])]
+            bm.unpin(bm.pin(blocks[2]))
+            buff = bm.pin(blocks[3])
+            buff.contents.set_int(0, strategy.value + 100)
+            buff.set_modified(1, -1)
+            bm.unpin(buff)
+
+            bm.resize(6)
+            assert bm.buffer_count == 6 and bm.available == 4
+            bm.resize(2)
+            assert bm.buffer_count == 2 and bm.available == 0 and bm.dirty_count == 0
+            fm.wait_for_writes()
+            p = Page(fm.block_size)
+            fm.read(blocks[3], p)
+            assert p.get_int(0) == strategy.value + 100
+
+            bm.resize(1)  # Both buffers are pinned, so one goes when it is unpinned
+            assert bm.buffer_count == 2
+            bm.unpin(pinned[0])
+            assert bm.buffer_count == 1 and bm.available == 0
+
+            waiter = threading.Thread(target=lambda: bm.unpin(bm.pin(blocks[4])))
+            waiter.start()
+            time.sleep(0.05)
+            bm.resize(2)
+            waiter.join(2)
+            assert not waiter.is_alive() and bm.available == 1
+            bm.unpin(pinned[1])
+            assert bm.available == 2 and bm.timeouts == 0
+
+
+def test_reserve():
+    """
+    Keeps the blocks of a reserved file resident through a scan with every replacement policy,
+    limits reservations to a share of the pool, and evicts reserved blocks rather than time out.
+    """
+    with temp_directory("reservetest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        catalog = [fm.append("catalog") for _ in range(2)]
+        blocks = [fm.append("testfile") for _ in range(40)]
+        for strategy in ReplacementStrategy:
+            bm = BufferMgr(fm, lm, 8, max_wait=0.1, strategy=strategy, read_ahead=0)
+            assert bm.reserve("catalog", 3) == 2  # A quarter of the pool
+            assert bm.reserve("lookup", 1) == 0
+            for blk in catalog + blocks:
+                bm.unpin(bm.pin(blk))
+            hits = bm.hits
+            for blk in catalog:
+                bm.unpin(bm.pin(blk))
+            assert bm.hits == hits + 2, strategy
+            assert bm.resident_blocks()[:2] == catalog
+
+            pinned = [bm.pin(blk) for blk in blocks[:8]]  # Takes the reserved buffers last
+            assert bm.available == 0 and bm.timeouts == 0
+            for buff in pinned:
+                bm.unpin(buff)
+            bm.unpin(bm.pin(catalog[0]))
+            assert bm.reserve("catalog", 0) == 0
+            for blk in blocks:
+                bm.unpin(bm.pin(blk))
+            if strategy == ReplacementStrategy.LRU:  # The other policies keep blocks used twice through a scan
+                assert catalog[0] not in bm.resident_blocks()
+
+
+def test_reserve_lru_k():
+    """
+    Pinning a reserved block again must not make LRU-K count it as one more resident buffer,
+    which would let the access history grow with every pin. With a bounded history, a block
+    used twice long ago is forgotten, so it is evicted like a block used once.
+    """
+    with temp_directory("lrukreservetest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        fm.append("hot")
+        blocks = [fm.append("testfile") for _ in range(600)]
+        bm = BufferMgr(fm, lm, 4, strategy=ReplacementStrategy.LRU_K, read_ahead=0)
+        assert bm.reserve("hot", 1) == 1
+        bm.unpin(bm.pin(blocks[0]))
+        bm.unpin(bm.pin(blocks[0]))
+        for blk in blocks[3:]:
+            bm.unpin(bm.pin(BlockID("hot", 0)))
+            bm.unpin(bm.pin(blk))
+        for blk in blocks[:3]:  # Block 0 was evicted long ago, the others were never read
+            bm.unpin(bm.pin(blk))
+        bm.unpin(bm.pin(blocks[599]))  # Evicts the one of them accessed longest ago
+        misses = bm.misses
+        bm.unpin(bm.pin(blocks[0]))
+        assert bm.misses == misses + 1
+
+
+def test_reserve_repin():
+    """
+    A reserved block pinned again is a hit: once the reservation is full and the block is
+    handed back to 2Q or ARC, it is kept as a hot block through a scan instead of being
+    evicted as one read once.
+    """
+    with temp_directory("repintest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        hot = [fm.append("hot") for _ in range(2)]
+        blocks = [fm.append("testfile") for _ in range(20)]
+        for strategy in (ReplacementStrategy.TWO_Q, ReplacementStrategy.ARC):
+            bm = BufferMgr(fm, lm, 8, strategy=strategy, read_ahead=0)
+            assert bm.reserve("hot", 1) == 1
+            bm.unpin(bm.pin(hot[0]))  # Held for the reservation
+            buff = bm.pin(hot[0])
+            bm.unpin(bm.pin(hot[1]))  # Fills the reservation
+            bm.unpin(buff)
+            for blk in blocks:
+                bm.unpin(bm.pin(blk))
+            assert hot[0] in bm.resident_blocks(), strategy
+
+
+def test_read_without_latch():
+    """
+    Misses a block and checks that, while it is read, another thread can pin a resident block
+    and a thread pinning the same block waits for the read instead of reading it again.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(8, directory)
+        bm = BufferMgr(fm, LogMgr(fm, "simpledb.log"), 4, read_ahead=0)
+        bm.unpin(bm.pin(BlockID("testfile", 0)))
+        read = fm.read
+        reads = []
+        pinned = {}
+        waiters = []
+
+        def pin_block(n):
+            buff = bm.pin(BlockID("testfile", n))
+            pinned[n] = buff.contents.get_int(0)
+            bm.unpin(buff)
 
-    # Pin block 3 successfully after freeing a buffer
-    buff[5] = bm.pin(BlockID("testfile", 3))
+        def checked_read(blk, p):
+            reads.append(blk.number)
+            resident = threading.Thread(target=pin_block, args=(0,))
+            resident.start()
+            resident.join(5)
+            same = threading.Thread(target=pin_block, args=(1,))
+            same.start()
+            same.join(0.2)
+            assert not resident.is_alive() and same.is_alive()
+            read(blk, p)
+            waiters.append(same)
 
-    print("Final Buffer Allocation:")
-    for i, buffer in enumerate(buff):
-        if buffer is not None:
-            print(f"buff[{i}] pinned to block {buffer.block}")
+        fm.read = checked_read
+        buff = bm.pin(BlockID("testfile", 1))
+        fm.read = read
+        waiters[0].join(5)
+        assert buff.contents.get_int(0) == 1 and pinned == {0: 0, 1: 1}
+        assert reads == [1] and bm.misses == 2 and bm.hits == 2
+        bm.unpin(buff)
 
 
 if __name__ == "__main__":
     test_buffer_manager()
+    test_block_lookup()
+    test_buffer_wait()
+    test_flush_all()
+    test_prewarm()
+    test_resize()
+    test_reserve()
+    test_reserve_lru_k()
+    test_reserve_repin()
+    test_read_without_latch()
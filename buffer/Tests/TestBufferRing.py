@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 22:06
+# @Author  : EvanWong
+# @File    : TestBufferRing.py
+# @Project : TestDB
+
+from buffer.BufferMgr import BufferMgr
+from buffer.ReplacementStrategy import ReplacementStrategy
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def test_ring_keeps_working_set():
+    """
+    Scans many blocks through a ring and checks that the blocks pinned before the scan stay
+    resident, whatever the replacement policy, while the scan itself only keeps the last few blocks.
+    """
+    with temp_directory("ringtest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        for _ in range(100):
+            fm.append("testfile")
+        for strategy in ReplacementStrategy:
+            bm = BufferMgr(fm, lm, 16, strategy=strategy)
+            for n in range(8):
+                bm.unpin(bm.pin(BlockID("testfile", n)))
+            ring = bm.new_ring()
+            assert ring.size == 2
+            for n in range(20, 100):
+                buff = bm.pin(BlockID("testfile", n), ring)
+                assert buff.block.number == n
+                bm.unpin(buff)
+
+            hits = bm.hits
+            for n in range(8):
+                bm.unpin(bm.pin(BlockID("testfile", n)))
+            assert bm.hits == hits + 8, strategy.name
+            bm.unpin(bm.pin(BlockID("testfile", 99)))
+            assert bm.hits == hits + 9
+
+
+def test_ring_skips_pinned_buffer():
+    """
+    Checks that the ring does not reuse a buffer that someone else pinned, but takes another.
+    """
+    with temp_directory("ringtest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        for _ in range(10):
+            fm.append("testfile")
+        bm = BufferMgr(fm, lm, 8)
+        ring = bm.new_ring()  # A single buffer for a pool of 8
+        first = bm.pin(BlockID("testfile", 0), ring)
+        bm.unpin(first)
+        other = bm.pin(BlockID("testfile", 0))  # Another transaction uses the block
+        second = bm.pin(BlockID("testfile", 1), ring)
+        assert second is not first and other is first
+        bm.unpin(second)
+        assert bm.pin(BlockID("testfile", 2), ring) is second
+
+
+if __name__ == "__main__":
+    test_ring_keeps_working_set()
+    test_ring_skips_pinned_buffer()
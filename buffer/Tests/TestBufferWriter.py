@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 22:48
+# @Author  : EvanWong
+# @File    : TestBufferWriter.py
+# @Project : TestDB
+import time
+
+from buffer.BufferMgr import BufferMgr
+from buffer.BufferWriter import BufferWriter
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from file.Page import Page
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def dirty_blocks(bm: BufferMgr, lm: LogMgr, numbers: range):
+    """
+    Pins, modifies and unpins the given blocks, logging each modification.
+    """
+    for n in numbers:
+        buff = bm.pin(BlockID("testfile", n))
+        buff.contents.set_int(0, n + 1000)
+        buff.set_modified(1, lm.append(bytearray(8)))
+        bm.unpin(buff)
+
+
+def test_write_rounds():
+    """
+    Checks that a round writes the dirty buffers closest to eviction up to the page limit, so
+    that evicting them writes nothing, and that above the flush ratio every dirty buffer is written.
+    """
+    with temp_directory("writertest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        for _ in range(32):
+            fm.append("testfile")
+        bm = BufferMgr(fm, lm, 16, read_ahead=0)  # Only the pins below take buffers
+        dirty_blocks(bm, lm, range(16))
+        writer = BufferWriter(bm, max_pages=4, dirty_ratio=0.1, flush_ratio=1)
+
+        # The four buffers closest to eviction are written; after that they are clean
+        assert writer.write_round() == 4
+        assert bm.dirty_count == 12
+        assert writer.write_round() == 0
+
+        # Reading four blocks evicts the clean buffers without writing
+        for n in range(16, 20):
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        assert bm.dirty_evictions == 0
+        assert writer.write_round() == 4
+
+        fm.wait_for_writes()
+        p = Page(fm.block_size)
+        fm.read(BlockID("testfile", 0), p)
+        assert p.get_int(0) == 1000
+
+        # Above the flush ratio the page limit and the scan depth are lifted
+        assert BufferWriter(bm, max_pages=1, dirty_ratio=0.1, flush_ratio=0.2).write_round() == 8
+        assert bm.dirty_count == 0
+
+
+def test_writer_thread():
+    """
+    Lets the writer thread clean a pool that is mostly dirty.
+    """
+    with temp_directory("writertest") as directory:
+        fm = FileMgr(directory, 400)
+        lm = LogMgr(fm, "simpledb.log")
+        for _ in range(16):
+            fm.append("testfile")
+        bm = BufferMgr(fm, lm, 16)
+        writer = BufferWriter(bm, interval=0.01, max_pages=2)
+        writer.start()
+        dirty_blocks(bm, lm, range(16))
+        deadline = time.monotonic() + 5
+        while bm.dirty_count > 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.stop()
+        assert bm.dirty_count <= 1 and writer.rounds > 0
+
+
+if __name__ == "__main__":
+    test_write_rounds()
+    test_writer_thread()
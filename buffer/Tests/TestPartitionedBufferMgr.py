@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 01:20
+# @Author  : EvanWong
+# @File    : TestPartitionedBufferMgr.py
+# @Project : TestDB
+import random
+import threading
+
+from buffer.BufferAbortException import BufferAbortException
+from buffer.PartitionedBufferMgr import PartitionedBufferMgr
+from buffer.Tests.NumberedFile import make_file
+from file.BlockID import BlockID
+from file.Page import Page
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def test_concurrent_pins():
+    """
+    Pins random blocks from several threads and checks that every buffer holds its block and
+    that the statistics of the partitions add up.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(300, directory)
+        bm = PartitionedBufferMgr(fm, LogMgr(fm, "simpledb.log"), 50, partitions=4)
+        assert bm.partitions == 4 and bm.buffer_count == 50 and bm.available == 50
+        errors = []
+
+        def worker(seed: int):
+            rnd = random.Random(seed)
+            for _ in range(500):
+                n = rnd.randrange(300)
+                buff = bm.pin(BlockID("testfile", n))
+                if buff.block.number != n or buff.contents.get_int(0) != n:
+                    errors.append(n)
+                bm.unpin(buff)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors and bm.available == 50
+        assert bm.hits + bm.misses == 2000
+
+
+def test_scan_across_partitions():
+    """
+    Scans a file with and without a ring: reading ahead stops at the end of each stripe, so each
+    stripe costs a miss or two, and a ring only reuses buffers of the partition it pins in.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(300, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        stripes = -(-300 // PartitionedBufferMgr.STRIPE)
+        for use_ring in (False, True):
+            bm = PartitionedBufferMgr(fm, lm, 128, partitions=4)
+            ring = bm.new_ring() if use_ring else None
+            for n in range(300):
+                buff = bm.pin(BlockID("testfile", n), ring)
+                assert buff.block.number == n and buff.contents.get_int(0) == n
+                bm.unpin(buff)
+            assert bm.misses <= (1 if use_ring else 2) * stripes and bm.available == 128
+
+
+def test_partition_limits():
+    """
+    A partition whose buffers are all pinned cannot borrow buffers from the others.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(300, directory)
+        bm = PartitionedBufferMgr(fm, LogMgr(fm, "simpledb.log"), 4, max_wait=0.1, read_ahead=0, partitions=4)
+        first = bm.pin(BlockID("testfile", 0))
+        try:
+            bm.pin(BlockID("testfile", 1))  # Same stripe, hence same partition
+            assert False, "the partition has no buffer left"
+        except BufferAbortException:
+            pass
+        assert bm.timeouts == 1 and bm.available == 3
+        bm.unpin(first)
+
+
+def test_flush_all():
+    """
+    Flushes the buffers a transaction modified in every partition.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(300, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = PartitionedBufferMgr(fm, lm, 32, partitions=4)
+        for n in range(0, 300, 30):
+            buff = bm.pin(BlockID("testfile", n))
+            buff.contents.set_int(4, n + 1000)
+            buff.set_modified(1, -1)
+            bm.unpin(buff)
+        assert bm.dirty_count == 10
+        bm.flush_all(1)
+        assert bm.dirty_count == 0
+
+        p = Page(fm.block_size)
+        for n in range(0, 300, 30):
+            fm.read(BlockID("testfile", n), p)
+            assert p.get_int(4) == n + 1000
+
+
+if __name__ == "__main__":
+    test_concurrent_pins()
+    test_scan_across_partitions()
+    test_partition_limits()
+    test_flush_all()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 23:58
+# @Author  : EvanWong
+# @File    : TestReadAhead.py
+# @Project : TestDB
+from buffer.BufferMgr import BufferMgr
+from buffer.ReadAhead import ReadAhead
+from buffer.Tests.NumberedFile import make_file
+from file.BlockID import BlockID
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def scan(bm: BufferMgr, blocks, ring=None):
+    """
+    Pins and unpins the given blocks in order, checking that every buffer holds its block.
+    """
+    for n in blocks:
+        buff = bm.pin(BlockID("testfile", n), ring)
+        assert buff.block.number == n and buff.contents.get_int(0) == n
+        bm.unpin(buff)
+
+
+def test_window():
+    """
+    Checks that the window opens after two consecutive blocks, doubles up to the limit as the
+    reader catches up, shrinks when blocks are wasted and closes on a jump.
+    """
+    ra = ReadAhead()
+    assert ra.access(0, 16) == (1, 0)
+    assert ra.access(1, 16) == (2, 4)
+    assert ra.access(2, 16) == (6, 0)  # Blocks 3 to 5 are still ahead
+    assert ra.access(3, 16) == (6, 6) and ra.window == 8
+    for n in range(4, 8):
+        ra.access(n, 16)
+    assert ra.window == 16
+    ra.wasted()
+    assert ra.window == 8
+    assert ra.access(100, 16) == (101, 0) and ra.window == 0
+    assert ReadAhead().access(50, 16, sequential=True) == (51, 4)
+
+
+def test_sequential_scan():
+    """
+    Scans a file block by block: after the first two misses every block has been read ahead.
+    A scan through a ring is known to be sequential and reads ahead after its first miss.
+    """
+    for workers in (0, 2):
+        with temp_directory("buffertest") as directory:
+            fm = make_file(200, directory, io_workers=workers)
+            lm = LogMgr(fm, "simpledb.log")
+            bm = BufferMgr(fm, lm, 64)
+            scan(bm, range(200))
+            assert bm.misses == 2 and bm.prefetch_hits == 198
+            assert bm.prefetches <= 200 and bm.available == 64
+
+            bm = BufferMgr(fm, lm, 64)
+            scan(bm, range(200), bm.new_ring())
+            assert bm.misses == 1 and bm.prefetch_hits == 199
+
+            # A disabled read ahead and a random access pattern read nothing ahead
+            bm = BufferMgr(fm, lm, 64, read_ahead=0)
+            scan(bm, range(50))
+            assert bm.misses == 50 and bm.prefetches == 0
+            bm = BufferMgr(fm, lm, 64)
+            scan(bm, [(n * 37) % 200 for n in range(50)])
+            assert bm.prefetches == 0
+
+
+def test_read_after_write():
+    """
+    Modifies blocks through a small pool, so that most are written back asynchronously when
+    evicted, and checks that reading them ahead afterwards returns the modified contents.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(64, directory, io_workers=2)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 16, read_ahead=0)
+        for n in range(64):
+            buff = bm.pin(BlockID("testfile", n))
+            buff.contents.set_int(4, n + 1000)
+            buff.set_modified(1, -1)
+            bm.unpin(buff)
+        bm.flush_all(1)
+
+        bm = BufferMgr(fm, lm, 16)
+        for n in range(64):
+            buff = bm.pin(BlockID("testfile", n))
+            assert buff.contents.get_int(4) == n + 1000
+            bm.unpin(buff)
+        assert bm.prefetches > 0
+
+
+if __name__ == "__main__":
+    test_window()
+    test_sequential_scan()
+    test_read_after_write()
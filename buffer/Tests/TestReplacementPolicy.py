@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 21:24
+# @Author  : EvanWong
+# @File    : TestReplacementPolicy.py
+# @Project : TestDB
+import random
+
+from buffer.BufferAbortException import BufferAbortException
+from buffer.BufferMgr import BufferMgr
+from buffer.ReplacementStrategy import ReplacementStrategy
+from buffer.Tests.NumberedFile import make_file
+from file.BlockID import BlockID
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def test_lru_order():
+    """
+    Checks that LRU evicts the buffer that was unpinned longest ago.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(4, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = BufferMgr(fm, lm, 3)
+        for n in (0, 1, 2, 0):
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        bm.unpin(bm.pin(BlockID("testfile", 3)))  # Evicts block 1
+        misses = bm.misses
+        bm.unpin(bm.pin(BlockID("testfile", 0)))
+        assert bm.misses == misses
+        bm.unpin(bm.pin(BlockID("testfile", 1)))
+        assert bm.misses == misses + 1
+
+
+def test_every_policy():
+    """
+    Runs a random workload that keeps some blocks pinned under every policy, checking that each
+    pin returns the right block and that a full pool of pinned buffers is never replaced.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(40, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        for strategy in ReplacementStrategy:
+            bm = BufferMgr(fm, lm, 8, max_wait=0, strategy=strategy)
+            rnd = random.Random(strategy.value)
+            held = []
+            for _ in range(2000):
+                n = rnd.randrange(40) if rnd.random() < 0.5 else rnd.randrange(8)
+                buff = bm.pin(BlockID("testfile", n))
+                assert buff.block.number == n and buff.contents.get_int(0) == n, strategy.name
+                held.append(buff)
+                if len(held) > rnd.randrange(1, 6):
+                    bm.unpin(held.pop(rnd.randrange(len(held))))
+            for buff in held:
+                bm.unpin(buff)
+            assert bm.available == 8 and bm.hits + bm.misses == 2000
+
+            pinned = [bm.pin(BlockID("testfile", n)) for n in range(8)]
+            try:
+                bm.pin(BlockID("testfile", 8))
+                assert False, f"{strategy.name} replaced a pinned buffer"
+            except BufferAbortException:
+                pass
+            for buff in pinned:
+                bm.unpin(buff)
+
+
+def test_scan_resistance():
+    """
+    Checks that a scan of blocks read once evicts a twice-used working set under LRU but not
+    under LRU-K and ARC.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(40, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        hits = {}
+        for strategy in (ReplacementStrategy.LRU, ReplacementStrategy.LRU_K, ReplacementStrategy.ARC):
+            bm = BufferMgr(fm, lm, 8, strategy=strategy, read_ahead=0)  # Hits must come from the policy
+            for n in list(range(4)) * 2 + list(range(4, 40)):
+                bm.unpin(bm.pin(BlockID("testfile", n)))
+            before = bm.hits
+            for n in range(4):
+                bm.unpin(bm.pin(BlockID("testfile", n)))
+            hits[strategy] = bm.hits - before
+        assert hits == {ReplacementStrategy.LRU: 0, ReplacementStrategy.LRU_K: 4, ReplacementStrategy.ARC: 4}
+
+
+if __name__ == "__main__":
+    test_lru_order()
+    test_every_policy()
+    test_scan_resistance()
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 03:40
+# @Author  : EvanWong
+# @File    : TestSharedBufferMgr.py
+# @Project : TestDB
+import gc
+import multiprocessing
+import os
+import threading
+
+from buffer.BufferAbortException import BufferAbortException
+from buffer.SharedBufferMgr import SharedBufferMgr
+from buffer.Tests.NumberedFile import make_file
+from file.BlockID import BlockID
+from file.FileMgr import FileMgr
+from file.Page import Page
+from file.Tests.TempDirectory import temp_directory
+from log.LogMgr import LogMgr
+
+
+def test_single_process():
+    """
+    Pins, evicts, writes back and discards blocks within one process.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(20, directory)
+        lm = LogMgr(fm, "simpledb.log")
+        bm = SharedBufferMgr(fm, lm, 4, max_wait=0.1)
+        assert bm.buffer_count == 4 and bm.available == 4
+        assert bm.reserve("testfile", 2) == 0 and bm.prefetches == 0
+        try:
+            bm.resize(8)
+            assert False, "the segment has a fixed size"
+        except ValueError:
+            pass
+        for n in range(20):
+            buff = bm.pin(BlockID("testfile", n))
+            assert buff.block.number == n and buff.contents.get_int(0) == n
+            bm.unpin(buff)
+        bm.unpin(bm.pin(BlockID("testfile", 19)))
+        assert bm.misses == 20 and bm.hits == 1
+
+        buff = bm.pin(BlockID("testfile", 5))
+        buff.contents.set_int(4, 105)
+        buff.set_modified(1, -1)
+        bm.unpin(buff)
+        for n in range(6, 12):  # Evicts block 5, writing it back
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        assert bm.dirty_evictions == 1 and bm.dirty_count == 0
+
+        buff = bm.pin(BlockID("testfile", 5))
+        assert buff.contents.get_int(4) == 105
+        buff.contents.set_int(4, 205)
+        buff.set_modified(2, -1)
+        bm.unpin(buff)
+        bm.flush_all(2)
+        p = Page(fm.block_size)
+        fm.read(BlockID("testfile", 5), p)
+        assert p.get_int(4) == 205 and bm.dirty_count == 0
+
+        pinned = [bm.pin(BlockID("testfile", n)) for n in range(4)]
+        try:
+            bm.pin(BlockID("testfile", 10))
+            assert False, "all frames are pinned"
+        except BufferAbortException:
+            pass
+        assert bm.timeouts == 1 and bm.available == 0
+        for buff in pinned:
+            bm.unpin(buff)
+        bm.discard_file("testfile")
+        assert bm.resident_blocks() == [] and bm.available == 4
+
+        del buff, pinned
+        gc.collect()
+        bm.close()
+
+
+def test_write_back_without_latch():
+    """
+    Evicts a modified frame and checks that another thread can take the latch while the frame
+    is written back.
+    """
+    with temp_directory("buffertest") as directory:
+        fm = make_file(8, directory)
+        bm = SharedBufferMgr(fm, LogMgr(fm, "simpledb.log"), 2)
+        latch = bm.handle[3]
+        free = []
+        write = fm.write
+
+        def try_latch():
+            acquired = latch.acquire(timeout=5)
+            if acquired:
+                latch.release()
+            free.append(acquired)
+
+        def checked_write(blk, p):
+            t = threading.Thread(target=try_latch)
+            t.start()
+            t.join()
+            write(blk, p)
+
+        buff = bm.pin(BlockID("testfile", 0))
+        buff.contents.set_int(4, 100)
+        buff.set_modified(1, -1)
+        bm.unpin(buff)
+        fm.write = checked_write
+        for n in range(1, 4):  # Evicts block 0, writing it back
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        fm.write = write
+        assert free == [True] and bm.dirty_evictions == 1
+        buff = bm.pin(BlockID("testfile", 0))
+        assert buff.contents.get_int(4) == 100
+        bm.unpin(buff)
+
+        del buff
+        gc.collect()
+        bm.close()
+
+
+def read_blocks(directory: str, handle, results: multiprocessing.Queue):
+    """
+    Attaches to a pool from another process and reports the first two integers of blocks 0 to 3
+    and the number of blocks it had to read.
+    """
+    fm = FileMgr(directory, 400, cache_size=0)
+    bm = SharedBufferMgr.attach(fm, LogMgr(fm, "worker.log"), handle)
+    values = []
+    for n in range(4):
+        buff = bm.pin(BlockID("testfile", n))
+        values.append((buff.contents.get_int(0), buff.contents.get_int(4)))
+        bm.unpin(buff)
+    results.put((values, bm.misses))
+    del buff
+    bm.close()
+
+
+def test_shared_between_processes():
+    """
+    A worker process sees the blocks read and modified by the creator without reading them
+    again, and the blocks it reads are resident for the creator.
+    """
+    with temp_directory("sharedtest") as directory:
+        fm = make_file(20, directory)
+        bm = SharedBufferMgr(fm, LogMgr(fm, "simpledb.log"), 8)
+        for n in range(2):
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        buff = bm.pin(BlockID("testfile", 0))
+        buff.contents.set_int(4, 100)  # Not written back
+        buff.set_modified(1, -1)
+        bm.unpin(buff)
+
+        results = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=read_blocks, args=(directory, bm.handle, results))
+        worker.start()
+        values, misses = results.get(timeout=30)
+        worker.join()
+        assert worker.exitcode == 0
+        assert values == [(0, 100), (1, 0), (2, 0), (3, 0)] and misses == 2
+
+        hits = bm.hits
+        for n in range(4):
+            bm.unpin(bm.pin(BlockID("testfile", n)))
+        assert bm.hits == hits + 4 and bm.misses == 2
+
+        del buff
+        gc.collect()
+        bm.close()
+
+
+def modify_and_exit(directory: str, handle):
+    """
+    Attaches to a pool from another process, modifies block 0 and exits without writing it back.
+    """
+    fm = FileMgr(directory, 400, cache_size=0)
+    bm = SharedBufferMgr.attach(fm, LogMgr(fm, "worker.log"), handle)
+    buff = bm.pin(BlockID("testfile", 0))
+    buff.contents.set_int(4, 100)
+    buff.set_modified(1, -1)
+    bm.unpin(buff)
+    os._exit(0)
+
+
+def test_frames_of_exited_process():
+    """
+    The frame a worker modified before exiting is evicted again, dropping its modification.
+    """
+    with temp_directory("sharedexittest") as directory:
+        fm = make_file(8, directory)
+        bm = SharedBufferMgr(fm, LogMgr(fm, "simpledb.log"), 2, max_wait=0.1)
+        worker = multiprocessing.Process(target=modify_and_exit, args=(directory, bm.handle))
+        worker.start()
+        worker.join()
+        if os.name == 'posix':  # Elsewhere the frame stays with the worker, which cannot be probed
+            for n in range(1, 8):
+                bm.unpin(bm.pin(BlockID("testfile", n)))
+            assert BlockID("testfile", 0) not in bm.resident_blocks()
+            buff = bm.pin(BlockID("testfile", 0))
+            assert buff.contents.get_int(4) == 0
+            bm.unpin(buff)
+            del buff
+        gc.collect()
+        bm.close()
+
+
+if __name__ == "__main__":
+    test_single_process()
+    test_write_back_without_latch()
+    test_shared_between_processes()
+    test_frames_of_exited_process()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 20:37
+# @Author  : EvanWong
+# @File    : TwoQPolicy.py
+# @Project : TestDB
+
+from collections import OrderedDict
+from itertools import chain
+from typing import Iterator, Optional, Tuple
+
+from buffer.Buffer import Buffer
+from buffer.ReplacementPolicy import ReplacementPolicy
+from file.BlockID import BlockID
+
+
+class TwoQPolicy(ReplacementPolicy):
+    """
+    Full 2Q replacement (Johnson and Shasha, 1994).
+
+    A block read for the first time enters A1in, a FIFO queue holding about IN_SHARE of the pool.
+    When it falls out of A1in, its ID is remembered in A1out, a FIFO queue of evicted block IDs
+    about OUT_SHARE the size of the pool. Only a block read again while remembered in A1out is
+    admitted to Am, the LRU queue of hot blocks. Blocks touched once, like those of a scan,
+    thus pass through A1in without displacing the blocks in Am.
+
+    Pinned buffers are skipped when looking for the oldest buffer of a queue; if the queue to
+    evict from holds only pinned buffers, the other queue is used.
+
+    Attributes:
+        __capacity (int): The number of buffers in the pool.
+        __a1in (OrderedDict[Buffer, None]): The buffers of blocks read once, oldest first.
+        __a1out (OrderedDict[BlockID, None]): The IDs of blocks evicted from A1in, oldest first.
+        __am (OrderedDict[Buffer, None]): The buffers of hot blocks, least recently used first.
+    """
+
+    IN_SHARE = 0.25  # Share of the pool targeted for A1in (Kin)
+    OUT_SHARE = 0.5  # Size of A1out relative to the pool (Kout)
+
+    def __init__(self, capacity: int):
+        """
+        Initializes empty queues sized for the given pool.
+
+        Args:
+            capacity (int): The number of buffers in the pool.
+        """
+        self.__capacity: int = capacity
+        self.__a1in: OrderedDict[Buffer, None] = OrderedDict()
+        self.__a1out: OrderedDict[BlockID, None] = OrderedDict()
+        self.__am: OrderedDict[Buffer, None] = OrderedDict()
+
+    def pinned(self, buff: Buffer, hit: bool):
+        """
+        Places a newly read block in Am if it was remembered in A1out and in A1in otherwise;
+        a hit in Am makes the buffer the most recently used one, a hit in A1in changes nothing.
+        A hit on a buffer in neither queue, such as one held for a reservation, places it in Am.
+
+        Args:
+            buff (Buffer): The pinned buffer.
+            hit (bool): Whether the block was resident.
+        """
+        if hit:
+            if buff in self.__am:
+                self.__am.move_to_end(buff)
+            elif buff not in self.__a1in:
+                self.__am[buff] = None
+        elif buff.block in self.__a1out:
+            del self.__a1out[buff.block]
+            self.__am[buff] = None
+        else:
+            self.__a1in[buff] = None
+
+    def unpinned(self, buff: Buffer):
+        """
+        Does nothing: the queues order buffers by access, not by unpinning.
+
+        Args:
+            buff (Buffer): The unpinned buffer.
+        """
+        pass
+
+    def choose_victim(self, blk: BlockID) -> Optional[Buffer]:
+        """
+        Evicts the oldest unpinned buffer of A1in, remembering its block in A1out, while A1in
+        exceeds its share of the pool, and the least recently used unpinned buffer of Am otherwise.
+
+        Args:
+            blk (BlockID): The block about to be read; not used by 2Q.
+
+        Returns:
+            Optional[Buffer]: The victim, or None if every buffer is pinned.
+        """
+        for queue in self.__eviction_order():
+            for buff in queue:
+                if not buff.is_pinned:
+                    del queue[buff]
+                    if queue is self.__a1in:
+                        self.__remember(buff.block)
+                    return buff
+        return None
+
+    def candidates(self) -> Iterator[Buffer]:
+        """
+        Yields the buffers of the queue evicted from first, oldest first, then those of the other queue.
+
+        Returns:
+            Iterator[Buffer]: The buffers in eviction order.
+        """
+        return chain(*self.__eviction_order())
+
+    def removed(self, buff: Buffer):
+        """
+        Forgets the buffer without remembering its block.
+
+        Args:
+            buff (Buffer): The emptied buffer.
+        """
+        self.__a1in.pop(buff, None)
+        self.__am.pop(buff, None)
+
+    def resized(self, capacity: int):
+        """
+        Adopts the new pool size, dropping the oldest IDs of A1out beyond its new size.
+
+        Args:
+            capacity (int): The new number of buffers in the pool.
+        """
+        self.__capacity = capacity
+        while len(self.__a1out) > max(1, int(capacity * self.OUT_SHARE)):
+            self.__a1out.popitem(last=False)
+
+    def __eviction_order(self) -> Tuple[OrderedDict, OrderedDict]:
+        """
+        Returns the queues in the order victims are taken from them: A1in first while it exceeds its share.
+
+        Returns:
+            Tuple[OrderedDict, OrderedDict]: The queue to evict from and the fallback queue.
+        """
+        if len(self.__a1in) > max(1, int(self.__capacity * self.IN_SHARE)):
+            return self.__a1in, self.__am
+        return self.__am, self.__a1in
+
+    def __remember(self, blk: BlockID):
+        """
+        Adds the ID of a block evicted from A1in to A1out, dropping the oldest ID if A1out is full.
+
+        Args:
+            blk (BlockID): The evicted block.
+        """
+        self.__a1out[blk] = None
+        if len(self.__a1out) > max(1, int(self.__capacity * self.OUT_SHARE)):
+            self.__a1out.popitem(last=False)
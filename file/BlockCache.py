@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 10:41
+# @Author  : EvanWong
+# @File    : BlockCache.py
+# @Project : TestDB
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from file.BlockID import BlockID
+
+
+class BlockCache:
+    """
+    A size-bounded cache of block contents with an LRU (Least Recently Used) eviction strategy.
+
+    The cache holds at most `capacity` bytes of block data. Entries are kept in an OrderedDict
+    ordered from least to most recently used, and the least recently used entries are evicted
+    whenever an insertion exceeds the budget. A capacity of 0 disables the cache entirely.
+    All operations hold a short internal lock, so the cache may be shared by concurrent readers.
+
+    Attributes:
+        __capacity (int): The maximum number of bytes the cache may hold.
+        __entries (OrderedDict): The cached blocks, least recently used first.
+        __size (int): The number of bytes currently held.
+        __hits (int): The number of lookups that found their block.
+        __misses (int): The number of lookups that did not find their block.
+        __evictions (int): The number of entries evicted to stay within the budget.
+        __lock (threading.Lock): Guards the entries and counters.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initializes an empty cache with the given byte budget.
+
+        Args:
+            capacity (int): The maximum number of bytes to cache. 0 disables caching.
+
+        Raises:
+            ValueError: If the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("cache capacity must not be negative.")
+        self.__capacity: int = capacity
+        self.__entries: OrderedDict[BlockID, bytearray] = OrderedDict()
+        self.__size: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get(self, blk: BlockID) -> Optional[bytearray]:
+        """
+        Looks up the cached contents of a block and marks it as most recently used.
+
+        Args:
+            blk (BlockID): The block to look up.
+
+        Returns:
+            bytearray | None: The cached contents, or None if the block is not cached.
+        """
+        with self.__lock:
+            data = self.__entries.get(blk)
+            if data is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__entries.move_to_end(blk)
+            return data
+
+    def put(self, blk: BlockID, data: bytearray):
+        """
+        Caches the contents of a block, evicting least recently used entries if needed.
+
+        Data larger than the whole budget is not cached.
+
+        Args:
+            blk (BlockID): The block whose contents are cached.
+            data (bytearray): The contents of the block. The cache keeps a reference to it.
+        """
+        if len(data) > self.__capacity:
+            return
+        with self.__lock:
+            self.__discard(blk)
+            self.__entries[blk] = data
+            self.__size += len(data)
+            while self.__size > self.__capacity:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__size -= len(evicted)
+                self.__evictions += 1
+
+    def remove(self, blk: BlockID):
+        """
+        Drops a block from the cache if it is present.
+
+        Args:
+            blk (BlockID): The block to drop.
+        """
+        with self.__lock:
+            self.__discard(blk)
+
+    def clear(self):
+        """
+        Drops every cached block. The counters are kept.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __discard(self, blk: BlockID):
+        """
+        Drops a block from the cache. The caller must hold the lock.
+
+        Args:
+            blk (BlockID): The block to drop.
+        """
+        data = self.__entries.pop(blk, None)
+        if data is not None:
+            self.__size -= len(data)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns whether the cache can hold anything at all.
+
+        Returns:
+            bool: True if the capacity is positive, False otherwise.
+        """
+        return self.__capacity > 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the byte budget of the cache.
+
+        Returns:
+            int: The maximum number of bytes the cache may hold.
+        """
+        return self.__capacity
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of bytes currently cached.
+
+        Returns:
+            int: The total size of all cached blocks.
+        """
+        return self.__size
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of successful lookups.
+
+        Returns:
+            int: The hit counter.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of failed lookups.
+
+        Returns:
+            int: The miss counter.
+        """
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Returns the number of entries evicted to stay within the budget.
+
+        Returns:
+            int: The eviction counter.
+        """
+        return self.__evictions
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached blocks.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self.__entries)
@@ -12,6 +12,7 @@ class BlockID:
     Attributes:
         __filename (str): The name of the file where the block is stored.
         __blk_num (int): The block number within the file.
+        __hash (int): The hash value, computed once since a BlockID never changes.
 
     """
 
@@ -25,6 +26,7 @@ class BlockID:
         """
         self.__filename = filename
         self.__blk_num = blk_num
+        self.__hash = hash((filename, blk_num))
 
     @property
     def filename(self) -> str:
@@ -71,4 +73,4 @@ class BlockID:
         Returns:
             int: The hash value for the BlockID.
         """
-        return hash(str(self))
+        return self.__hash
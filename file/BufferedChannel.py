@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 09:21
+# @Author  : EvanWong
+# @File    : BufferedChannel.py
+# @Project : TestDB
+
+import io
+import threading
+from typing import List
+
+from file.FileChannel import FileChannel
+
+
+class BufferedChannel(FileChannel):
+    """
+    A file channel that performs seek + read/write through a buffered file object.
+
+    The file position is shared state, so every operation holds the channel's lock and
+    concurrent accesses to the same file are serialized.
+
+    Attributes:
+        __file (io.BufferedRandom): The file object opened in 'rb+' mode.
+        __lock (threading.Lock): Guards the file position across the seek and the transfer.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens the file at the given path for reading and writing.
+
+        Args:
+            path (str): The path of an existing file.
+        """
+        self.__file: io.BufferedRandom = open(path, 'rb+')
+        self.__lock: threading.Lock = threading.Lock()
+
+    def read(self, offset: int, buffer: bytearray) -> int:
+        """
+        Seeks to the offset and reads directly into the provided buffer.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes actually read.
+        """
+        with self.__lock:
+            self.__file.seek(offset)
+            return self.__file.readinto(buffer) or 0
+
+    def read_vector(self, offset: int, buffers: List[bytearray]) -> int:
+        """
+        Seeks once and reads the whole range with a single read, then splits it over the buffers.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffers (List[bytearray]): The buffers to fill, in file order.
+
+        Returns:
+            int: The total number of bytes actually read.
+        """
+        with self.__lock:
+            self.__file.seek(offset)
+            data = self.__file.read(sum(len(b) for b in buffers))
+        view = memoryview(data)
+        for buffer in buffers:
+            n = min(len(buffer), len(view))
+            buffer[:n] = view[:n]
+            view = view[n:]
+        return len(data)
+
+    def write(self, offset: int, data: bytearray):
+        """
+        Seeks to the offset and writes the data, handing it to the operating system right away.
+
+        Args:
+            offset (int): The byte offset within the file to start writing.
+            data (bytearray): The data to write.
+        """
+        with self.__lock:
+            self.__file.seek(offset)
+            self.__file.write(data)
+            self.__file.flush()
+
+    def extend(self, size: int):
+        """
+        Grows the file to the given size, preallocating the space or appending zeros.
+
+        Args:
+            size (int): The new size of the file in bytes.
+        """
+        with self.__lock:
+            current_size = self.__file.seek(0, io.SEEK_END)
+            if size > current_size and not self._preallocate(self.__file.fileno(), current_size, size - current_size):
+                self.__file.write(bytes(size - current_size))
+                self.__file.flush()
+
+    def size(self) -> int:
+        """
+        Returns the current size of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        with self.__lock:
+            return self.__file.seek(0, io.SEEK_END)
+
+    def sync(self):
+        """
+        Flushes the file buffer and forces the file to stable storage.
+        """
+        with self.__lock:
+            self.__file.flush()
+            self._datasync(self.__file.fileno())
+
+    def close(self):
+        """
+        Closes the underlying file object.
+        """
+        with self.__lock:
+            self.__file.close()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 18:02
+# @Author  : EvanWong
+# @File    : DirectChannel.py
+# @Project : TestDB
+
+import mmap
+import os
+import threading
+from typing import List
+
+from file.FileChannel import FileChannel
+
+
+class DirectChannel(FileChannel):
+    """
+    A file channel that bypasses the operating system's page cache with `O_DIRECT` (Linux only).
+
+    Direct I/O moves data straight between the device and user memory, so blocks are no longer
+    cached a second time by the kernel. In exchange, the file offset, the transfer length and the
+    memory address of every request must be multiples of the device's logical sector size. Offsets
+    and lengths are whole blocks, which the file manager requires to be multiples of ALIGNMENT;
+    the memory comes from an anonymous mapping, which is always page-aligned. Each thread owns
+    such a scratch buffer: data is transferred through it with positional I/O, so, as with
+    `PositionalChannel`, no lock is needed.
+
+    Attributes:
+        __fd (int): The raw file descriptor opened with O_DIRECT.
+        __scratch (threading.local): The aligned scratch buffer of every thread.
+    """
+
+    ALIGNMENT = 4096  # Alignment satisfying every common logical sector size (512 B and 4 KiB)
+
+    def __init__(self, path: str):
+        """
+        Opens a raw file descriptor with O_DIRECT on the file at the given path.
+
+        Args:
+            path (str): The path of an existing file.
+
+        Raises:
+            OSError: If the file system does not support direct I/O.
+        """
+        self.__fd: int = os.open(path, os.O_RDWR | os.O_DIRECT)
+        self.__scratch: threading.local = threading.local()
+
+    @staticmethod
+    def supported() -> bool:
+        """
+        Returns whether the platform provides direct I/O.
+
+        Returns:
+            bool: True if `os.O_DIRECT` and positional I/O are available.
+        """
+        return hasattr(os, 'O_DIRECT') and hasattr(os, 'preadv')
+
+    def read(self, offset: int, buffer: bytearray) -> int:
+        """
+        Reads into the aligned scratch buffer, then copies the bytes into the caller's buffer.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes actually read.
+        """
+        with self.__aligned(len(buffer)) as view:
+            n = os.preadv(self.__fd, [view], offset)
+            memoryview(buffer)[:n] = view[:n]
+        return n
+
+    def read_vector(self, offset: int, buffers: List[bytearray]) -> int:
+        """
+        Reads the whole range with a single aligned `os.preadv`, then splits it over the buffers.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffers (List[bytearray]): The buffers to fill, in file order.
+
+        Returns:
+            int: The total number of bytes actually read.
+        """
+        with self.__aligned(sum(len(b) for b in buffers)) as view:
+            n = os.preadv(self.__fd, [view], offset)
+            position = 0
+            for buffer in buffers:
+                end = min(position + len(buffer), n)
+                if end <= position:
+                    break
+                memoryview(buffer)[:end - position] = view[position:end]
+                position = end
+        return n
+
+    def write(self, offset: int, data: bytearray):
+        """
+        Copies the data into the aligned scratch buffer and writes it from there.
+
+        Args:
+            offset (int): The byte offset within the file to start writing.
+            data (bytearray): The data to write; its length must be a multiple of ALIGNMENT.
+        """
+        with self.__aligned(len(data)) as view:
+            view[:] = data
+            written = 0
+            while written < len(view):  # pwrite may write fewer bytes than requested
+                written += os.pwrite(self.__fd, view[written:], offset + written)
+
+    def extend(self, size: int):
+        """
+        Grows the file to the given size, preallocating the space or letting the kernel zero-fill it.
+
+        Args:
+            size (int): The new size of the file in bytes.
+        """
+        current_size = self.size()
+        if size > current_size and not self._preallocate(self.__fd, current_size, size - current_size):
+            os.ftruncate(self.__fd, size)
+
+    def size(self) -> int:
+        """
+        Returns the current size of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return os.fstat(self.__fd).st_size
+
+    def sync(self):
+        """
+        Forces the file to stable storage. Direct writes skip the page cache, but the file's
+        metadata and the device's write cache still need to be flushed.
+        """
+        self._datasync(self.__fd)
+
+    def close(self):
+        """
+        Closes the file descriptor; closing a closed channel does nothing.
+        """
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def __aligned(self, length: int) -> memoryview:
+        """
+        Returns a view of the first bytes of the calling thread's scratch buffer, growing it if needed.
+
+        Args:
+            length (int): The number of bytes needed.
+
+        Returns:
+            memoryview: A page-aligned view of exactly `length` bytes.
+        """
+        scratch = getattr(self.__scratch, 'buffer', None)
+        if scratch is None or len(scratch) < length:
+            scratch = mmap.mmap(-1, max(length, self.ALIGNMENT))
+            self.__scratch.buffer = scratch
+        return memoryview(scratch)[:length]
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 09:15
+# @Author  : EvanWong
+# @File    : FileChannel.py
+# @Project : TestDB
+
+import os
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class FileChannel(ABC):
+    """
+    Abstract base class for the low-level I/O backend of a single database file.
+
+    A channel only knows about byte offsets; the `FileMgr` translates block IDs into offsets
+    and decides which channel implementation is used for a file.
+    """
+
+    @abstractmethod
+    def read(self, offset: int, buffer: bytearray) -> int:
+        """
+        Reads bytes starting at the given offset into the provided buffer.
+
+        Bytes of the buffer beyond the end of the file are left untouched.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes actually read.
+        """
+        pass
+
+    @abstractmethod
+    def read_vector(self, offset: int, buffers: List[bytearray]) -> int:
+        """
+        Reads a contiguous range of bytes starting at the given offset into several buffers,
+        filling them in order, with as few system calls as the backend allows.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffers (List[bytearray]): The buffers to fill, in file order.
+
+        Returns:
+            int: The total number of bytes actually read.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, offset: int, data: bytearray):
+        """
+        Writes the given data starting at the given offset, growing the file if needed.
+
+        Args:
+            offset (int): The byte offset within the file to start writing.
+            data (bytearray): The data to write.
+        """
+        pass
+
+    @abstractmethod
+    def extend(self, size: int):
+        """
+        Grows the file to the given size in bytes, filling the new space with zeros.
+
+        Implementations reserve the new space with `posix_fallocate` where available, so the
+        file system can lay out a whole extent at once instead of growing the file piecemeal.
+
+        Args:
+            size (int): The new size of the file in bytes.
+        """
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Returns the current size of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        pass
+
+    @abstractmethod
+    def sync(self):
+        """
+        Forces all data written through this channel to stable storage.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Releases the resources held by this channel. Closing a closed channel does nothing.
+        """
+        pass
+
+    def __del__(self):
+        """
+        Closes the channel once nothing refers to it any more, e.g. after the file manager
+        evicted it from its pool while another thread was still reading through it.
+        """
+        try:
+            self.close()
+        except AttributeError:
+            pass  # The constructor failed before the channel had anything to close
+
+    @staticmethod
+    def _datasync(fd: int):
+        """
+        Forces the data of a file to stable storage with `os.fdatasync`, falling back to
+        `os.fsync` on platforms that do not provide it.
+
+        Args:
+            fd (int): The file descriptor of the file.
+        """
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(fd)
+        else:
+            os.fsync(fd)
+
+    @staticmethod
+    def _preallocate(fd: int, offset: int, length: int) -> bool:
+        """
+        Reserves zero-filled disk space for a byte range of a file with `os.posix_fallocate`.
+
+        Args:
+            fd (int): The file descriptor of the file.
+            offset (int): The start of the range to reserve.
+            length (int): The length of the range to reserve.
+
+        Returns:
+            bool: True if the space was reserved, False if the platform or the file system does
+                not support preallocation and the caller has to fall back to writing zeros.
+        """
+        if not hasattr(os, 'posix_fallocate'):
+            return False
+        try:
+            os.posix_fallocate(fd, offset, length)
+            return True
+        except OSError:
+            return False
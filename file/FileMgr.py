@@ -4,61 +4,251 @@
 # @File    : FileMgr.py
 # @Project : TestDB
 
-import io
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+from file.BlockCache import BlockCache
 from file.BlockID import BlockID
+from file.BufferedChannel import BufferedChannel
+from file.DirectChannel import DirectChannel
+from file.FileChannel import FileChannel
+from file.IOMode import IOMode
+from file.MmapChannel import MmapChannel
 from file.Page import Page
+from file.PositionalChannel import PositionalChannel
+from file.SyncPolicy import SyncPolicy
 
 
 class FileMgr:
     """
     Manages file operations, including reading, writing, and appending blocks.
 
+    The actual byte-level I/O of every file goes through a `FileChannel`, whose implementation
+    is selected by the I/O mode given at construction time. Block reads and writes take no
+    FileMgr-wide lock: concurrent accesses are serialized by the channel only if its I/O mode
+    requires it, so with positional I/O several threads can read the same file in parallel.
+
+    The number of blocks of each file is tracked in memory: it is read from the file size the
+    first time the file is used and then kept up to date by appends and writes, so asking for
+    the size of a file never costs a system call.
+
+    At most `max_open_files` channels are kept open. They form an LRU pool: when a file has to be
+    opened and the pool is full, the least recently used channel is evicted, and the file is
+    reopened on demand. Evicting a channel only drops the pool's reference to it; a thread still
+    reading through the channel keeps it alive, and it is closed when the last reference goes away.
+
+    Files grow in extents: when an append runs past the space allocated to a file, the file is
+    extended by `extent_size` blocks at once, and the logical end of the file (the block count
+    reported by `block_num`) is tracked separately from the allocated space. `close` truncates
+    every file to its logical end, so a cleanly closed file has exactly its blocks. The files
+    that were grown by an extent since the last clean close are listed in EXTENTS_FILE; only
+    such a file, left behind by a crash, can end in unused preallocated space. When it is
+    opened, up to `extent_size - 1` trailing all-zero blocks are taken for that space and not
+    counted, as an extent never leaves more unused. Every other file counts all of its blocks.
+
+    Durability is governed by a sync policy. The file manager remembers which files were written
+    since they were last synced, and `force` makes them durable as the policy prescribes: not at
+    all, synchronously, or in batches by a background thread.
+
+    Besides the blocking `read` and `write`, blocks can be read and written asynchronously by a
+    small pool of I/O threads, so a caller can overlap disk I/O with its own work. Asynchronous
+    writes are tracked per block until they complete: a read, a write or a sync of the same block
+    or file waits for them first, so callers never observe the writes out of order.
+
+    Files whose names start with TEMP_PREFIX hold temporary data, such as materialized query
+    results, that does not survive the query. The prefix ends with a character that cannot occur
+    in an identifier, so no table or index is mistaken for temporary data. Temporary files are
+    handed out by `next_temp_name`, named after the process using them, never synced, removed by
+    `remove` once used, and deleted at startup if a crash left any behind.
+
     Attributes:
-        __opened_files (dict): A dictionary tracking opened file handles for reuse.
+        __opened_files (OrderedDict): The open file channels, least recently used first.
+        __max_open_files (int): The number of channels kept open before the least recently used is evicted.
+        __file_opens (int): The number of channels opened so far.
+        __file_evictions (int): The number of channels evicted to make room for others.
         __db_directory (str): The path to the database directory where files are stored.
         __block_size (int): The size of each block in bytes.
+        __io_mode (IOMode): The I/O backend used for every opened file.
         __is_new (bool): A flag indicating whether the database was newly created.
-        __cache (dict): A cache that stores recently read blocks to reduce disk I/O.
+        __cache (BlockCache): A size-bounded cache that stores recently read blocks to reduce disk I/O.
+        __block_counts (dict): The logical number of blocks of every file used so far.
+        __allocated_blocks (dict): The number of blocks allocated on disk for every file used so far.
+        __extent_size (int): The number of blocks a file grows by when it runs out of allocated space.
+        __preallocated (set): The files grown by an extent since the last clean close, as listed in EXTENTS_FILE.
+        __sync_policy (SyncPolicy): What `force` does to make written files durable.
+        __sync_interval (float): The batching window of the group sync thread, in seconds.
+        __unsynced (set): The names of the files written since they were last synced.
+        __group_last (Optional[str]): The file the group sync thread must sync after all others.
+        __sync_requested (threading.Event): Wakes up the group sync thread.
+        __syncer (Optional[threading.Thread]): The group sync thread, started on first use.
+        __stopping (bool): Tells the group sync thread to exit.
+        __io_workers (int): The number of threads serving asynchronous I/O; 0 makes it synchronous.
+        __executor (Optional[ThreadPoolExecutor]): The pool of I/O threads, started on first use.
+        __pending_writes (dict): The latest uncompleted asynchronous write of every block.
+        __next_temp_num (int): The number of the next temporary file name.
+        __lock (threading.RLock): Guards the table of opened files and makes appends atomic.
     """
 
-    TEMP_PREFIX = 'temp'
-
-    def __init__(self, db_directory: str, block_size: int):
+    TEMP_PREFIX = 'temp-'  # Identifiers are alphanumeric, so no table file starts with it
+    EXTENTS_FILE = 'simpledb.extents'  # Lists the files that may end in preallocated space
+    DEFAULT_CACHE_SIZE = 1 << 20  # Default byte budget of the block cache (1 MiB)
+    DEFAULT_SYNC_INTERVAL = 0.01  # Default batching window of the GROUP sync policy (seconds)
+    DEFAULT_IO_WORKERS = 4  # Default number of threads serving asynchronous reads and writes
+    DEFAULT_MAX_OPEN_FILES = 128  # Default number of file channels kept open
+
+    def __init__(self, db_directory: str, block_size: int, io_mode: IOMode = IOMode.BUFFERED,
+                 cache_size: int = DEFAULT_CACHE_SIZE, extent_size: int = 1,
+                 sync_policy: SyncPolicy = SyncPolicy.NONE, sync_interval: float = DEFAULT_SYNC_INTERVAL,
+                 io_workers: int = DEFAULT_IO_WORKERS, max_open_files: int = DEFAULT_MAX_OPEN_FILES):
         """
         Initializes a FileMgr instance to manage file I/O operations.
 
         Args:
             db_directory (str): The directory where the database files are stored.
             block_size (int): The size of each block in bytes.
+            io_mode (IOMode): The I/O backend to use. Defaults to buffered seek + read/write.
+            cache_size (int): The byte budget of the block cache. 0 disables the cache, which is
+                the sensible choice once the buffer pool is large enough to hold the working set.
+                The cache is always disabled in mmap mode, where the mapping already serves that purpose,
+                and in direct mode, whose point is to leave caching to the buffer pool alone.
+            extent_size (int): The number of blocks to allocate whenever a file has to grow.
+                Defaults to 1, i.e. one block per append.
+            sync_policy (SyncPolicy): The durability mode applied by `force`. Defaults to no syncing.
+            sync_interval (float): The maximum time, in seconds, a forced write waits for its
+                group sync under the GROUP policy.
+            io_workers (int): The number of threads serving `read_async` and `write_async`.
+                0 performs asynchronous requests on the calling thread.
+            max_open_files (int): The number of file channels kept open. Each channel holds one
+                file descriptor (two in mmap mode, for the file and the mapping).
+
+        Raises:
+            ValueError: If the extent size or the number of open files is not positive, or the
+                number of I/O workers is negative,
+                or if direct I/O is requested on a platform without it or with a block size that is
+                not a multiple of `DirectChannel.ALIGNMENT`.
         """
+        if extent_size < 1:
+            raise ValueError("extent size must be at least one block.")
+        if io_workers < 0:
+            raise ValueError("number of I/O workers must not be negative.")
+        if max_open_files < 1:
+            raise ValueError("at least one file must be allowed to be open.")
+        if io_mode == IOMode.DIRECT:
+            if not DirectChannel.supported():
+                raise ValueError("direct I/O is not supported on this platform.")
+            if block_size % DirectChannel.ALIGNMENT != 0:
+                raise ValueError(f"direct I/O needs a block size that is a multiple of {DirectChannel.ALIGNMENT}.")
         self.__db_directory = db_directory
         self.__block_size = block_size
+        self.__io_mode = io_mode
         self.__is_new = not os.path.exists(db_directory)
-        self.__opened_files: [str, io.BufferedRandom] = {}
-        self.__cache: [BlockID, bytearray] = {}  # Cache for recently read blocks
+        self.__opened_files: OrderedDict[str, FileChannel] = OrderedDict()
+        self.__max_open_files: int = max_open_files
+        self.__file_opens: int = 0
+        self.__file_evictions: int = 0
+        self.__block_counts: [str, int] = {}
+        self.__allocated_blocks: [str, int] = {}
+        self.__extent_size = extent_size
+        self.__sync_policy: SyncPolicy = sync_policy
+        self.__sync_interval: float = sync_interval
+        self.__unsynced: set[str] = set()
+        self.__group_last: Optional[str] = None
+        self.__sync_requested: threading.Event = threading.Event()
+        self.__syncer: Optional[threading.Thread] = None
+        self.__stopping: bool = False
+        self.__cache: BlockCache = BlockCache(0 if io_mode in (IOMode.MMAP, IOMode.DIRECT) else cache_size)
+        self.__io_workers: int = io_workers
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__pending_writes: Dict[BlockID, Future] = {}
+        self.__next_temp_num: int = 0
+        self.__lock: threading.RLock = threading.RLock()
 
         if self.__is_new:
             os.makedirs(db_directory)  # Create the directory if it doesn't exist.
         self.__cleanup_temp_files()  # Cleanup any leftover temporary files.
+        self.__preallocated: set[str] = self.__load_preallocated()
+
+    def __load_preallocated(self) -> set[str]:
+        """
+        Reads the files that a crash may have left with unused preallocated space from EXTENTS_FILE.
+
+        Returns:
+            set[str]: The names of the files, empty if the database was closed cleanly.
+        """
+        path = os.path.join(self.__db_directory, self.EXTENTS_FILE)
+        if not os.path.exists(path):
+            return set()
+        with open(path) as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def __save_preallocated(self):
+        """
+        Writes the files that may end in preallocated space to EXTENTS_FILE and syncs it, so that
+        the list reaches the disk before the space it describes.
+        """
+        with open(os.path.join(self.__db_directory, self.EXTENTS_FILE), 'w') as f:
+            f.writelines(f"{filename}\n" for filename in sorted(self.__preallocated))
+            f.flush()
+            os.fsync(f.fileno())
 
     def __cleanup_temp_files(self):
         """
-        Removes temporary files from the database directory that start with the 'temp' prefix.
-        This ensures that no unnecessary temporary files are left behind.
+        Removes the temporary files left in the database directory by this process or by processes
+        that are no longer running. Processes sharing the directory, such as the workers of a
+        `SharedBufferMgr`, keep the files they are using.
         """
         for filename in os.listdir(self.__db_directory):
-            if filename.startswith(self.TEMP_PREFIX):
+            if self.is_temp(filename) and not self.__owner_running(filename):
                 os.remove(os.path.join(self.__db_directory, filename))
 
+    @staticmethod
+    def __owner_running(filename: str) -> bool:
+        """
+        Returns whether another process that may still use a temporary file is running. The
+        process ID is part of the names handed out by `next_temp_name`.
+
+        Args:
+            filename (str): The name of a temporary file.
+
+        Returns:
+            bool: True if the file belongs to another process that is still running.
+        """
+        pid = filename[len(FileMgr.TEMP_PREFIX):].split('-', 1)[0]
+        return pid.isdigit() and int(pid) != os.getpid() and FileMgr.process_running(int(pid))
+
+    @staticmethod
+    def process_running(pid: int) -> bool:
+        """
+        Returns whether a process is running. Where processes cannot be probed without signalling
+        them, every process is assumed to be running.
+
+        Args:
+            pid (int): The process ID.
+
+        Returns:
+            bool: True unless the process is known to have exited.
+        """
+        if os.name != 'posix':
+            return True
+        try:
+            os.kill(pid, 0)  # Signal 0 only checks that the process exists
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # It exists, but belongs to another user
+        return True
+
     def read(self, blk: BlockID, p: Page):
         """
         Reads the contents of a block into the provided Page, with caching for faster access.
 
         This method retrieves the data of the specified block and writes it into the given
         page object for further processing. The method caches recently read blocks to reduce
-        disk I/O operations.
+        disk I/O operations, within the byte budget of the cache.
 
         Args:
             blk (BlockID): The block ID representing the block to be read.
@@ -67,23 +257,63 @@ class FileMgr:
         Raises:
             RuntimeError: If an error occurs while reading from the file.
         """
+        if self.__pending_writes:
+            self.__wait_for_write(blk)
         # Check cache first
-        if blk in self.__cache:
+        cached = self.__cache.get(blk) if self.__cache.enabled else None
+        if cached is not None:
             # If the block is in the cache, directly write it to the Page
-            p.write_content(self.__cache[blk])
+            p.write_content(cached)
         else:
             # If not cached, perform disk read operation
             try:
                 f = self.__get_file(blk.filename)
-                f.seek(blk.number * self.__block_size)  # Seek to the block's position
-                buffer = bytearray(f.read(self.__block_size))  # Read the block's data into a buffer
-                p.write_content(buffer)  # Write the data into the Page object
+                # Read the block's data directly into the Page object
+                n = f.read(blk.number * self.__block_size, p.content)
 
                 # Cache the read content for future access
-                self.__cache[blk] = buffer
+                if self.__cache.enabled:
+                    self.__cache.put(blk, p.content[:n])
             except IOError as e:
                 raise RuntimeError(f"Cannot read block {blk}") from e
 
+    def read_range(self, filename: str, first_blk: int, count: int, pages: List[Page]) -> int:
+        """
+        Reads a run of consecutive blocks into the provided pages with a single vectored read.
+
+        This is meant for sequential scans, which can fetch many blocks per I/O instead of one.
+        The block cache is neither consulted nor filled, so a large scan does not push the
+        blocks of other queries out of it. The run is cut short at the end of the file. Like
+        `read`, the read waits for earlier asynchronous writes of the blocks first.
+
+        Args:
+            filename (str): The name of the file to read from.
+            first_blk (int): The number of the first block to read.
+            count (int): The number of blocks to read.
+            pages (List[Page]): The pages to fill; page i receives block first_blk + i.
+
+        Returns:
+            int: The number of blocks actually read.
+
+        Raises:
+            ValueError: If fewer pages than blocks are provided.
+            RuntimeError: If an error occurs while reading from the file.
+        """
+        if len(pages) < count:
+            raise ValueError("not enough pages for the requested range.")
+        count = max(0, min(count, self.block_num(filename) - first_blk))
+        if count == 0:
+            return 0
+        if self.__pending_writes:
+            for blk_num in range(first_blk, first_blk + count):
+                self.__wait_for_write(BlockID(filename, blk_num))
+        try:
+            f = self.__get_file(filename)
+            n = f.read_vector(first_blk * self.__block_size, [p.content for p in pages[:count]])
+            return n // self.__block_size
+        except IOError as e:
+            raise RuntimeError(f"Cannot read blocks {first_blk}-{first_blk + count - 1} of {filename}") from e
+
     def write(self, blk: BlockID, p: Page):
         """
         Writes the contents of the provided Page into a block with delayed write strategy.
@@ -91,6 +321,21 @@ class FileMgr:
         This method uses a lazy write strategy to minimize frequent disk writes. The data is
         written to the file only when necessary (e.g., when the block is evicted from cache).
 
+        Args:
+            blk (BlockID): The block ID representing the block to write to.
+            p (Page): The page object containing the data to write.
+
+        Raises:
+            RuntimeError: If an error occurs while writing to the file.
+        """
+        if self.__pending_writes:
+            self.__wait_for_write(blk)
+        self.__write_block(blk, p)
+
+    def __write_block(self, blk: BlockID, p: Page):
+        """
+        Writes a page to a block without waiting for earlier asynchronous writes of the block.
+
         Args:
             blk (BlockID): The block ID representing the block to write to.
             p (Page): The page object containing the data to write.
@@ -100,22 +345,221 @@ class FileMgr:
         """
         try:
             f = self.__get_file(blk.filename)
-            f.seek(blk.number * self.__block_size)  # Seek to the block's position
-            f.write(p.content)  # Write the content to the block
+            f.write(blk.number * self.__block_size, p.content)  # Write the content to the block
 
             # After write, we can remove this block from cache since it's been flushed to disk
-            if blk in self.__cache:
-                self.__cache.pop(blk)
+            self.__cache.remove(blk)
+            self.__mark_unsynced(blk.filename)
+
+            # Writing past the end of the file grows it
+            if blk.number >= self.block_num(blk.filename):
+                with self.__lock:
+                    self.__block_counts[blk.filename] = max(self.__block_counts[blk.filename], blk.number + 1)
+                    self.__allocated_blocks[blk.filename] = max(self.__allocated_blocks[blk.filename],
+                                                                blk.number + 1)
 
         except IOError as e:
             raise RuntimeError(f"Cannot write block {blk}") from e
 
+    def read_async(self, blk: BlockID, p: Page) -> Future:
+        """
+        Reads a block into the provided page on an I/O thread.
+
+        The page must not be used until the returned future is done. Like `read`, the read
+        waits for earlier asynchronous writes of the block, so it sees their data.
+
+        Args:
+            blk (BlockID): The block ID representing the block to be read.
+            p (Page): The page object that will hold the content of the block.
+
+        Returns:
+            Future: A future whose result is the filled page, or whose exception is the
+                RuntimeError raised by the read.
+        """
+        if self.__io_workers == 0:
+            return self.__run_now(self.__read_page, blk, p)
+        return self.__get_executor().submit(self.__read_page, blk, p)
+
+    def read_range_async(self, filename: str, first_blk: int, count: int, pages: List[Page]) -> Future:
+        """
+        Reads a run of consecutive blocks into the provided pages on an I/O thread, as `read_range` does.
+
+        The pages must not be used until the returned future is done.
+
+        Args:
+            filename (str): The name of the file to read from.
+            first_blk (int): The number of the first block to read.
+            count (int): The number of blocks to read.
+            pages (List[Page]): The pages to fill; page i receives block first_blk + i.
+
+        Returns:
+            Future: A future whose result is the number of blocks actually read, or whose exception
+                is the RuntimeError raised by the read.
+        """
+        if self.__io_workers == 0:
+            return self.__run_now(self.read_range, filename, first_blk, count, pages)
+        return self.__get_executor().submit(self.read_range, filename, first_blk, count, pages)
+
+    def write_async(self, blk: BlockID, p: Page) -> Future:
+        """
+        Writes the contents of the provided page into a block on an I/O thread.
+
+        The contents are copied before the method returns, so the caller may reuse the page
+        right away, e.g. to read another block into it. Asynchronous writes of the same block
+        are applied in the order they were requested.
+
+        Args:
+            blk (BlockID): The block ID representing the block to write to.
+            p (Page): The page object containing the data to write.
+
+        Returns:
+            Future: A future that is done once the block has been written, or whose exception
+                is the RuntimeError raised by the write.
+        """
+        snapshot = Page(p.content)
+        if self.__io_workers == 0:
+            return self.__run_now(self.write, blk, snapshot)
+        with self.__lock:
+            previous = self.__pending_writes.get(blk)
+            # The pool serves requests in order, so the previous write is already running
+            # by the time this one starts waiting for it
+            future = self.__get_executor().submit(self.__write_after, previous, blk, snapshot)
+            self.__pending_writes[blk] = future
+        future.add_done_callback(lambda f: self.__forget_write(blk, f))
+        return future
+
+    def wait_for_writes(self, filename: Optional[str] = None):
+        """
+        Blocks until the asynchronous writes requested so far have completed.
+
+        Args:
+            filename (Optional[str]): Only waits for the writes of this file if given.
+
+        Raises:
+            RuntimeError: If one of the writes failed.
+        """
+        with self.__lock:
+            pending = [(blk, f) for blk, f in self.__pending_writes.items()
+                       if filename is None or blk.filename == filename]
+        for blk, future in pending:
+            self.__check_write(blk, future)
+
+    def __read_page(self, blk: BlockID, p: Page) -> Page:
+        """
+        The body of an asynchronous read.
+
+        Args:
+            blk (BlockID): The block to read.
+            p (Page): The page to fill.
+
+        Returns:
+            Page: The filled page.
+        """
+        self.read(blk, p)
+        return p
+
+    def __write_after(self, previous: Optional[Future], blk: BlockID, p: Page):
+        """
+        The body of an asynchronous write: waits for the previous write of the block, then writes it.
+
+        Args:
+            previous (Optional[Future]): The asynchronous write of the block requested before this one.
+            blk (BlockID): The block to write to.
+            p (Page): The private copy of the page to write.
+        """
+        if previous is not None:
+            previous.exception()  # A failure is reported by the previous future itself
+        self.__write_block(blk, p)
+
+    def __wait_for_write(self, blk: BlockID):
+        """
+        Waits for the pending asynchronous write of a block, if there is one.
+
+        Args:
+            blk (BlockID): The block about to be accessed.
+
+        Raises:
+            RuntimeError: If the pending write failed.
+        """
+        future = self.__pending_writes.get(blk)
+        if future is not None:
+            self.__check_write(blk, future)
+
+    def __check_write(self, blk: BlockID, future: Future):
+        """
+        Waits for an asynchronous write and reports its failure.
+
+        A failed write stays tracked until it has been reported once, so the failure of a write
+        nobody waited for, such as the write-back of an evicted buffer, is not lost.
+
+        Args:
+            blk (BlockID): The written block.
+            future (Future): The write to wait for.
+
+        Raises:
+            RuntimeError: If the write failed.
+        """
+        e = future.exception()
+        if e is not None:
+            with self.__lock:
+                if self.__pending_writes.get(blk) is future:
+                    del self.__pending_writes[blk]
+            raise e
+
+    def __forget_write(self, blk: BlockID, future: Future):
+        """
+        Stops tracking a successful asynchronous write, unless a later write of the block replaced it.
+
+        Args:
+            blk (BlockID): The written block.
+            future (Future): The completed write.
+        """
+        if future.exception() is not None:
+            return
+        with self.__lock:
+            if self.__pending_writes.get(blk) is future:
+                del self.__pending_writes[blk]
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the pool of I/O threads, starting it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The pool serving asynchronous reads and writes.
+        """
+        if self.__executor is None:
+            with self.__lock:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(self.__io_workers, thread_name_prefix="FileMgr-io")
+        return self.__executor
+
+    @staticmethod
+    def __run_now(fn, *args) -> Future:
+        """
+        Performs an I/O request on the calling thread and wraps its outcome in a completed future.
+
+        Args:
+            fn: The function performing the request.
+            *args: The arguments of the request, such as the block to access and the page to
+                read into or write from.
+
+        Returns:
+            Future: A done future holding the result of the request, or the exception it raised.
+        """
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except RuntimeError as e:
+            future.set_exception(e)
+        return future
+
     def append(self, filename: str) -> BlockID:
         """
         Appends a new block to the specified file.
 
-        This method adds a new block to the file by appending a block of empty space
-        and returning the new block ID.
+        This method adds a new block to the file and returns the new block ID. The block is
+        taken from the space preallocated by an earlier append if there is any left; otherwise
+        the file is grown by a whole extent of empty blocks.
 
         Args:
             filename (str): The name of the file to append the new block to.
@@ -126,48 +570,311 @@ class FileMgr:
         Raises:
             IOError: If an error occurs when unable to append a new block.
         """
-        new_blk_num: int = self.block_num(filename)  # Get the current number of blocks in the file
-        blk: BlockID = BlockID(filename, new_blk_num)  # Create a new block ID
-        b: bytearray = bytearray(self.__block_size)  # Create an empty byte array for the block content
+        with self.__lock:
+            new_blk_num: int = self.block_num(filename)  # Get the current number of blocks in the file
+            blk: BlockID = BlockID(filename, new_blk_num)  # Create a new block ID
+
+            if new_blk_num >= self.__allocated_blocks[filename]:
+                try:
+                    f = self.__get_file(filename)
+                    if self.__extent_size > 1 and filename not in self.__preallocated and not self.is_temp(filename):
+                        self.__preallocated.add(filename)
+                        self.__save_preallocated()
+                    # Grow the file by a whole extent of zero-filled blocks
+                    f.extend((new_blk_num + self.__extent_size) * self.__block_size)
+                except IOError as e:
+                    raise RuntimeError(f"Cannot append block {blk}") from e
+                self.__allocated_blocks[filename] = new_blk_num + self.__extent_size
+                self.__mark_unsynced(filename)
+            self.__block_counts[filename] = new_blk_num + 1
+
+        return blk
+
+    def next_temp_name(self) -> str:
+        """
+        Returns a name for a new temporary file, unique for the lifetime of this file manager. The
+        name holds the ID of this process, so processes sharing the directory never pick the same name.
+
+        Returns:
+            str: A name starting with TEMP_PREFIX; callers may append a suffix to it.
+        """
+        with self.__lock:
+            self.__next_temp_num += 1
+            return f"{self.TEMP_PREFIX}{os.getpid()}-{self.__next_temp_num}"
+
+    @staticmethod
+    def is_temp(filename: str) -> bool:
+        """
+        Returns whether a file holds temporary data.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            bool: True if the file name starts with TEMP_PREFIX.
+        """
+        return filename.startswith(FileMgr.TEMP_PREFIX)
+
+    def remove(self, filename: str):
+        """
+        Closes a file and deletes it from the database directory.
+
+        Pending asynchronous writes of the file are waited for first, and its blocks are dropped
+        from the block cache. The buffer pool must not hold dirty blocks of the file any more.
+
+        Args:
+            filename (str): The name of the file to remove.
 
+        Raises:
+            RuntimeError: If an error occurs while deleting the file.
+        """
+        self.wait_for_writes(filename)
+        with self.__lock:
+            f = self.__opened_files.pop(filename, None)
+            if f is not None:
+                f.close()
+            for n in range(self.__block_counts.pop(filename, 0)):
+                self.__cache.remove(BlockID(filename, n))
+            self.__allocated_blocks.pop(filename, None)
+            self.__unsynced.discard(filename)
+            if filename in self.__preallocated:
+                self.__preallocated.discard(filename)
+                self.__save_preallocated()
         try:
-            f = self.__get_file(filename)
-            f.seek(blk.number * self.__block_size)  # Seek to the position of the new block
-            f.write(b)  # Write the empty byte array to the file to append the block
+            path = os.path.join(self.__db_directory, filename)
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            raise RuntimeError(f"Cannot remove {filename}") from e
+
+    def sync(self, filename: str):
+        """
+        Forces everything written to the given file so far to stable storage.
+
+        Args:
+            filename (str): The name of the file to sync.
+
+        Raises:
+            RuntimeError: If an error occurs while syncing the file.
+        """
+        self.wait_for_writes(filename)
+        with self.__lock:
+            self.__unsynced.discard(filename)
+        self.__sync_file(filename)
+
+    def force(self, last: Optional[str] = None):
+        """
+        Makes all writes so far durable as prescribed by the sync policy.
+
+        Under COMMIT, every file written since its last sync is synced before this method returns.
+        Under GROUP, the group sync thread is asked to sync them within the sync interval, sharing
+        one sync per file among all commits of that interval. Under NONE, nothing happens.
+
+        Args:
+            last (Optional[str]): A file to sync after all others, typically the log file. Syncing it
+                last does not order the writes the operating system makes on its own; see `force_data`.
+        """
+        if self.__sync_policy == SyncPolicy.COMMIT:
+            self.__sync_pending(last)
+        elif self.__sync_policy == SyncPolicy.GROUP:
+            self.__group_last = last
+            if self.__syncer is None:
+                with self.__lock:
+                    if self.__syncer is None:
+                        self.__syncer = threading.Thread(target=self.__group_sync_loop, daemon=True)
+                        self.__syncer.start()
+            self.__sync_requested.set()
+
+    def force_data(self, log: str):
+        """
+        Makes the files written so far durable before a commit record is appended, leaving out the
+        log file. Under COMMIT, every other file written since its last sync is synced before this
+        method returns, so that the commit record, which only reaches the operating system
+        afterwards, cannot become durable before the data pages it vouches for. Under GROUP and
+        NONE, nothing happens.
+
+        Args:
+            log (str): The log file, which is synced by `force` once the commit record is written.
+
+        Raises:
+            RuntimeError: If an error occurs while syncing a file.
+        """
+        if self.__sync_policy != SyncPolicy.COMMIT:
+            return
+        self.wait_for_writes()
+        with self.__lock:
+            pending = self.__unsynced - {log}
+            self.__unsynced = self.__unsynced & {log}
+        for filename in sorted(pending):
+            self.__sync_file(filename)
+
+    def close(self):
+        """
+        Completes asynchronous writes, syncs pending writes (unless the sync policy is NONE), stops
+        the group sync thread and the I/O threads, closes every opened file and truncates the
+        preallocated space at the end of each file. Files are reopened on demand if the file
+        manager is used again.
+
+        Raises:
+            RuntimeError: If an error occurs while truncating a file.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        self.__stopping = True
+        if self.__syncer is not None:
+            self.__sync_requested.set()
+            self.__syncer.join()
+            self.__syncer = None
+        if self.__sync_policy != SyncPolicy.NONE:
+            self.__sync_pending(self.__group_last)
+        with self.__lock:
+            for f in self.__opened_files.values():
+                f.close()
+            self.__opened_files.clear()
+            for filename, allocated in self.__allocated_blocks.items():
+                if allocated > self.__block_counts[filename]:
+                    try:
+                        os.truncate(os.path.join(self.__db_directory, filename),
+                                    self.__block_counts[filename] * self.__block_size)
+                    except OSError as e:
+                        raise RuntimeError(f"Cannot truncate {filename}") from e
+            self.__block_counts.clear()
+            if self.__preallocated:
+                os.remove(os.path.join(self.__db_directory, self.EXTENTS_FILE))
+                self.__preallocated.clear()
+            self.__allocated_blocks.clear()
+        self.__cache.clear()
+        self.__stopping = False
+
+    def __mark_unsynced(self, filename: str):
+        """
+        Records that a file has been written since it was last synced. Temporary files are never synced.
+
+        Args:
+            filename (str): The name of the written file.
+        """
+        if filename not in self.__unsynced and not self.is_temp(filename):
+            with self.__lock:
+                self.__unsynced.add(filename)
+
+    def __sync_pending(self, last: Optional[str]):
+        """
+        Syncs every file written since it was last synced.
+
+        Args:
+            last (Optional[str]): A file to sync after all others, if it needs syncing.
+
+        Raises:
+            RuntimeError: If an error occurs while syncing a file.
+        """
+        self.wait_for_writes()
+        with self.__lock:
+            pending, self.__unsynced = self.__unsynced, set()
+        for filename in sorted(pending - {last}):
+            self.__sync_file(filename)
+        if last in pending:
+            self.__sync_file(last)
+
+    def __sync_file(self, filename: str):
+        """
+        Forces a file to stable storage, without waiting for its asynchronous writes.
+
+        Args:
+            filename (str): The name of the file to sync.
+
+        Raises:
+            RuntimeError: If an error occurs while syncing the file.
+        """
+        try:
+            self.__get_file(filename).sync()
         except IOError as e:
-            raise RuntimeError(f"Cannot append block {blk}") from e
+            raise RuntimeError(f"Cannot sync {filename}") from e
 
-        return blk
+    def __group_sync_loop(self):
+        """
+        The body of the group sync thread.
 
-    def __get_file(self, filename: str) -> io.BufferedRandom:
+        Each time a sync is requested, the thread waits out the sync interval so that the commits
+        arriving meanwhile join the same batch, then syncs every pending file once.
+        """
+        while not self.__stopping:
+            self.__sync_requested.wait()
+            if self.__stopping:
+                return
+            time.sleep(self.__sync_interval)
+            self.__sync_requested.clear()
+            self.__sync_pending(self.__group_last)
+
+    def __get_file(self, filename: str) -> FileChannel:
         """
         Opens a file for reading and writing.
 
-        This method checks if the file is already opened. If it is not, the file is opened in
-        'rb+' mode (read-write binary mode). If the file does not exist, it will be created.
+        This method checks if the file is already opened, and if so marks its channel as the
+        most recently used. If it is not, a channel matching the I/O mode is opened on it, after
+        evicting the least recently used channel if the pool is full. If the file does not exist,
+        it will be created. The block counts of a file are computed the first time it is opened.
 
         Args:
             filename (str): The name of the file to open.
 
         Returns:
-            io.BufferedRandom: A file object for reading and writing.
+            FileChannel: A channel for reading and writing the file.
         """
         f = self.__opened_files.get(filename)
-        if f is None:
-            db_table: str = os.path.join(self.__db_directory, filename)
-            # print(f"table path is {db_table}, exists? {os.path.exists(db_table)}")
-            if not os.path.exists(db_table):
-                f = open(db_table, 'w')  # Create a new file if it doesn't exist
-                f.close()  # Close the file to create it
-            f = open(db_table, 'rb+')  # Open the file in read-write binary mode
-            self.__opened_files[filename] = f
+        if f is not None:
+            try:
+                self.__opened_files.move_to_end(filename)
+            except KeyError:
+                pass  # Evicted meanwhile; the reference held here keeps the channel open
+            return f
+        with self.__lock:
+            f = self.__opened_files.get(filename)  # Another thread may have opened it meanwhile
+            if f is None:
+                while len(self.__opened_files) >= self.__max_open_files:
+                    self.__opened_files.popitem(last=False)  # Closed once no thread uses it any more
+                    self.__file_evictions += 1
+                db_table: str = os.path.join(self.__db_directory, filename)
+                if not os.path.exists(db_table):
+                    f = open(db_table, 'w')  # Create a new file if it doesn't exist
+                    f.close()  # Close the file to create it
+                f = self.__open_channel(db_table)
+                self.__file_opens += 1
+                if filename not in self.__block_counts:
+                    self.__init_block_counts(filename, f)
+                self.__opened_files[filename] = f
         return f
 
+    def __init_block_counts(self, filename: str, f: FileChannel):
+        """
+        Computes the allocated and logical block counts of a file that has just been opened.
+
+        Every block counts as part of the logical file, except that if the file is listed in
+        EXTENTS_FILE, up to `extent_size - 1` trailing all-zero blocks are taken for space
+        preallocated before a crash.
+
+        Args:
+            filename (str): The name of the file.
+            f (FileChannel): The channel opened on the file.
+        """
+        allocated: int = f.size() // self.__block_size  # Calculate the number of blocks
+        logical: int = allocated
+        buffer = bytearray(self.__block_size)
+        lowest: int = max(allocated - self.__extent_size + 1, 0) if filename in self.__preallocated else allocated
+        while logical > lowest:
+            n = f.read((logical - 1) * self.__block_size, buffer)
+            if buffer.count(0, 0, n) != n:
+                break
+            logical -= 1
+        self.__allocated_blocks[filename] = allocated
+        self.__block_counts[filename] = logical
+
     def block_num(self, filename: str) -> int:
         """
         Returns the number of blocks required to store the specified file.
 
-        This method calculates the number of blocks based on the file size and block size.
+        The count is calculated from the file size and block size when the file is opened;
+        afterwards the in-memory count maintained by `append` and `write` is returned.
 
         Args:
             filename (str): The name of the file.
@@ -178,14 +885,93 @@ class FileMgr:
         Raises:
             RuntimeError: If an error occurs while accessing the file.
         """
-        try:
-            f = self.__get_file(filename)
-            file_size: int = os.path.getsize(f.name)  # Get the file size
-            block_num: int = int(file_size / self.__block_size)  # Calculate the number of blocks
+        block_num = self.__block_counts.get(filename)
+        if block_num is not None:
             return block_num
+        try:
+            self.__get_file(filename)  # Opening the file computes its block count
+            return self.__block_counts[filename]
         except IOError as e:
             raise RuntimeError(f"Cannot access {filename}") from e
 
+    def __open_channel(self, path: str) -> FileChannel:
+        """
+        Opens a channel on an existing file according to the I/O mode.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            FileChannel: The opened channel.
+        """
+        if self.__io_mode == IOMode.MMAP:
+            return MmapChannel(path)
+        if self.__io_mode == IOMode.PREAD:
+            return PositionalChannel(path)
+        if self.__io_mode == IOMode.DIRECT:
+            return DirectChannel(path)
+        return BufferedChannel(path)
+
+    @property
+    def file_opens(self) -> int:
+        """
+        Returns the number of file channels opened so far, including reopens after eviction.
+
+        Returns:
+            int: The number of opens.
+        """
+        return self.__file_opens
+
+    @property
+    def file_evictions(self) -> int:
+        """
+        Returns the number of file channels evicted to stay within the open-file limit.
+
+        Returns:
+            int: The number of evictions.
+        """
+        return self.__file_evictions
+
+    @property
+    def open_files(self) -> int:
+        """
+        Returns the number of file channels currently in the pool.
+
+        Returns:
+            int: The number of open channels.
+        """
+        return len(self.__opened_files)
+
+    @property
+    def sync_policy(self) -> SyncPolicy:
+        """
+        Returns the durability mode of this file manager.
+
+        Returns:
+            SyncPolicy: The policy applied by `force`.
+        """
+        return self.__sync_policy
+
+    @property
+    def cache(self) -> BlockCache:
+        """
+        Returns the block cache, e.g. to inspect its hit/miss counters.
+
+        Returns:
+            BlockCache: The size-bounded block cache of this file manager.
+        """
+        return self.__cache
+
+    @property
+    def io_mode(self) -> IOMode:
+        """
+        Returns the I/O mode of this file manager.
+
+        Returns:
+            IOMode: The I/O backend used for every opened file.
+        """
+        return self.__io_mode
+
     @property
     def is_new(self) -> bool:
         """
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 09:12
+# @Author  : EvanWong
+# @File    : IOMode.py
+# @Project : TestDB
+
+from enum import Enum
+
+
+class IOMode(Enum):
+    """
+    Enumeration of the block I/O backends supported by the file manager.
+
+    Each mode selects the `FileChannel` implementation used for every file opened by a `FileMgr`:
+        - BUFFERED: seek + read/write through a buffered file object.
+        - MMAP: each file is memory-mapped once and blocks are copied straight out of the mapping.
+        - PREAD: positional os.pread/os.pwrite on raw file descriptors, safe for concurrent readers.
+        - DIRECT: positional I/O with O_DIRECT through aligned buffers, bypassing the OS page cache
+          so the buffer pool is the only cache (Linux only).
+    """
+    BUFFERED = 0  # Represents seek-based I/O through io.BufferedRandom.
+    MMAP = 1  # Represents memory-mapped I/O.
+    PREAD = 2  # Represents lock-free positional I/O.
+    DIRECT = 3  # Represents positional I/O that bypasses the page cache.
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 09:34
+# @Author  : EvanWong
+# @File    : MmapChannel.py
+# @Project : TestDB
+
+import io
+import mmap
+import os
+import threading
+from typing import List, Optional
+
+from file.FileChannel import FileChannel
+
+
+class MmapChannel(FileChannel):
+    """
+    A file channel that maps the whole file into memory once and serves reads and writes from the mapping.
+
+    Reads copy a block straight from the mapping into the caller's buffer, so no system call and no
+    intermediate bytes object is involved. The mapping is recreated whenever the file grows; the
+    channel's lock keeps readers and writers off the mapping while it is being replaced.
+
+    Attributes:
+        __file (io.BufferedRandom): The file object backing the mapping.
+        __map (Optional[mmap.mmap]): The current mapping, or None while the file is empty.
+        __size (int): The size of the file (and of the mapping) in bytes.
+        __lock (threading.RLock): Guards the mapping against concurrent remapping.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens and maps the file at the given path.
+
+        Args:
+            path (str): The path of an existing file.
+        """
+        self.__file: io.BufferedRandom = open(path, 'rb+')
+        self.__map: Optional[mmap.mmap] = None
+        self.__size: int = os.fstat(self.__file.fileno()).st_size
+        self.__lock: threading.RLock = threading.RLock()
+        self.__remap()
+
+    def read(self, offset: int, buffer: bytearray) -> int:
+        """
+        Copies bytes from the mapping into the provided buffer.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes actually read.
+        """
+        with self.__lock:
+            end = min(offset + len(buffer), self.__size)
+            if end <= offset:
+                return 0
+            with memoryview(self.__map) as view:
+                memoryview(buffer)[:end - offset] = view[offset:end]
+            return end - offset
+
+    def read_vector(self, offset: int, buffers: List[bytearray]) -> int:
+        """
+        Copies consecutive slices of the mapping into the buffers.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffers (List[bytearray]): The buffers to fill, in file order.
+
+        Returns:
+            int: The total number of bytes actually read.
+        """
+        with self.__lock:
+            total = 0
+            for buffer in buffers:
+                n = self.read(offset + total, buffer)
+                total += n
+                if n < len(buffer):
+                    break
+            return total
+
+    def write(self, offset: int, data: bytearray):
+        """
+        Copies the data into the mapping, growing the file first if the write goes past its end.
+
+        Args:
+            offset (int): The byte offset within the file to start writing.
+            data (bytearray): The data to write.
+        """
+        with self.__lock:
+            end = offset + len(data)
+            if end > self.__size:
+                self.extend(end)
+            self.__map[offset:end] = data
+
+    def extend(self, size: int):
+        """
+        Grows the file to the given size, preallocating the space where possible, and remaps it.
+
+        Args:
+            size (int): The new size of the file in bytes.
+        """
+        with self.__lock:
+            if size <= self.__size:
+                return
+            if not self._preallocate(self.__file.fileno(), self.__size, size - self.__size):
+                self.__file.truncate(size)  # Truncating upwards fills the new space with zeros
+            self.__size = size
+            self.__remap()
+
+    def size(self) -> int:
+        """
+        Returns the current size of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return self.__size
+
+    def sync(self):
+        """
+        Writes the dirty pages of the mapping back (msync) and forces the file to stable storage.
+        """
+        with self.__lock:
+            if self.__map is not None:
+                self.__map.flush()
+            self._datasync(self.__file.fileno())
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        with self.__lock:
+            if self.__map is not None:
+                self.__map.close()
+                self.__map = None
+            self.__file.close()
+
+    def __remap(self):
+        """
+        Replaces the current mapping by one covering the whole file.
+
+        An empty file cannot be mapped, so the mapping stays None until the first extension.
+        """
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        if self.__size > 0:
+            self.__map = mmap.mmap(self.__file.fileno(), self.__size)
@@ -7,8 +7,11 @@
 import struct
 import typing
 import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+# Precompiled formats shared by all pages; module globals are the cheapest lookup on the hot path.
+_INT = struct.Struct('!i')
+_FLOAT = struct.Struct('!f')
 
 class Page:
     """Represents a data page in memory.
@@ -20,22 +23,32 @@ class Page:
         - Start position stores an int value, representing the length of the real data part stored in bytes.
         - Then follows the given bytes of data.
 
+    Numbers are packed with precompiled `struct.Struct` instances instead of re-parsing a format
+    string on every access, strings are decoded after a single copy, and `get_bytes_view` gives
+    zero-copy access to stored bytes.
+
     Attributes:
         __CHARSET (str): The character encoding used for strings. Defaults to 'utf-8'.
+        __STRUCTS (dict): Precompiled formats used by the multi-field helpers, keyed by format string.
         __bb (bytearray): The internal buffer storing the page data.
+        __view (memoryview): A view of the internal buffer used for zero-copy reads.
 
     """
 
     __CHARSET = 'utf-8'
+    __STRUCTS: Dict[str, struct.Struct] = {}
 
-    def __init__(self, b: typing.Union[int, bytearray]):
+    def __init__(self, b: typing.Union[int, bytearray], share: bool = False):
         """
         Initializes a Page with either a size (int) for an empty buffer or a bytearray for an existing buffer.
 
         Args:
             b (Union[int, bytearray]): If int, initializes an empty buffer of that size. If bytearray, initializes the buffer with the given data.
+            share (bool): If True, b is a writable memoryview the page reads and writes in place
+                instead of copying it; see `PageView`.
         """
-        self.__bb: bytearray = bytearray(b)
+        self.__bb: bytearray = b if share else bytearray(b)
+        self.__view: memoryview = memoryview(self.__bb)
 
     def get_int(self, offset: int) -> int:
         """Reads an integer from the buffer at the specified offset.
@@ -46,7 +59,7 @@ class Page:
         Returns:
             int: The integer value at the specified offset.
         """
-        return struct.unpack_from('!i', self.__bb, offset)[0]
+        return _INT.unpack_from(self.__bb, offset)[0]
 
     def set_int(self, offset: int, num: int):
         """Writes an integer to the buffer at the specified offset.
@@ -55,7 +68,7 @@ class Page:
             offset (int): The offset within the buffer to start writing.
             num (int): The integer value to be written.
         """
-        struct.pack_into('!i', self.__bb, offset, num)
+        _INT.pack_into(self.__bb, offset, num)
 
     def get_bytes(self, offset: int) -> bytearray:
         """Reads bytes from the buffer at the specified offset.
@@ -66,9 +79,25 @@ class Page:
         Returns:
             bytes: The bytes read from the buffer.
         """
-        length = self.get_int(offset)
+        length = _INT.unpack_from(self.__bb, offset)[0]
         start_position = offset + 4  # 4 is the length of the stored integer
-        return bytearray(self.__bb[start_position: start_position + length])
+        return self.__bb[start_position: start_position + length]  # Slicing a bytearray copies once
+
+    def get_bytes_view(self, offset: int) -> memoryview:
+        """Returns a read-only view of the bytes stored at the specified offset, without copying them.
+
+        The view reflects later changes to the page, so callers that keep the bytes beyond the
+        current access should use `get_bytes` instead.
+
+        Args:
+            offset (int): The offset within the buffer to start reading.
+
+        Returns:
+            memoryview: A view of the stored bytes.
+        """
+        length = _INT.unpack_from(self.__bb, offset)[0]
+        start_position = offset + 4  # 4 is the length of the stored integer
+        return self.__view[start_position: start_position + length].toreadonly()
 
     def set_bytes(self, offset: int, b: bytearray):
         """Writes bytes to the buffer at the specified offset.
@@ -92,10 +121,10 @@ class Page:
         Returns:
             str: The string read from the buffer.
         """
-        b = self.get_bytes(offset)
+        length = _INT.unpack_from(self.__bb, offset)[0]
+        start_position = offset + 4  # 4 is the length of the stored integer
         try:
-            string = b.decode(self.__CHARSET)
-            return string
+            return self.__bb[start_position: start_position + length].decode(self.__CHARSET)
         except UnicodeDecodeError:
             return None
 
@@ -116,7 +145,7 @@ class Page:
             offset (int): The offset within the buffer to start writing.
             value (float): The floating-point number to be written.
         """
-        struct.pack_into('!f', self.__bb, offset, value)
+        _FLOAT.pack_into(self.__bb, offset, value)
 
     def get_float(self, offset: int) -> float:
         """Reads a floating-point number from the buffer at the specified offset.
@@ -127,7 +156,7 @@ class Page:
         Returns:
             float: The floating-point number read from the buffer.
         """
-        return struct.unpack_from('!f', self.__bb, offset)[0]
+        return _FLOAT.unpack_from(self.__bb, offset)[0]
 
     def set_date(self, offset: int, date: datetime.date):
         """Stores a date in the buffer as an integer (seconds since Unix epoch).
@@ -137,7 +166,7 @@ class Page:
             date (datetime.date): The date to be written.
         """
         timestamp = int((date - datetime.date(1970, 1, 1)).total_seconds())
-        struct.pack_into('!i', self.__bb, offset, timestamp)
+        _INT.pack_into(self.__bb, offset, timestamp)
 
     def get_date(self, offset: int) -> datetime.date:
         """Reads a date from the buffer.
@@ -148,9 +177,47 @@ class Page:
         Returns:
             datetime.date: The date read from the buffer.
         """
-        timestamp = struct.unpack_from('!i', self.__bb, offset)[0]
+        timestamp = _INT.unpack_from(self.__bb, offset)[0]
         return datetime.date(1970, 1, 1) + datetime.timedelta(seconds=timestamp)
 
+    def get_fields(self, offset: int, fmt: str) -> Tuple:
+        """Reads several consecutive fixed-size fields with a single unpack.
+
+        Args:
+            offset (int): The offset within the buffer to start reading.
+            fmt (str): A `struct` format describing the fields, e.g. '!iif'. Use network byte
+                order ('!') to match the layout written by the single-field setters.
+
+        Returns:
+            tuple: The values of the fields.
+        """
+        return self.__struct(fmt).unpack_from(self.__bb, offset)
+
+    def set_fields(self, offset: int, fmt: str, *values):
+        """Writes several consecutive fixed-size fields with a single pack.
+
+        Args:
+            offset (int): The offset within the buffer to start writing.
+            fmt (str): A `struct` format describing the fields, e.g. '!iif'.
+            *values: The values of the fields, in format order.
+        """
+        self.__struct(fmt).pack_into(self.__bb, offset, *values)
+
+    @staticmethod
+    def __struct(fmt: str) -> struct.Struct:
+        """Returns the precompiled form of a format string, compiling it on first use.
+
+        Args:
+            fmt (str): A `struct` format string.
+
+        Returns:
+            struct.Struct: The precompiled format.
+        """
+        s = Page.__STRUCTS.get(fmt)
+        if s is None:
+            s = Page.__STRUCTS[fmt] = struct.Struct(fmt)
+        return s
+
     @staticmethod
     def max_length(strlen: int) -> int:
         """Calculates the maximum number of bytes required to store a string of the given length.
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 14:40
+# @Author  : EvanWong
+# @File    : PageBenchmark.py
+# @Project : TestDB
+import struct
+import timeit
+
+from file.Page import Page
+
+NUMBER = 500000
+OFFSET_INT = 16
+OFFSET_FLOAT = 20
+OFFSET_STRING = 40
+
+
+class LegacyPage:
+    """
+    The accessors of Page as they were before formats were precompiled: every call re-parses
+    its format string, and strings are decoded from a double copy of their bytes.
+    """
+
+    def __init__(self, b: bytearray):
+        self.__bb = bytearray(b)
+
+    def get_int(self, offset: int) -> int:
+        return struct.unpack_from('!i', self.__bb, offset)[0]
+
+    def get_float(self, offset: int) -> float:
+        return struct.unpack_from('!f', self.__bb, offset)[0]
+
+    def get_bytes(self, offset: int) -> bytearray:
+        length = self.get_int(offset)
+        start_position = offset + 4
+        return bytearray(self.__bb[start_position: start_position + length])
+
+    def get_string(self, offset: int) -> str:
+        return self.get_bytes(offset).decode('utf-8')
+
+
+def per_call(stmt) -> float:
+    """
+    Times a statement and returns its cost per call.
+
+    Args:
+        stmt: A callable to time.
+
+    Returns:
+        float: The average time of one call, in nanoseconds.
+    """
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=3)) / NUMBER * 1e9
+
+
+if __name__ == "__main__":
+    page = Page(400)
+    page.set_int(OFFSET_INT, 12345)
+    page.set_float(OFFSET_FLOAT, 3.5)
+    page.set_string(OFFSET_STRING, "a string of twenty-five")
+    legacy = LegacyPage(page.content)
+
+    cases = [
+        ("get_int", lambda: legacy.get_int(OFFSET_INT), lambda: page.get_int(OFFSET_INT)),
+        ("get_float", lambda: legacy.get_float(OFFSET_FLOAT), lambda: page.get_float(OFFSET_FLOAT)),
+        ("get_bytes", lambda: legacy.get_bytes(OFFSET_STRING), lambda: page.get_bytes(OFFSET_STRING)),
+        ("get_bytes_view", lambda: legacy.get_bytes(OFFSET_STRING), lambda: page.get_bytes_view(OFFSET_STRING)),
+        ("get_string", lambda: legacy.get_string(OFFSET_STRING), lambda: page.get_string(OFFSET_STRING)),
+        ("int, int, float", lambda: (legacy.get_int(0), legacy.get_int(4), legacy.get_float(8)),
+         lambda: page.get_fields(0, '!iif')),
+    ]
+
+    print(f"ns per call, best of 3 x {NUMBER} calls")
+    print(f"{'accessor':>18}{'before':>10}{'after':>10}{'speedup':>10}")
+    for name, before_stmt, after_stmt in cases:
+        before, after = per_call(before_stmt), per_call(after_stmt)
+        print(f"{name:>18}{before:>10.0f}{after:>10.0f}{before / after:>9.2f}x")
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 02:40
+# @Author  : EvanWong
+# @File    : PageView.py
+# @Project : TestDB
+from typing import Optional
+
+from file.Page import Page
+
+
+class PageView(Page):
+    """
+    A page over memory it does not own, e.g. a frame of a shared buffer pool, read and written in
+    place. Slicing a memoryview does not copy, so byte strings and strings are copied out of the
+    memory explicitly instead of by slicing as `Page` does.
+
+    Attributes:
+        __memory (memoryview): The memory holding the page.
+    """
+
+    __CHARSET = 'utf-8'  # Same encoding as Page
+
+    def __init__(self, memory: memoryview):
+        """
+        Initializes a page over the given memory.
+
+        Args:
+            memory (memoryview): A writable view of exactly the page's bytes.
+        """
+        super().__init__(memory, share=True)
+        self.__memory: memoryview = memory
+
+    def get_bytes(self, offset: int) -> bytearray:
+        """Reads bytes from the page at the specified offset.
+
+        Args:
+            offset (int): The offset within the page to start reading.
+
+        Returns:
+            bytearray: A copy of the bytes stored at the offset.
+        """
+        start_position = offset + 4  # 4 is the length of the stored integer
+        return bytearray(self.__memory[start_position: start_position + self.get_int(offset)])
+
+    def get_string(self, offset: int) -> Optional[str]:
+        """Reads a string from the page at the specified offset.
+
+        Args:
+            offset (int): The offset within the page to start reading.
+
+        Returns:
+            str: The string stored at the offset, or None if it is not valid.
+        """
+        start_position = offset + 4  # 4 is the length of the stored integer
+        try:
+            return str(self.__memory[start_position: start_position + self.get_int(offset)], self.__CHARSET)
+        except UnicodeDecodeError:
+            return None
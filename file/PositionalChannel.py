@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 11:20
+# @Author  : EvanWong
+# @File    : PositionalChannel.py
+# @Project : TestDB
+
+import os
+from typing import List
+
+from file.FileChannel import FileChannel
+
+
+class PositionalChannel(FileChannel):
+    """
+    A file channel that uses positional I/O (`os.pread`/`os.pwrite`) on a raw file descriptor.
+
+    Positional calls carry their own offset and never touch a shared file position, so any number
+    of threads may read and write the same file at once without holding a lock. The GIL is released
+    for the duration of each system call.
+
+    Attributes:
+        __fd (int): The raw file descriptor opened for reading and writing.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a raw file descriptor on the file at the given path.
+
+        Args:
+            path (str): The path of an existing file.
+        """
+        self.__fd: int = os.open(path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+
+    def read(self, offset: int, buffer: bytearray) -> int:
+        """
+        Reads at the given offset without moving any file position.
+
+        Where `os.preadv` is available the kernel writes straight into the caller's buffer,
+        otherwise the bytes returned by `os.pread` are copied into it.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            int: The number of bytes actually read.
+        """
+        if hasattr(os, 'preadv'):
+            return os.preadv(self.__fd, [buffer], offset)
+        data = os.pread(self.__fd, len(buffer), offset)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read_vector(self, offset: int, buffers: List[bytearray]) -> int:
+        """
+        Reads the whole range with a single `os.preadv` straight into the buffers, or with a
+        single `os.pread` whose result is split over them where `preadv` is not available.
+
+        Args:
+            offset (int): The byte offset within the file to start reading.
+            buffers (List[bytearray]): The buffers to fill, in file order.
+
+        Returns:
+            int: The total number of bytes actually read.
+        """
+        if hasattr(os, 'preadv'):
+            return os.preadv(self.__fd, buffers, offset)
+        data = os.pread(self.__fd, sum(len(b) for b in buffers), offset)
+        view = memoryview(data)
+        for buffer in buffers:
+            n = min(len(buffer), len(view))
+            buffer[:n] = view[:n]
+            view = view[n:]
+        return len(data)
+
+    def write(self, offset: int, data: bytearray):
+        """
+        Writes at the given offset without moving any file position.
+
+        Args:
+            offset (int): The byte offset within the file to start writing.
+            data (bytearray): The data to write.
+        """
+        view = memoryview(data)
+        while len(view) > 0:  # pwrite may write fewer bytes than requested
+            written = os.pwrite(self.__fd, view, offset)
+            view = view[written:]
+            offset += written
+
+    def extend(self, size: int):
+        """
+        Grows the file to the given size, preallocating the space or letting the kernel zero-fill it.
+
+        Args:
+            size (int): The new size of the file in bytes.
+        """
+        current_size = self.size()
+        if size > current_size and not self._preallocate(self.__fd, current_size, size - current_size):
+            os.ftruncate(self.__fd, size)
+
+    def size(self) -> int:
+        """
+        Returns the current size of the file.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return os.fstat(self.__fd).st_size
+
+    def sync(self):
+        """
+        Forces the file to stable storage.
+        """
+        self._datasync(self.__fd)
+
+    def close(self):
+        """
+        Closes the file descriptor; closing a closed channel does nothing.
+        """
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
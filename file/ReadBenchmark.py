@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 11:52
+# @Author  : EvanWong
+# @File    : ReadBenchmark.py
+# @Project : TestDB
+import os
+import random
+import tempfile
+import threading
+import time
+
+from file.BlockID import BlockID
+from file.DirectChannel import DirectChannel
+from file.FileMgr import FileMgr
+from file.IOMode import IOMode
+from file.Page import Page
+
+BLOCK_SIZE = 4096
+NUM_BLOCKS = 2048
+READS_PER_THREAD = 20000
+THREAD_COUNTS = [1, 2, 4, 8]
+RUN_LENGTH = 16
+SCAN_PASSES = 5
+FILENAME = "bench.tbl"
+MODES = [IOMode.BUFFERED, IOMode.MMAP, IOMode.PREAD] + ([IOMode.DIRECT] if DirectChannel.supported() else [])
+
+
+def create_file(directory: str):
+    """
+    Fills a test file with NUM_BLOCKS blocks, each holding its own block number.
+
+    Args:
+        directory (str): The database directory to create the file in.
+    """
+    fm = FileMgr(directory, BLOCK_SIZE, cache_size=0)
+    p = Page(BLOCK_SIZE)
+    for i in range(NUM_BLOCKS):
+        blk = fm.append(FILENAME)
+        p.set_int(0, i)
+        fm.write(blk, p)
+
+
+def run_readers(fm: FileMgr, num_threads: int) -> float:
+    """
+    Lets several threads read random blocks of the test file through the same file manager.
+
+    Args:
+        fm (FileMgr): The file manager shared by all threads.
+        num_threads (int): The number of reader threads.
+
+    Returns:
+        float: The number of blocks read per second over all threads.
+    """
+    def reader(seed: int):
+        rnd = random.Random(seed)
+        p = Page(BLOCK_SIZE)
+        for _ in range(READS_PER_THREAD):
+            n = rnd.randrange(NUM_BLOCKS)
+            fm.read(BlockID(FILENAME, n), p)
+            assert p.get_int(0) == n, "a concurrent read returned the wrong block"
+
+    threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(num_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * READS_PER_THREAD / elapsed
+
+
+def run_scans(fm: FileMgr, run_length: int) -> float:
+    """
+    Scans the whole test file sequentially, either block by block or in runs read with read_range.
+
+    Args:
+        fm (FileMgr): The file manager to read through.
+        run_length (int): The number of blocks fetched per I/O; 1 uses the single-block read.
+
+    Returns:
+        float: The number of blocks read per second.
+    """
+    pages = [Page(BLOCK_SIZE) for _ in range(run_length)]
+    start = time.perf_counter()
+    for _ in range(SCAN_PASSES):
+        n = 0
+        while n < NUM_BLOCKS:
+            if run_length == 1:
+                fm.read(BlockID(FILENAME, n), pages[0])
+                n += 1
+            else:
+                n += fm.read_range(FILENAME, n, run_length, pages)
+    elapsed = time.perf_counter() - start
+    return SCAN_PASSES * NUM_BLOCKS / elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        db_directory = os.path.join(base_directory, "readbench")
+        create_file(db_directory)
+
+        print(f"{NUM_BLOCKS} blocks of {BLOCK_SIZE} bytes, {READS_PER_THREAD} random reads per thread, cache disabled")
+        print(f"{'mode':>10}" + "".join(f"{str(n) + ' thr':>14}" for n in THREAD_COUNTS))
+        for mode in MODES:
+            file_mgr = FileMgr(db_directory, BLOCK_SIZE, mode, cache_size=0)
+            rates = [run_readers(file_mgr, n) for n in THREAD_COUNTS]
+            print(f"{mode.name:>10}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+        print()
+        print(f"Sequential scans, single-block reads vs. read_range runs of {RUN_LENGTH} blocks")
+        print(f"{'mode':>10}{'read':>14}{'read_range':>14}")
+        for mode in MODES:
+            file_mgr = FileMgr(db_directory, BLOCK_SIZE, mode, cache_size=0)
+            print(f"{mode.name:>10}{run_scans(file_mgr, 1):>14,.0f}{run_scans(file_mgr, RUN_LENGTH):>14,.0f}")
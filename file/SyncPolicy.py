@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 13:05
+# @Author  : EvanWong
+# @File    : SyncPolicy.py
+# @Project : TestDB
+
+from enum import Enum
+
+
+class SyncPolicy(Enum):
+    """
+    Enumeration of the durability modes supported by the file manager.
+
+    The policy decides what happens when a commit asks for its writes to be made durable:
+        - NONE: nothing; written blocks reach the disk whenever the operating system flushes them.
+        - COMMIT: every commit synchronously fdatasyncs the files it wrote before appending its
+          commit record, then the log.
+        - GROUP: commits return at once and a background thread syncs all pending files at most
+          once per sync interval, so many commits share a single fdatasync. The commit records of
+          the last interval may reach the disk before their data pages, so a crash can lose those
+          commits or leave them half-applied; earlier commits are durable.
+    """
+    NONE = 0  # Represents no explicit syncing.
+    COMMIT = 1  # Represents a synchronous sync on every commit.
+    GROUP = 2  # Represents batched syncing on an interval.
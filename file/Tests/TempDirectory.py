@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 05:40
+# @Author  : EvanWong
+# @File    : TempDirectory.py
+# @Project : TestDB
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def temp_directory(name: str) -> Iterator[str]:
+    """
+    Provides a path for a test's database directory, or file, inside a temporary directory that
+    is removed with everything in it once the test is done.
+
+    Args:
+        name (str): The name of the database directory, which is not created.
+
+    Yields:
+        str: The path of the database directory.
+    """
+    with tempfile.TemporaryDirectory() as base:
+        yield os.path.join(base, name)
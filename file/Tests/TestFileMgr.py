@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 10:04
+# @Author  : EvanWong
+# @File    : TestFileMgr.py
+# @Project : TestDB
+import errno
+import os
+import subprocess
+import sys
+import threading
+
+from file.BlockID import BlockID
+from file.BufferedChannel import BufferedChannel
+from file.DirectChannel import DirectChannel
+from file.FileMgr import FileMgr
+from file.IOMode import IOMode
+from file.Page import Page
+from file.SyncPolicy import SyncPolicy
+from file.Tests.TempDirectory import temp_directory
+
+
+def check_round_trip(io_mode: IOMode, block_size: int = 400):
+    """
+    Appends, writes and reads back blocks through a file manager in the given I/O mode,
+    then reopens the directory to make sure the data reached the file.
+    """
+    with temp_directory("filetest") as directory:
+        fm = FileMgr(directory, block_size, io_mode)
+
+        # A new file has no blocks; appending grows it one block at a time
+        assert fm.block_num("testfile") == 0
+        blk0 = fm.append("testfile")
+        blk1 = fm.append("testfile")
+        assert blk0.number == 0 and blk1.number == 1
+        assert fm.block_num("testfile") == 2
+
+        # Write a value into each block and read it back
+        p = Page(fm.block_size)
+        p.set_string(88, "abcdefghijklm")
+        p.set_int(200, 345)
+        fm.write(blk1, p)
+        p.set_int(200, 0)
+        fm.write(blk0, p)
+
+        p2 = Page(fm.block_size)
+        fm.read(blk1, p2)
+        assert p2.get_string(88) == "abcdefghijklm"
+        assert p2.get_int(200) == 345
+        fm.read(blk0, p2)
+        assert p2.get_int(200) == 0
+
+        # Writing past the end of the file grows it
+        fm.write(BlockID("testfile", 3), p)
+        assert fm.block_num("testfile") == 4
+
+        # A fresh file manager sees the same data
+        fm2 = FileMgr(directory, block_size, io_mode)
+        p3 = Page(fm2.block_size)
+        fm2.read(blk1, p3)
+        assert p3.get_int(200) == 345
+        assert fm2.block_num("testfile") == 4
+
+
+def test_buffered_mode():
+    check_round_trip(IOMode.BUFFERED)
+
+
+def test_mmap_mode():
+    check_round_trip(IOMode.MMAP)
+
+
+def test_pread_mode():
+    check_round_trip(IOMode.PREAD)
+
+
+def test_direct_mode():
+    if not DirectChannel.supported():
+        return  # Direct I/O is Linux only
+    try:
+        check_round_trip(IOMode.DIRECT, DirectChannel.ALIGNMENT)
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise  # EINVAL means the file system (e.g. tmpfs) does not support O_DIRECT
+    with temp_directory("directtest") as directory:
+        try:
+            FileMgr(directory, 400, IOMode.DIRECT)
+            assert False, "an unaligned block size must be rejected"
+        except ValueError:
+            pass
+
+
+def test_concurrent_reads():
+    """
+    Lets several threads read different blocks of the same file at once; every thread must get
+    the block it asked for, whatever the I/O mode.
+    """
+    with temp_directory("concurrenttest") as directory:
+        fm = FileMgr(directory, 400, cache_size=0)
+        p = Page(fm.block_size)
+        for i in range(64):
+            blk = fm.append("testfile")
+            p.set_int(0, i)
+            fm.write(blk, p)
+
+        for mode in (IOMode.BUFFERED, IOMode.MMAP, IOMode.PREAD):
+            reader_fm = FileMgr(directory, 400, mode, cache_size=0)
+            errors = []
+
+            def reader(start: int):
+                page = Page(reader_fm.block_size)
+                for k in range(500):
+                    n = (start + k) % 64
+                    reader_fm.read(BlockID("testfile", n), page)
+                    if page.get_int(0) != n:
+                        errors.append(n)
+
+            threads = [threading.Thread(target=reader, args=(i * 7,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert not errors, f"{mode.name} returned wrong blocks"
+
+
+def test_extent_allocation():
+    """
+    Verifies that files grow by whole extents while block_num reports the logical end of file,
+    also after the directory is reopened.
+    """
+    with temp_directory("extenttest") as directory:
+        for mode in (IOMode.BUFFERED, IOMode.MMAP, IOMode.PREAD):
+            filename = f"testfile_{mode.name}"
+            fm = FileMgr(directory, 400, mode, extent_size=8)
+            p = Page(fm.block_size)
+            for i in range(3):
+                blk = fm.append(filename)
+                assert blk.number == i
+                p.set_int(0, i + 1)
+                fm.write(blk, p)
+            assert fm.block_num(filename) == 3
+            assert os.path.getsize(os.path.join(directory, filename)) == 8 * 400
+
+            # The preallocated tail is not part of the file after reopening
+            fm2 = FileMgr(directory, 400, mode, extent_size=8)
+            assert fm2.block_num(filename) == 3
+            assert fm2.append(filename).number == 3
+            assert os.path.getsize(os.path.join(directory, filename)) == 8 * 400
+
+
+def test_zero_last_block():
+    """
+    Verifies that a file whose last block is all zeros keeps that block when it is reopened,
+    after a clean close also when the file grows in extents.
+    """
+    with temp_directory("zerotest") as directory:
+        for extent_size in (1, 8):
+            filename = f"testfile_{extent_size}"
+            fm = FileMgr(directory, 400, extent_size=extent_size)
+            p = Page(fm.block_size)
+            p.set_int(0, 1)
+            fm.write(fm.append(filename), p)
+            fm.write(fm.append(filename), Page(fm.block_size))
+            if extent_size == 1:
+                assert FileMgr(directory, 400).block_num(filename) == 2  # Without preallocation, even before closing
+            fm.close()
+            assert os.path.getsize(os.path.join(directory, filename)) == 2 * 400
+
+            fm2 = FileMgr(directory, 400, extent_size=extent_size)
+            assert fm2.block_num(filename) == 2
+            assert fm2.append(filename).number == 2
+
+
+def test_read_range():
+    """
+    Verifies that a range read fills one page per block and stops at the end of the file.
+    """
+    with temp_directory("rangetest") as directory:
+        for mode in (IOMode.BUFFERED, IOMode.MMAP, IOMode.PREAD):
+            filename = f"testfile_{mode.name}"
+            fm = FileMgr(directory, 400, mode)
+            p = Page(fm.block_size)
+            for i in range(10):
+                blk = fm.append(filename)
+                p.set_int(0, i)
+                p.set_string(100, f"block{i}")
+                fm.write(blk, p)
+
+            pages = [Page(fm.block_size) for _ in range(4)]
+            assert fm.read_range(filename, 3, 4, pages) == 4
+            for i, page in enumerate(pages):
+                assert page.get_int(0) == 3 + i
+                assert page.get_string(100) == f"block{3 + i}"
+
+            # Only two blocks are left after block 7
+            assert fm.read_range(filename, 8, 4, pages) == 2
+            assert pages[0].get_int(0) == 8 and pages[1].get_int(0) == 9
+            assert fm.read_range(filename, 10, 4, pages) == 0
+
+
+def test_sync_policies():
+    """
+    Forces writes under every sync policy and checks that they survive closing the file manager.
+    """
+    with temp_directory("synctest") as directory:
+        for policy in (SyncPolicy.NONE, SyncPolicy.COMMIT, SyncPolicy.GROUP):
+            fm = FileMgr(directory, 400, sync_policy=policy, sync_interval=0.001)
+            assert fm.sync_policy == policy
+            p = Page(fm.block_size)
+            for i in range(5):
+                p.set_int(0, i + 1)
+                fm.write(fm.append("datafile"), p)
+                fm.write(fm.append("logfile"), p)
+                fm.force("logfile")
+            fm.close()
+
+            fm2 = FileMgr(directory, 400)
+            fm2.read(BlockID("datafile", fm2.block_num("datafile") - 1), p)
+            assert p.get_int(0) == 5
+
+
+def test_sync_errors():
+    """
+    Makes syncing fail and checks that every way of syncing reports it as a RuntimeError.
+    """
+    with temp_directory("syncerrors") as directory:
+        fm = FileMgr(directory, 400, sync_policy=SyncPolicy.COMMIT)
+        p = Page(fm.block_size)
+        sync = BufferedChannel.sync
+
+        def failing_sync(channel):
+            raise OSError(errno.EIO, "Input/output error")
+
+        BufferedChannel.sync = failing_sync
+        try:
+            for force in (lambda: fm.sync("datafile"), lambda: fm.force("logfile"), lambda: fm.force_data("logfile")):
+                fm.write(fm.append("datafile"), p)
+                try:
+                    force()
+                    assert False, "the sync error must be reported"
+                except RuntimeError as e:
+                    assert str(e) == "Cannot sync datafile" and isinstance(e.__cause__, OSError)
+        finally:
+            BufferedChannel.sync = sync
+        fm.close()
+
+
+def test_block_cache_budget():
+    """
+    Verifies that the block cache stays within its byte budget and counts hits and misses.
+    """
+    with temp_directory("cachetest") as directory:
+        fm = FileMgr(directory, 400, cache_size=1000)  # Room for two blocks
+        for _ in range(4):
+            fm.append("testfile")
+
+        p = Page(fm.block_size)
+        for i in range(4):
+            fm.read(BlockID("testfile", i), p)
+        assert len(fm.cache) == 2
+        assert fm.cache.size <= 1000
+        assert fm.cache.misses == 4 and fm.cache.evictions == 2
+
+        # Blocks 2 and 3 are still cached, block 0 was evicted
+        fm.read(BlockID("testfile", 3), p)
+        fm.read(BlockID("testfile", 0), p)
+        assert fm.cache.hits == 1 and fm.cache.misses == 5
+
+        # Writing a block invalidates its cached copy
+        p.set_int(0, 7)
+        fm.write(BlockID("testfile", 0), p)
+        p.set_int(0, 0)
+        fm.read(BlockID("testfile", 0), p)
+        assert p.get_int(0) == 7
+
+        # A zero budget disables the cache
+        fm2 = FileMgr(directory, 400, cache_size=0)
+        fm2.read(BlockID("testfile", 0), p)
+        assert len(fm2.cache) == 0 and fm2.cache.misses == 0
+
+
+def test_async_io():
+    """
+    Writes the same blocks several times asynchronously and checks that reads, whether blocking
+    or asynchronous, see the last write of each block, with and without I/O threads.
+    """
+    for workers in (0, 2):
+        with temp_directory("asynctest") as directory:
+            fm = FileMgr(directory, 400, io_workers=workers)
+            blocks = [fm.append("asyncfile") for _ in range(8)]
+            p = Page(fm.block_size)
+            for version in range(3):
+                for blk in blocks:
+                    p.set_int(0, blk.number * 10 + version)
+                    fm.write_async(blk, p)  # The page is copied, so it can be changed right away
+
+            fm.read(blocks[0], p)
+            assert p.get_int(0) == 2
+            futures = [fm.read_async(blk, Page(fm.block_size)) for blk in blocks]
+            assert [f.result().get_int(0) for f in futures] == [blk.number * 10 + 2 for blk in blocks]
+
+            fm.wait_for_writes()
+            fm.close()
+
+
+def test_open_file_limit():
+    """
+    Uses more files than may be open at once and checks that channels are closed and reopened
+    on demand without losing data.
+    """
+    with temp_directory("fdtest") as directory:
+        fm = FileMgr(directory, 400, max_open_files=4)
+        p = Page(fm.block_size)
+        for i in range(20):
+            p.set_int(0, i)
+            fm.write(fm.append(f"file{i}"), p)
+        assert fm.open_files == 4
+        assert fm.file_opens == 20 and fm.file_evictions == 16
+
+        for i in range(20):
+            fm.read(BlockID(f"file{i}", 0), p)
+            assert p.get_int(0) == i
+            assert fm.block_num(f"file{i}") == 1
+        assert fm.open_files == 4 and fm.file_opens == 40
+        fm.close()
+
+
+def test_temp_files():
+    """
+    Only names handed out by next_temp_name are temporary: a table whose name starts with "temp"
+    is a regular file and survives the cleanup of temporary files at startup.
+    """
+    with temp_directory("temptest") as directory:
+        fm = FileMgr(directory, 400)
+        temp = fm.next_temp_name() + ".tbl"
+        assert FileMgr.is_temp(temp)
+        assert not FileMgr.is_temp("temperature.tbl") and not FileMgr.is_temp("temp1.tbl")
+        for filename in (temp, "temperature.tbl"):
+            fm.write(fm.append(filename), Page(fm.block_size))
+        fm.close()
+
+        FileMgr(directory, 400).close()
+        assert sorted(os.listdir(directory)) == ["temperature.tbl"]
+
+
+def test_temp_files_of_other_processes():
+    """
+    Temporary files are named after their process: the startup cleanup keeps those of running
+    processes sharing the directory and removes those of processes that ended.
+    """
+    with temp_directory("tempsharetest") as directory:
+        fm = FileMgr(directory, 400)
+        assert fm.next_temp_name().startswith(f"{FileMgr.TEMP_PREFIX}{os.getpid()}-")
+        ended = subprocess.Popen([sys.executable, "-c", "pass"])
+        ended.wait()
+        running = f"{FileMgr.TEMP_PREFIX}{os.getppid()}-1.tbl"
+        for filename in (running, f"{FileMgr.TEMP_PREFIX}{ended.pid}-1.tbl"):
+            fm.write(fm.append(filename), Page(fm.block_size))
+        fm.close()
+
+        FileMgr(directory, 400).close()
+        if os.name == 'posix':  # Elsewhere the files of other processes are always kept
+            assert os.listdir(directory) == [running]
+
+
+if __name__ == "__main__":
+    test_buffered_mode()
+    test_mmap_mode()
+    test_pread_mode()
+    test_direct_mode()
+    test_concurrent_reads()
+    test_extent_allocation()
+    test_read_range()
+    test_sync_policies()
+    test_sync_errors()
+    test_block_cache_budget()
+    test_async_io()
+    test_open_file_limit()
+    test_temp_files()
+    test_temp_files_of_other_processes()
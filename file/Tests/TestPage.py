@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 15:02
+# @Author  : EvanWong
+# @File    : TestPage.py
+# @Project : TestDB
+from file.Page import Page
+
+
+def test_page_accessors():
+    """
+    Checks the single-field accessors, the zero-copy view and the multi-field helpers
+    against each other.
+    """
+    p = Page(100)
+    p.set_int(0, -7)
+    p.set_float(4, 2.5)
+    p.set_string(8, "héllo")
+    assert p.get_int(0) == -7
+    assert p.get_float(4) == 2.5
+    assert p.get_string(8) == "héllo"
+    assert p.get_bytes(8) == bytearray("héllo".encode('utf-8'))
+
+    # The view shares memory with the page, the copy does not
+    view = p.get_bytes_view(8)
+    copy = p.get_bytes(8)
+    p.set_string(8, "world!")
+    assert bytes(view) == b"world!"
+    assert copy == bytearray("héllo".encode('utf-8'))
+    assert view.readonly
+
+    # Multi-field helpers use the same layout as the single-field accessors
+    p.set_fields(40, '!iif', 1, 2, 0.5)
+    assert (p.get_int(40), p.get_int(44), p.get_float(48)) == (1, 2, 0.5)
+    p.set_int(44, 9)
+    assert p.get_fields(40, '!iif') == (1, 9, 0.5)
+
+
+if __name__ == "__main__":
+    test_page_accessors()
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 10:02
+# @Author  : EvanWong
+# @File    : __init__.py.py
+# @Project : TestDB
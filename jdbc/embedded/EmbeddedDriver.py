@@ -4,7 +4,11 @@
 # @File    : EmbeddedDriver.py
 # @Project : TestDB
 
+import os
+from typing import Optional
+
 from jdbc.embedded.EmbeddedConnection import EmbeddedConnection
+from simpledb.DBConfig import DBConfig
 from simpledb.SimpleDB import SimpleDB
 
 class EmbeddedDriver:
@@ -12,21 +16,27 @@ class EmbeddedDriver:
     A simplified Driver-like class that can connect to a local embedded DB.
 
     Methods:
-        connect(db_name: str) -> EmbeddedConnection
+        connect(db_name: str, config_file: Optional[str] = None, **overrides) -> EmbeddedConnection
             Create a new EmbeddedConnection to the specified database.
     """
 
     @staticmethod
-    def connect(db_name: str) -> EmbeddedConnection:
+    def connect(db_name: str, config_file: Optional[str] = None, **overrides) -> EmbeddedConnection:
         """
         Create or open a local embedded DB with the specified name,
         and return a new EmbeddedConnection.
 
         Args:
             db_name (str): The name/path of the database.
+            config_file (Optional[str]): The INI file configuring the engine. Defaults to the
+                configuration recorded in the database directory.
+            **overrides: Settings overriding the configuration file, as accepted by `DBConfig`,
+                e.g. memory_budget=64 << 20.
 
         Returns:
             EmbeddedConnection: A new connection instance.
         """
-        db = SimpleDB(db_name)
+        if config_file is None:
+            config_file = os.path.join(db_name, DBConfig.CONFIG_FILE)
+        db = SimpleDB(db_name, config=DBConfig.load(config_file, **overrides))
         return EmbeddedConnection(db)
\ No newline at end of file
@@ -4,6 +4,11 @@
 # @File    : LogMgr.py
 # @Project : TestDB
 
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque
+
 from file.BlockID import BlockID
 from file.FileMgr import FileMgr
 from file.Page import Page
@@ -22,6 +27,9 @@ class LogMgr:
         - The start position of each block stores an int value, representing the start position of the last log,
         - the start position of each log record stores an int value, representing the size of the log data in bytes.
 
+    Appending and flushing are serialized by a lock, since transactions and the background buffer
+    writer use the log from different threads.
+
     Attributes:
         __fm (FileMgr): The file manager used to manage the log file.
         __logfile (str): The name of the log file.
@@ -29,17 +37,25 @@ class LogMgr:
         __current_blk (BlockID): The current block in the log file.
         __latest_LSN (int): The latest Log Sequence Number (LSN).
         __last_saved_LSN (int): The last saved Log Sequence Number (LSN).
+        __buffer_blocks (int): The number of filled log blocks that may be written back at once.
+        __pending_writes (Deque[Future]): The asynchronous writes of filled log blocks, oldest first,
+            until a flush has waited for them.
+        __lock (threading.RLock): Serializes appends and flushes.
     """
 
-    def __init__(self, fm: FileMgr, logfile: str):
+    def __init__(self, fm: FileMgr, logfile: str, buffer_blocks: int = 1):
         """
         Initializes the LogMgr with a given file manager and log file.
 
         Args:
             fm (FileMgr): The file manager to manage the log file.
             logfile (str): The name of the log file.
+            buffer_blocks (int): The number of filled log blocks that may be written back
+                asynchronously at once before appending waits for the oldest of them.
         """
         self.__fm: FileMgr = fm
+        self.__lock: threading.RLock = threading.RLock()
+        self.__buffer_blocks: int = buffer_blocks
         self.__logfile: str = logfile
         self.__log_page: Page = Page(bytearray(fm.block_size))  # Buffer to hold log records
 
@@ -56,18 +72,47 @@ class LogMgr:
 
         self.__latest_LSN = 0  # The latest LSN (Log Sequence Number)
         self.__last_saved_LSN = 0  # The last saved LSN
+        self.__pending_writes: Deque[Future] = deque()
 
     def flush(self, lsn: int):
         """
-        Flushes the log file to disk if the LSN is greater than or equal to the latest LSN.
+        Flushes the log file to disk if the record with the given LSN has not been saved yet.
 
         This ensures that the log is saved up to the latest valid record.
 
+        Filled log blocks are written back asynchronously when the log moves on to the next
+        block; the flush also waits for those writes, so the record is on disk whichever block holds it.
+
         Args:
             lsn (int): The Log Sequence Number to check against.
         """
-        if lsn >= self.__latest_LSN:
-            self.__flush()  # Flush the current log page to disk
+        with self.__lock:
+            if lsn > self.__last_saved_LSN:
+                self.__flush()  # Flush the current log page to disk
+            while self.__pending_writes:
+                self.__pending_writes.popleft().result()
+
+    def force(self, lsn: int):
+        """
+        Flushes the log up to the given LSN and makes it durable as prescribed by the file
+        manager's sync policy.
+
+        The log file is synced after the data files. This alone does not keep a commit record from
+        reaching stable storage first, since the operating system may write the log page back at
+        any time: `force_data` must be called before the record is appended.
+
+        Args:
+            lsn (int): The Log Sequence Number of the record that must become durable.
+        """
+        self.flush(lsn)
+        self.__fm.force(self.__logfile)
+
+    def force_data(self):
+        """
+        Makes the data files written so far durable, as prescribed by the file manager's sync
+        policy, without the log file. Called before a commit or rollback record is appended.
+        """
+        self.__fm.force_data(self.__logfile)
 
     @property
     def iterator(self) -> LogIterator:
@@ -80,8 +125,9 @@ class LogMgr:
         Returns:
             LogIterator: The log iterator.
         """
-        self.__flush()  # Ensure that the current log page is flushed before iteration.
-        return LogIterator(self.__fm, self.__current_blk)
+        with self.__lock:
+            self.flush(self.__latest_LSN)  # Ensure that the log is flushed before iteration.
+            return LogIterator(self.__fm, self.__current_blk)
 
     def append(self, log_rec: bytearray) -> int:
         """
@@ -96,23 +142,24 @@ class LogMgr:
         Returns:
             int: The Log Sequence Number (LSN) of the appended record.
         """
-        boundary = self.__log_page.get_int(0)  # Get the position of the last written record
-        rec_size = len(log_rec)  # The size of the log record
-        bytes_needed = rec_size + 4  # We need 4 extra bytes for boundary information
+        with self.__lock:
+            boundary = self.__log_page.get_int(0)  # Get the position of the last written record
+            rec_size = len(log_rec)  # The size of the log record
+            bytes_needed = rec_size + 4  # We need 4 extra bytes for boundary information
 
-        if boundary - bytes_needed < 4:  # We need at least 4 bytes to store the position of last log.
-            self.__flush()  # Flush the current block to disk
-            self.__current_blk = self.append_new_block()  # Create a new block and get the new block ID
-            boundary = self.__log_page.get_int(0)  # Get the new boundary location
+            if boundary - bytes_needed < 4:  # We need at least 4 bytes to store the position of last log.
+                self.__flush_async()  # Write the full block back while the log moves on
+                self.__current_blk = self.append_new_block()  # Create a new block and get the new block ID
+                boundary = self.__log_page.get_int(0)  # Get the new boundary location
 
-        # Calculate the position to write the log record
-        rec_pos = boundary - bytes_needed
-        self.__log_page.set_bytes(rec_pos, log_rec)  # Write the log record to the page buffer
-        self.__log_page.set_int(0, rec_pos)  # Update the boundary with the new position
+            # Calculate the position to write the log record
+            rec_pos = boundary - bytes_needed
+            self.__log_page.set_bytes(rec_pos, log_rec)  # Write the log record to the page buffer
+            self.__log_page.set_int(0, rec_pos)  # Update the boundary with the new position
 
-        # Increment the LSN for the new log entry
-        self.__latest_LSN += 1
-        return self.__latest_LSN
+            # Increment the LSN for the new log entry
+            self.__latest_LSN += 1
+            return self.__latest_LSN
 
     def append_new_block(self) -> BlockID:
         """
@@ -136,3 +183,16 @@ class LogMgr:
         """
         self.__fm.write(self.__current_blk, self.__log_page)
         self.__last_saved_LSN = self.__latest_LSN  # Update the last saved LSN
+
+    def __flush_async(self):
+        """
+        Hands the current log page to the file manager to be written back on an I/O thread.
+
+        Used when the current block is full: appending to the next block does not wait for the
+        write, and the next `flush` does. Once `buffer_blocks` writes are in flight, the oldest
+        one is waited for first.
+        """
+        while len(self.__pending_writes) >= self.__buffer_blocks:
+            self.__pending_writes.popleft().result()
+        self.__pending_writes.append(self.__fm.write_async(self.__current_blk, self.__log_page))
+        self.__last_saved_LSN = self.__latest_LSN
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 17:30
+# @Author  : EvanWong
+# @File    : MaterializePlan.py
+# @Project : TestDB
+
+import math
+
+from materialize.TempTable import TempTable
+from plan.Plan import Plan
+from query.Scan import Scan
+from record.Layout import Layout
+from record.Schema import Schema
+from tx.Transaction import Transaction
+
+
+class MaterializePlan(Plan):
+    """
+    A plan that saves the output of its source plan into a temporary table.
+
+    Opening the plan runs the source query once and copies its records into the table, so the
+    result can be scanned many times, e.g. as the inner side of a product, without evaluating
+    the source again. The copy pays neither locking nor logging, and it is loaded through a buffer
+    ring, so a large result does not evict the rest of the buffer pool.
+    """
+
+    def __init__(self, tx: Transaction, src_plan: Plan):
+        """
+        Initialize a MaterializePlan for the given source plan.
+
+        Args:
+            tx (Transaction): The current transaction.
+            src_plan (Plan): The plan whose output is materialized.
+        """
+        self.__tx = tx
+        self.__src_plan = src_plan
+
+    def open(self) -> Scan:
+        """
+        Run the source query, copy its output into a temporary table and open a scan on it.
+
+        Returns:
+            Scan: A scan over the temporary table, positioned before the first record.
+        """
+        schema = self.__src_plan.schema()
+        temp = TempTable(self.__tx, schema)
+        src = self.__src_plan.open()
+        dest = temp.open(bulk=True)
+        while src.next():
+            dest.insert()
+            for field_name in schema.fields:
+                dest.set_value(field_name, src.get_value(field_name))
+        src.close()
+        dest.before_first()
+        return dest
+
+    def accessed_blocks(self) -> int:
+        """
+        Estimate the number of blocks of the temporary table, which is what scanning it costs.
+        The one-time cost of materializing is not included.
+
+        Returns:
+            int: The estimated number of blocks.
+        """
+        records_per_block = self.__tx.block_size // Layout(self.__src_plan.schema()).slot_size
+        return math.ceil(self.__src_plan.output_records() / records_per_block)
+
+    def output_records(self) -> int:
+        """
+        Return the number of records, the same as the source plan.
+
+        Returns:
+            int: The estimated number of records.
+        """
+        return self.__src_plan.output_records()
+
+    def distinct_values(self, field_name: str) -> int:
+        """
+        Return the number of distinct values of a field, the same as the source plan.
+
+        Args:
+            field_name (str): The name of the field.
+
+        Returns:
+            int: The estimated number of distinct values.
+        """
+        return self.__src_plan.distinct_values(field_name)
+
+    def schema(self) -> Schema:
+        """
+        Get the schema of the materialized records, the same as the source plan.
+
+        Returns:
+            Schema: The schema.
+        """
+        return self.__src_plan.schema()
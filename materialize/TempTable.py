@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 17:21
+# @Author  : EvanWong
+# @File    : TempTable.py
+# @Project : TestDB
+
+from query.UpdateScan import UpdateScan
+from record.Layout import Layout
+from record.Schema import Schema
+from record.TableScan import TableScan
+from tx.Transaction import Transaction
+
+
+class TempTable:
+    """
+    A table that holds intermediate results, such as materialized, sorted or hashed records.
+
+    The table is stored in a temporary file of its transaction: its blocks are neither locked
+    nor logged, the file is never synced, and it is deleted when the transaction ends, or
+    earlier by `drop`. It is not registered in the catalog.
+
+    Attributes:
+        __tx (Transaction): The transaction owning the table.
+        __table_name (str): The generated name of the table.
+        __layout (Layout): The record layout of the table.
+    """
+
+    def __init__(self, tx: Transaction, schema: Schema):
+        """
+        Creates an empty temporary table with the given schema.
+
+        Args:
+            tx (Transaction): The transaction owning the table.
+            schema (Schema): The schema of the table.
+        """
+        self.__tx: Transaction = tx
+        filename = tx.create_temp_file(TableScan.TABLE_FILE_SUFFIX)
+        self.__table_name: str = filename[:-len(TableScan.TABLE_FILE_SUFFIX)]
+        self.__layout: Layout = Layout(schema)
+
+    def open(self, bulk: bool = False) -> UpdateScan:
+        """
+        Opens a scan over the table.
+
+        Args:
+            bulk (bool): Whether the scan loads or reads the table in bulk, through a buffer ring.
+
+        Returns:
+            UpdateScan: A table scan that can read and insert records.
+        """
+        return TableScan(self.__tx, self.__table_name, self.__layout, bulk)
+
+    def drop(self):
+        """
+        Deletes the table before its transaction ends. All scans on it must be closed.
+        """
+        self.__tx.drop_temp_file(self.__table_name + TableScan.TABLE_FILE_SUFFIX)
+
+    @property
+    def table_name(self) -> str:
+        """
+        Returns the name of the table.
+
+        Returns:
+            str: The generated table name.
+        """
+        return self.__table_name
+
+    @property
+    def layout(self) -> Layout:
+        """
+        Returns the record layout of the table.
+
+        Returns:
+            Layout: The layout of the table.
+        """
+        return self.__layout
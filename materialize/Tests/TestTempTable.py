@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 17:41
+# @Author  : EvanWong
+# @File    : TestTempTable.py
+# @Project : TestDB
+import contextlib
+import io
+import os
+
+from file.FileMgr import FileMgr
+from file.Tests.TempDirectory import temp_directory
+from materialize.MaterializePlan import MaterializePlan
+from plan.TablePlan import TablePlan
+from simpledb.DBConfig import DBConfig
+from simpledb.SimpleDB import SimpleDB
+
+ROWS = 200
+
+
+def test_materialize_is_unlogged():
+    """
+    Materializes a table into a temporary table and checks that the copy wrote no log records,
+    and that the temporary file is gone once the transaction commits.
+    """
+    with temp_directory("tempdb") as directory:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = SimpleDB(directory, config=DBConfig(block_size=400, buffer_count=8))
+            tx = db.new_tx
+            db.planner.execute_update("create table src (a int, b varchar(10))", tx)
+            for i in range(ROWS):
+                db.planner.execute_update(f"insert into src (a, b) values ({i}, 'r{i}')", tx)
+            tx.commit()
+
+            tx = db.new_tx
+            log_blocks = db.file_mgr.block_num(SimpleDB.LOG_FILE)
+            plan = MaterializePlan(tx, TablePlan(tx, "src", db.metadata_mgr))
+            scan = plan.open()
+            assert db.file_mgr.block_num(SimpleDB.LOG_FILE) == log_blocks
+            temp_files = [f for f in os.listdir(directory) if FileMgr.is_temp(f)]
+            assert len(temp_files) == 1
+
+            values = []
+            while scan.next():
+                values.append(scan.get_int("a"))
+            scan.close()
+            assert sorted(values) == list(range(ROWS))
+            tx.commit()
+        assert not [f for f in os.listdir(directory) if FileMgr.is_temp(f)]
+        db.close()
+
+
+if __name__ == "__main__":
+    test_materialize_is_unlogged()
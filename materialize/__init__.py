@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 17:20
+# @Author  : EvanWong
+# @File    : __init__.py
+# @Project : TestDB
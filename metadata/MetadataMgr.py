@@ -13,6 +13,7 @@ from metadata.TableMgr import TableMgr
 from metadata.ViewMgr import ViewMgr
 from record.Layout import Layout
 from record.Schema import Schema
+from record.TableScan import TableScan
 from tx.Transaction import Transaction
 
 
@@ -23,6 +24,10 @@ class MetadataMgr:
     This class hides the internal managers (TableMgr, ViewMgr, IndexMgr, StatMgr) and provides
     simplified interfaces for creating and retrieving metadata.
 
+    The catalog tables are read by almost every statement, so a few buffers are reserved for each
+    of them to keep them resident while large scans run; `set_residency` reserves buffers for
+    other tables, e.g. small lookup tables. Reservations last until the engine shuts down.
+
     Attributes:
         __tm (TableMgr): The manager for table creation and layout retrieval.
         __vm (ViewMgr): The manager for creating and retrieving view definitions.
@@ -30,6 +35,9 @@ class MetadataMgr:
         __im (IndexMgr): The manager for creating and retrieving index information.
     """
 
+    CATALOG_TABLES = ("table_cat", "field_cat", "index_cat", "view_cat")  # Tables holding the metadata
+    CATALOG_FRAMES = 2  # Buffers reserved for each catalog table
+
     def __init__(self, is_new: bool, tx: Transaction):
         """
         Initialize the MetadataMgr with references to all internal managers.
@@ -42,6 +50,25 @@ class MetadataMgr:
         self.__vm = ViewMgr(is_new, self.__tm, tx)
         self.__sm = StatMgr(self.__tm, tx)
         self.__im = IndexMgr(is_new, self.__tm, self.__sm, tx)
+        for table_name in self.CATALOG_TABLES:
+            self.set_residency(table_name, self.CATALOG_FRAMES, tx)
+
+    def set_residency(self, table_name: str, frames: int, tx: Transaction) -> int:
+        """
+        Keep up to the given number of blocks of a table resident in the buffer pool.
+
+        The buffers reserved for all tables are limited to a share of the pool, so fewer buffers
+        than asked may be reserved; 0 cancels the reservation.
+
+        Args:
+            table_name (str): The table name.
+            frames (int): The number of buffers to reserve.
+            tx (Transaction): The current transaction.
+
+        Returns:
+            int: The number of buffers reserved.
+        """
+        return tx.reserve_buffers(table_name + TableScan.TABLE_FILE_SUFFIX, frames)
 
     def create_table(self, table_name: str, schema: Schema, tx: Transaction):
         """
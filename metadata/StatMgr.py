@@ -98,7 +98,7 @@ class StatMgr:
         records_count = 0
         blocks_count = 0
 
-        ts = TableScan(tx, table_name, layout)
+        ts = TableScan(tx, table_name, layout, bulk=True)  # Do not evict the working set
         while ts.next():
             records_count += 1
             blocks_count = max(blocks_count, ts.get_rid().block_number + 1)
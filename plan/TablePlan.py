@@ -16,8 +16,13 @@ class TablePlan(Plan):
 
     This plan can open a TableScan, and uses metadata manager to
     retrieve statistical info (blocks, records, distinct values).
+
+    A table larger than a BULK_FRACTION of the buffer pool is scanned in bulk, through a buffer
+    ring, so that reading it does not evict the blocks other transactions are working with.
     """
 
+    BULK_FRACTION = 4  # Tables above 1/BULK_FRACTION of the pool are scanned through a ring
+
     def __init__(self, tx: Transaction, table_name: str, mdm: MetadataMgr):
         """
         Initialize a TablePlan for the specified table.
@@ -37,12 +42,13 @@ class TablePlan(Plan):
 
     def open(self) -> TableScan:
         """
-        Open a TableScan for this table.
+        Open a TableScan for this table, in bulk mode if the table is large.
 
         Returns:
             TableScan: The scan over the entire table.
         """
-        return TableScan(self.__tx, self.__table_name, self.__layout)
+        bulk = self.__stat_info.accessed_blocks > self.__tx.buffer_count // self.BULK_FRACTION
+        return TableScan(self.__tx, self.__table_name, self.__layout, bulk)
 
     def accessed_blocks(self) -> int:
         """
@@ -4,6 +4,9 @@
 # @File    : RecordPage.py
 # @Project : TestDB
 
+from typing import Optional
+
+from buffer.BufferRing import BufferRing
 from file.BlockID import BlockID
 from record.FieldType import FieldType
 from record.Layout import Layout
@@ -32,7 +35,7 @@ class RecordPage:
     EMPTY = 0  # Flag indicating the slot is empty
     USED = 1  # Flag indicating the slot is used
 
-    def __init__(self, tx: Transaction, blk: BlockID, layout: Layout):
+    def __init__(self, tx: Transaction, blk: BlockID, layout: Layout, ring: Optional[BufferRing] = None):
         """
         Initialize a RecordPage with a transaction, block ID, and layout.
 
@@ -40,12 +43,13 @@ class RecordPage:
             tx (Transaction): The transaction managing this RecordPage.
             blk (BlockID): The block identifier.
             layout (Layout): The layout of the records in the block.
+            ring (Optional[BufferRing]): The buffer ring to pin the block through, for bulk operations.
         """
         self.__tx = tx
         self.__blk = blk
         self.__layout = layout
         # print(f"RecordPage called pin block {self.__blk}")
-        self.__tx.pin(self.__blk)  # Pin the block in the buffer pool
+        self.__tx.pin(self.__blk, ring)  # Pin the block in the buffer pool
 
     def set_int(self, slot: int, field_name: str, value: int):
         """
@@ -5,6 +5,7 @@
 # @Project : TestDB
 from typing import Optional
 
+from buffer.BufferRing import BufferRing
 from file.BlockID import BlockID
 from query.Constant import Constant
 from query.UpdateScan import UpdateScan
@@ -26,7 +27,7 @@ class TableScan(UpdateScan):
 
     TABLE_FILE_SUFFIX = ".tbl"
 
-    def __init__(self, tx: Transaction, table_name: str, layout: Layout):
+    def __init__(self, tx: Transaction, table_name: str, layout: Layout, bulk: bool = False):
         """
         Initialize a TableScan for a specific table.
 
@@ -34,10 +35,13 @@ class TableScan(UpdateScan):
             tx (Transaction): The transaction managing this scan.
             table_name (str): The name of the table to scan.
             layout (Layout): The layout of the records in the table.
+            bulk (bool): Whether the scan reads or loads a large part of the table; a bulk scan
+                pins its blocks through a buffer ring, so it does not evict the rest of the pool.
         """
         self.__tx: Transaction = tx
         self.__layout: Layout = layout
         self.__table_file_name: str = table_name + self.TABLE_FILE_SUFFIX
+        self.__ring: Optional[BufferRing] = tx.new_buffer_ring() if bulk else None
 
         self.__rp: Optional[RecordPage] = None  # Current RecordPage
         self.__current_slot: Optional[int] = None  # Current slot number
@@ -156,7 +160,7 @@ class TableScan(UpdateScan):
         """
         self.close()  # Unpin the current block
         blk = BlockID(self.__table_file_name, rid.block_number)
-        self.__rp = RecordPage(self.__tx, blk, self.__layout)
+        self.__rp = RecordPage(self.__tx, blk, self.__layout, self.__ring)
         self.__current_slot = rid.slot
 
     def before_first(self):
@@ -293,7 +297,7 @@ class TableScan(UpdateScan):
         """
         self.close()
         blk = BlockID(self.__table_file_name, blk_num)
-        self.__rp = RecordPage(self.__tx, blk, self.__layout)
+        self.__rp = RecordPage(self.__tx, blk, self.__layout, self.__ring)
         self.__current_slot = -1  # Initialize to before the first slot
 
     def __move_to_new_block(self):
@@ -304,7 +308,7 @@ class TableScan(UpdateScan):
         """
         self.close()
         blk = self.__tx.append(self.__table_file_name)
-        self.__rp = RecordPage(self.__tx, blk, self.__layout)
+        self.__rp = RecordPage(self.__tx, blk, self.__layout, self.__ring)
         self.__rp.format()  # Initialize all slots in the new block
         self.__current_slot = -1
 
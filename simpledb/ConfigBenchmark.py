@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 16:55
+# @Author  : EvanWong
+# @File    : ConfigBenchmark.py
+# @Project : TestDB
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from simpledb.DBConfig import DBConfig
+from simpledb.SimpleDB import SimpleDB
+
+ROWS = 1000
+ROWS_PER_TX = 50
+SCANS = 3
+BLOCK_SIZES = [512, 1024, 4096]
+BUFFER_COUNTS = [8, 32, 128]
+
+
+def run_workload(db: SimpleDB) -> (float, float):
+    """
+    Inserts ROWS rows into a new table, then scans the table SCANS times with a selective predicate.
+
+    Args:
+        db (SimpleDB): The database to run the workload against.
+
+    Returns:
+        (float, float): The rows inserted per second and the rows scanned per second.
+    """
+    planner = db.planner
+    tx = db.new_tx
+    planner.execute_update("create table bench (id int, name varchar(20), score float)", tx)
+    tx.commit()
+
+    start = time.perf_counter()
+    for first in range(0, ROWS, ROWS_PER_TX):
+        tx = db.new_tx
+        for i in range(first, first + ROWS_PER_TX):
+            planner.execute_update(f"insert into bench (id, name, score) values ({i}, 'name{i}', {i}.5)", tx)
+        tx.commit()
+    insert_rate = ROWS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(SCANS):
+        tx = db.new_tx
+        scan = planner.create_query_plan("select id, name from bench where id = 1234", tx).open()
+        while scan.next():
+            scan.get_string("name")
+        scan.close()
+        tx.commit()
+    scan_rate = SCANS * ROWS / (time.perf_counter() - start)
+    return insert_rate, scan_rate
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        print(f"{ROWS} inserts in transactions of {ROWS_PER_TX}, then {SCANS} full scans; rows per second")
+        print(f"{'block size':>12}{'buffers':>10}{'pool KiB':>10}{'inserts/s':>12}{'scanned/s':>12}")
+        for block_size in BLOCK_SIZES:
+            for buffer_count in BUFFER_COUNTS:
+                config = DBConfig(block_size=block_size, buffer_count=buffer_count)
+                directory = os.path.join(base_directory, f"b{block_size}_n{buffer_count}")
+                with contextlib.redirect_stdout(io.StringIO()):  # Transactions announce every commit
+                    database = SimpleDB(directory, config=config)
+                    inserts, scanned = run_workload(database)
+                    database.close()
+                print(f"{block_size:>12}{buffer_count:>10}{block_size * buffer_count // 1024:>10}"
+                      f"{inserts:>12,.0f}{scanned:>12,.0f}")
+
+        print()
+        print("Configurations derived from memory budgets")
+        for budget in (256 << 10, 1 << 20, 8 << 20):
+            config = DBConfig(memory_budget=budget)
+            directory = os.path.join(base_directory, f"budget{budget}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                database = SimpleDB(directory, config=config)
+                inserts, scanned = run_workload(database)
+                database.close()
+            print(f"{budget // 1024:>8} KiB: {config}")
+            print(f"{'':>14}{inserts:,.0f} inserts/s, {scanned:,.0f} scanned/s")
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 16:05
+# @Author  : EvanWong
+# @File    : DBConfig.py
+# @Project : TestDB
+
+import configparser
+import os
+from typing import Dict, Optional, Union
+
+from buffer.BufferMgr import BufferMgr
+from buffer.BufferWriter import BufferWriter
+from buffer.ReplacementStrategy import ReplacementStrategy
+from file.DirectChannel import DirectChannel
+from file.FileMgr import FileMgr
+from file.IOMode import IOMode
+from file.SyncPolicy import SyncPolicy
+
+_SIZE_SUFFIXES = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+
+def _parse_size(text: str) -> int:
+    """
+    Parses a byte count such as "4096", "64K", "8M" or "1G".
+
+    Args:
+        text (str): The byte count, optionally followed by a K, M or G suffix (with or without a B).
+
+    Returns:
+        int: The number of bytes.
+
+    Raises:
+        ValueError: If the text is not a valid byte count.
+    """
+    text = text.strip().upper().removesuffix('B')
+    if text and text[-1] in _SIZE_SUFFIXES:
+        return int(float(text[:-1]) * _SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+class DBConfig:
+    """
+    The sizing and I/O settings of a database engine, derived from a total memory budget.
+
+    Every setting can be given explicitly; those that are not are derived from the memory budget:
+        - block_size: DEFAULT_BLOCK_SIZE, halved (down to MIN_BLOCK_SIZE, or the direct I/O
+          alignment in direct mode) while the buffer pool would get fewer than MIN_BUFFERS buffers.
+        - buffer_count: as many buffers as fit into POOL_SHARE of the budget, at least MIN_BUFFERS.
+        - cache_size: CACHE_SHARE of the budget, the byte budget of the file manager's block cache.
+          In direct I/O mode the file manager has no cache and its share goes to the buffer pool,
+          so the pool is the only cache and the engine's memory footprint is the budget.
+        - log_buffer_blocks: as many blocks as fit into LOG_SHARE of the budget, at most
+          MAX_LOG_BUFFER_BLOCKS, the number of filled log blocks that may be written back at once.
+        - extent_size, io_mode, sync_policy, io_workers and max_open_files: the file manager defaults.
+        - max_buffer_wait: the buffer manager's default, the seconds a pin waits for a free buffer.
+        - replacement: the buffer replacement policy, LRU unless given.
+        - read_ahead: the largest number of blocks the buffer manager reads ahead of a sequential
+          reader, its default in direct I/O mode and 0 (disabled) otherwise: the other modes go
+          through the operating system's page cache, which already reads ahead of sequential reads.
+        - buffer_partitions: the number of independently latched partitions of the buffer pool, 1
+          (a single pool) unless given.
+        - writer_interval, writer_max_pages, writer_dirty_ratio and writer_flush_ratio: the
+          background writer defaults; a writer_interval of 0 disables the writer.
+
+    Settings are read from the [simpledb] section of an INI file, e.g.
+
+        [simpledb]
+        memory_budget = 64M
+        block_size = 4096
+        sync_policy = group
+
+    and keyword arguments override the file. A database records its configuration in
+    CONFIG_FILE inside its directory when it is created: the settings given explicitly and the
+    block size, which its files are laid out in. Everything else is derived again whenever the
+    database is opened, so reopening it with another memory budget resizes the engine.
+
+    Attributes:
+        __settings (Dict[str, object]): The explicitly given settings, by name.
+    """
+
+    SECTION = 'simpledb'
+    CONFIG_FILE = 'simpledb.ini'
+    DEFAULT_MEMORY_BUDGET = 8 << 20  # Default total memory budget (8 MiB)
+    DEFAULT_BLOCK_SIZE = 4096  # Default block size, the page size of most file systems
+    MIN_BLOCK_SIZE = 512  # Smallest block size chosen for a small budget
+    MIN_BUFFERS = 8  # Smallest buffer pool ever configured
+    POOL_SHARE = 0.85  # Share of the budget given to the buffer pool
+    CACHE_SHARE = 0.10  # Share of the budget given to the file manager's block cache
+    LOG_SHARE = 0.05  # Share of the budget given to log blocks in flight
+    MAX_LOG_BUFFER_BLOCKS = 64  # Largest number of filled log blocks written back at once
+
+    __SIZES = ('memory_budget', 'block_size', 'cache_size')
+    __COUNTS = ('buffer_count', 'log_buffer_blocks', 'extent_size', 'io_workers', 'max_open_files',
+                'read_ahead', 'buffer_partitions', 'writer_max_pages')
+    __FLOATS = ('max_buffer_wait', 'writer_interval', 'writer_dirty_ratio', 'writer_flush_ratio')
+    __ENUMS = {'io_mode': IOMode, 'sync_policy': SyncPolicy, 'replacement': ReplacementStrategy}
+
+    def __init__(self, memory_budget: Optional[Union[int, str]] = None, block_size: Optional[Union[int, str]] = None,
+                 buffer_count: Optional[int] = None, cache_size: Optional[Union[int, str]] = None,
+                 log_buffer_blocks: Optional[int] = None, extent_size: Optional[int] = None,
+                 io_mode: Optional[IOMode] = None, sync_policy: Optional[SyncPolicy] = None,
+                 io_workers: Optional[int] = None, max_open_files: Optional[int] = None,
+                 max_buffer_wait: Optional[float] = None, replacement: Optional[ReplacementStrategy] = None,
+                 read_ahead: Optional[int] = None, buffer_partitions: Optional[int] = None,
+                 writer_interval: Optional[float] = None, writer_max_pages: Optional[int] = None,
+                 writer_dirty_ratio: Optional[float] = None, writer_flush_ratio: Optional[float] = None):
+        """
+        Initializes a configuration; settings left as None are derived from the memory budget.
+        Sizes are given in bytes, either as numbers or in the form of the INI file, e.g. "64M".
+
+        Args:
+            memory_budget (Optional[Union[int, str]]): The total memory, in bytes, for buffers, cache and log.
+            block_size (Optional[Union[int, str]]): The size of a block in bytes.
+            buffer_count (Optional[int]): The number of buffers in the buffer pool.
+            cache_size (Optional[Union[int, str]]): The byte budget of the file manager's block cache.
+            log_buffer_blocks (Optional[int]): The number of filled log blocks written back at once.
+            extent_size (Optional[int]): The number of blocks a file grows by.
+            io_mode (Optional[IOMode]): The I/O backend of the file manager.
+            sync_policy (Optional[SyncPolicy]): The durability mode applied on commit.
+            io_workers (Optional[int]): The number of asynchronous I/O threads.
+            max_open_files (Optional[int]): The number of file channels the file manager keeps open.
+            max_buffer_wait (Optional[float]): The seconds a pin waits for a free buffer before aborting.
+            replacement (Optional[ReplacementStrategy]): The buffer replacement policy.
+            read_ahead (Optional[int]): The largest number of blocks read ahead; 0 disables reading ahead.
+            buffer_partitions (Optional[int]): The number of partitions of the buffer pool.
+            writer_interval (Optional[float]): The seconds between two background writer rounds; 0 disables it.
+            writer_max_pages (Optional[int]): The number of buffers the background writer writes per round.
+            writer_dirty_ratio (Optional[float]): The share of dirty buffers above which the writer writes.
+            writer_flush_ratio (Optional[float]): The share of dirty buffers above which it writes them all.
+
+        Raises:
+            ValueError: If a size, count or ratio is not a number or is out of range.
+        """
+        settings = dict(memory_budget=memory_budget, block_size=block_size, buffer_count=buffer_count,
+                        cache_size=cache_size, log_buffer_blocks=log_buffer_blocks, extent_size=extent_size,
+                        io_mode=io_mode, sync_policy=sync_policy, io_workers=io_workers,
+                        max_open_files=max_open_files, max_buffer_wait=max_buffer_wait,
+                        replacement=replacement, read_ahead=read_ahead, buffer_partitions=buffer_partitions,
+                        writer_interval=writer_interval, writer_max_pages=writer_max_pages,
+                        writer_dirty_ratio=writer_dirty_ratio, writer_flush_ratio=writer_flush_ratio)
+        self.__settings: Dict[str, object] = {k: v for k, v in settings.items() if v is not None}
+        for name, value in self.__settings.items():
+            if name in self.__SIZES and isinstance(value, str):
+                value = self.__settings[name] = _parse_size(value)
+            if name in self.__ENUMS:
+                valid = isinstance(value, self.__ENUMS[name])
+            elif name in self.__FLOATS:
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            else:
+                valid = isinstance(value, int) and not isinstance(value, bool)
+            if not valid:
+                raise ValueError(f"Invalid {name}: {value!r}")
+        for name in ('memory_budget', 'block_size', 'buffer_count', 'log_buffer_blocks', 'extent_size',
+                     'max_open_files', 'buffer_partitions', 'writer_max_pages'):
+            if self.__settings.get(name, 1) < 1:
+                raise ValueError(f"{name} must be positive.")
+        for name in ('cache_size', 'io_workers', 'max_buffer_wait', 'read_ahead', 'writer_interval'):
+            if self.__settings.get(name, 0) < 0:
+                raise ValueError(f"{name} must not be negative.")
+        for name in ('writer_dirty_ratio', 'writer_flush_ratio'):
+            if not 0 <= self.__settings.get(name, 0) <= 1:
+                raise ValueError(f"{name} must lie between 0 and 1.")
+
+    @staticmethod
+    def load(path: Optional[str] = None, **overrides) -> 'DBConfig':
+        """
+        Reads a configuration from an INI file and applies keyword overrides on top of it.
+
+        Args:
+            path (Optional[str]): The INI file; a missing file is treated as an empty one.
+            **overrides: Settings that take precedence over the file, as accepted by the constructor.
+
+        Returns:
+            DBConfig: The resulting configuration.
+
+        Raises:
+            ValueError: If the file contains an unknown setting or an invalid value.
+        """
+        settings: Dict[str, object] = {}
+        parser = configparser.ConfigParser()
+        if path is not None and parser.read(path) and parser.has_section(DBConfig.SECTION):
+            for name, value in parser.items(DBConfig.SECTION):
+                if name in DBConfig.__SIZES:
+                    settings[name] = _parse_size(value)
+                elif name in DBConfig.__COUNTS:
+                    settings[name] = int(value)
+                elif name in DBConfig.__FLOATS:
+                    settings[name] = float(value)
+                elif name in DBConfig.__ENUMS:
+                    try:
+                        settings[name] = DBConfig.__ENUMS[name][value.strip().upper()]
+                    except KeyError:
+                        raise ValueError(f"Invalid {name} in {path}: {value}") from None
+                else:
+                    raise ValueError(f"Unknown setting in {path}: {name}")
+        settings.update((k, v) for k, v in overrides.items() if v is not None)
+        return DBConfig(**settings)
+
+    def save(self, path: str):
+        """
+        Writes the explicitly given settings and the block size to an INI file that `load` reads
+        back. Derived settings are left out, so they are derived again from the memory budget
+        the file is loaded with.
+
+        Args:
+            path (str): The INI file to write.
+        """
+        settings = {**self.__settings, 'block_size': self.block_size}
+        parser = configparser.ConfigParser()
+        parser[self.SECTION] = {name: value.name.lower() if name in self.__ENUMS else str(value)
+                                for name, value in settings.items()}
+        with open(path, 'w') as f:
+            parser.write(f)
+
+    def replace(self, **overrides) -> 'DBConfig':
+        """
+        Returns a copy of this configuration with some settings replaced.
+
+        Settings derived from the memory budget are derived again, e.g. replacing the block size
+        changes the number of buffers unless that was given explicitly.
+
+        Args:
+            **overrides: The settings to replace, as accepted by the constructor.
+
+        Returns:
+            DBConfig: The new configuration.
+        """
+        return DBConfig(**{**self.__settings, **overrides})
+
+    def is_explicit(self, name: str) -> bool:
+        """
+        Returns whether a setting was given explicitly rather than derived.
+
+        Args:
+            name (str): The name of the setting.
+
+        Returns:
+            bool: True if the setting was given explicitly.
+        """
+        return name in self.__settings
+
+    @property
+    def memory_budget(self) -> int:
+        """
+        Returns the total memory budget.
+
+        Returns:
+            int: The budget in bytes for the buffer pool, the block cache and the log blocks in flight.
+        """
+        return self.__settings.get('memory_budget', self.DEFAULT_MEMORY_BUDGET)
+
+    @property
+    def block_size(self) -> int:
+        """
+        Returns the block size.
+
+        Returns:
+            int: The size of a block in bytes.
+        """
+        if 'block_size' in self.__settings:
+            return self.__settings['block_size']
+        block_size = self.DEFAULT_BLOCK_SIZE
+        minimum = DirectChannel.ALIGNMENT if self.io_mode == IOMode.DIRECT else self.MIN_BLOCK_SIZE
+        pool_bytes = self.memory_budget * self.__pool_share()
+        while block_size > minimum and pool_bytes // block_size < self.MIN_BUFFERS:
+            block_size //= 2
+        return block_size
+
+    @property
+    def buffer_count(self) -> int:
+        """
+        Returns the number of buffers in the buffer pool.
+
+        Returns:
+            int: The number of buffers.
+        """
+        if 'buffer_count' in self.__settings:
+            return self.__settings['buffer_count']
+        return max(self.MIN_BUFFERS, int(self.memory_budget * self.__pool_share()) // self.block_size)
+
+    @property
+    def cache_size(self) -> int:
+        """
+        Returns the byte budget of the file manager's block cache.
+
+        Returns:
+            int: The cache size in bytes.
+        """
+        if 'cache_size' in self.__settings:
+            return self.__settings['cache_size']
+        if self.io_mode == IOMode.DIRECT:
+            return 0
+        return int(self.memory_budget * self.CACHE_SHARE)
+
+    @property
+    def log_buffer_blocks(self) -> int:
+        """
+        Returns the number of filled log blocks that may be written back at once.
+
+        Returns:
+            int: The number of log blocks.
+        """
+        if 'log_buffer_blocks' in self.__settings:
+            return self.__settings['log_buffer_blocks']
+        blocks = int(self.memory_budget * self.LOG_SHARE) // self.block_size
+        return max(1, min(self.MAX_LOG_BUFFER_BLOCKS, blocks))
+
+    @property
+    def extent_size(self) -> int:
+        """
+        Returns the number of blocks a file grows by.
+
+        Returns:
+            int: The extent size in blocks.
+        """
+        return self.__settings.get('extent_size', 1)
+
+    @property
+    def io_mode(self) -> IOMode:
+        """
+        Returns the I/O backend of the file manager.
+
+        Returns:
+            IOMode: The I/O mode.
+        """
+        return self.__settings.get('io_mode', IOMode.BUFFERED)
+
+    @property
+    def sync_policy(self) -> SyncPolicy:
+        """
+        Returns the durability mode applied on commit.
+
+        Returns:
+            SyncPolicy: The sync policy.
+        """
+        return self.__settings.get('sync_policy', SyncPolicy.NONE)
+
+    @property
+    def io_workers(self) -> int:
+        """
+        Returns the number of asynchronous I/O threads.
+
+        Returns:
+            int: The number of I/O workers.
+        """
+        return self.__settings.get('io_workers', FileMgr.DEFAULT_IO_WORKERS)
+
+    @property
+    def max_open_files(self) -> int:
+        """
+        Returns the number of file channels the file manager keeps open.
+
+        Returns:
+            int: The open-file limit.
+        """
+        return self.__settings.get('max_open_files', FileMgr.DEFAULT_MAX_OPEN_FILES)
+
+    @property
+    def max_buffer_wait(self) -> float:
+        """
+        Returns the time a pin waits for a free buffer before the transaction is aborted.
+
+        Returns:
+            float: The maximum wait in seconds.
+        """
+        return self.__settings.get('max_buffer_wait', BufferMgr.DEFAULT_MAX_WAIT)
+
+    @property
+    def replacement(self) -> ReplacementStrategy:
+        """
+        Returns the buffer replacement policy.
+
+        Returns:
+            ReplacementStrategy: The replacement strategy.
+        """
+        return self.__settings.get('replacement', ReplacementStrategy.LRU)
+
+    @property
+    def read_ahead(self) -> int:
+        """
+        Returns the largest number of blocks the buffer manager reads ahead of a sequential reader.
+
+        Returns:
+            int: The read-ahead limit in blocks; 0 means blocks are never read ahead.
+        """
+        if 'read_ahead' in self.__settings:
+            return self.__settings['read_ahead']
+        if self.io_mode == IOMode.DIRECT:
+            return BufferMgr.DEFAULT_READ_AHEAD
+        return 0
+
+    @property
+    def buffer_partitions(self) -> int:
+        """
+        Returns the number of partitions of the buffer pool, each with its own latch.
+
+        Returns:
+            int: The number of partitions; 1 means a single `BufferMgr`.
+        """
+        return self.__settings.get('buffer_partitions', 1)
+
+    @property
+    def writer_interval(self) -> float:
+        """
+        Returns the time between two rounds of the background writer.
+
+        Returns:
+            float: The interval in seconds; 0 means the engine runs no background writer.
+        """
+        return self.__settings.get('writer_interval', BufferWriter.DEFAULT_INTERVAL)
+
+    @property
+    def writer_max_pages(self) -> int:
+        """
+        Returns the number of buffers the background writer writes per round.
+
+        Returns:
+            int: The page limit per round.
+        """
+        return self.__settings.get('writer_max_pages', BufferWriter.DEFAULT_MAX_PAGES)
+
+    @property
+    def writer_dirty_ratio(self) -> float:
+        """
+        Returns the share of dirty buffers above which the background writer starts writing.
+
+        Returns:
+            float: The ratio, between 0 and 1.
+        """
+        return self.__settings.get('writer_dirty_ratio', BufferWriter.DEFAULT_DIRTY_RATIO)
+
+    @property
+    def writer_flush_ratio(self) -> float:
+        """
+        Returns the share of dirty buffers above which the background writer writes all of them.
+
+        Returns:
+            float: The ratio, between 0 and 1.
+        """
+        return self.__settings.get('writer_flush_ratio', BufferWriter.DEFAULT_FLUSH_RATIO)
+
+    def __pool_share(self) -> float:
+        """
+        Returns the share of the memory budget given to the buffer pool.
+
+        Returns:
+            float: POOL_SHARE, plus CACHE_SHARE in direct I/O mode, where there is no block cache.
+        """
+        if self.io_mode == IOMode.DIRECT:
+            return self.POOL_SHARE + self.CACHE_SHARE
+        return self.POOL_SHARE
+
+    def __repr__(self) -> str:
+        """
+        Returns a readable summary of the sizing settings.
+
+        Returns:
+            str: The summary.
+        """
+        return (f"DBConfig(memory_budget={self.memory_budget}, block_size={self.block_size}, "
+                f"buffer_count={self.buffer_count}, cache_size={self.cache_size}, "
+                f"log_buffer_blocks={self.log_buffer_blocks}, io_mode={self.io_mode.name}, "
+                f"sync_policy={self.sync_policy.name})")
@@ -4,15 +4,23 @@
 # @File    : SimpleDB.py
 # @Project : TestDB
 
-from typing import Optional
+import os
+import threading
+from typing import List, Optional
 
 from buffer.BufferMgr import BufferMgr
+from buffer.BufferPool import BufferPool
+from buffer.BufferWriter import BufferWriter
+from buffer.PartitionedBufferMgr import PartitionedBufferMgr
+from file.BlockID import BlockID
 from file.FileMgr import FileMgr
+from file.SyncPolicy import SyncPolicy
 from log.LogMgr import LogMgr
 from metadata.MetadataMgr import MetadataMgr
 from plan.BasicQueryPlanner import BasicQueryPlanner
 from plan.BasicUpdatePlanner import BasicUpdatePlanner
 from plan.Planner import Planner
+from simpledb.DBConfig import DBConfig
 from tx.Transaction import Transaction
 
 class SimpleDB:
@@ -22,29 +30,63 @@ class SimpleDB:
 
     Typically, the database starts with a new or existing directory,
     recovers if not new, and prepares for transactions.
+
+    The engine is sized by a `DBConfig`. Without an explicit one, the configuration recorded in
+    the database directory is used, or the defaults derived from the default memory budget for a
+    new database. A new database records its configuration, so it is always reopened with the
+    block size it was created with. Unless the configuration disables it, a background writer
+    keeps writing dirty buffers back once the database is up.
+
+    A clean shutdown records the blocks resident in the buffer pool in WARM_FILE; when the
+    database is reopened, a background thread reads them back into the pool. The file is removed
+    once read, so that it never describes a pool older than the last clean shutdown.
     """
 
-    BLOCK_SIZE = 400
-    BUFF_SIZE = 8
+    BLOCK_SIZE = 400  # Block size of databases created before configurations were recorded
     LOG_FILE = "simpledb.log"
+    WARM_FILE = "simpledb.warm"  # Blocks resident in the buffer pool at the last clean shutdown
 
     def __init__(self, dirname: str,
                  block_size: Optional[int] = None,
-                 buff_size: Optional[int] = None):
+                 buff_size: Optional[int] = None,
+                 sync_policy: Optional[SyncPolicy] = None,
+                 config: Optional[DBConfig] = None):
         """
         Initialize the database system with a directory name.
-        If block_size and buff_size are not provided, use default constants.
+        If block_size and buff_size are not provided, the engine is sized by the configuration.
 
         Args:
             dirname (str): Directory name for the database.
             block_size (Optional[int]): Overridden block size if provided.
             buff_size (Optional[int]): Overridden buffer size if provided.
+            sync_policy (Optional[SyncPolicy]): The durability mode applied when transactions commit,
+                overriding the one of the configuration.
+            config (Optional[DBConfig]): The engine configuration. Defaults to the configuration
+                recorded in the database directory.
+
+        Raises:
+            ValueError: If the configuration asks for a block size other than the one the
+                existing database was created with.
         """
-        # If no explicit block/buff size, use defaults
+        self.__writer: Optional[BufferWriter] = None
+        self.__prewarmer: Optional[threading.Thread] = None
+        self.__warm_file: Optional[str] = None
+        # If no explicit block/buff size, size the engine from the configuration
         if block_size is None and buff_size is None:
-            self.__fm = FileMgr(dirname, self.BLOCK_SIZE)
-            self.__lm = LogMgr(self.__fm, self.LOG_FILE)
-            self.__bm = BufferMgr(self.__fm, self.__lm, self.BUFF_SIZE)
+            config = self.__configure(dirname, config, sync_policy)
+            self.__fm = FileMgr(dirname, config.block_size, config.io_mode, config.cache_size,
+                                config.extent_size, config.sync_policy, io_workers=config.io_workers,
+                                max_open_files=config.max_open_files)
+            self.__lm = LogMgr(self.__fm, self.LOG_FILE, config.log_buffer_blocks)
+            if config.buffer_partitions > 1:
+                self.__bm = PartitionedBufferMgr(self.__fm, self.__lm, config.buffer_count, config.max_buffer_wait,
+                                                 config.replacement, config.read_ahead, config.buffer_partitions)
+            else:
+                self.__bm = BufferMgr(self.__fm, self.__lm, config.buffer_count, config.max_buffer_wait,
+                                      config.replacement, config.read_ahead)
+            settings = os.path.join(dirname, DBConfig.CONFIG_FILE)
+            if not os.path.exists(settings):
+                config.save(settings)
             tx = self.new_tx
             is_new = self.__fm.is_new
 
@@ -60,13 +102,93 @@ class SimpleDB:
             self.__planner = Planner(qp, up)
 
             tx.commit()
+            if config.writer_interval > 0:
+                self.__writer = BufferWriter(self.__bm, config.writer_interval, config.writer_max_pages,
+                                             config.writer_dirty_ratio, config.writer_flush_ratio)
+                self.__writer.start()
+            self.__warm_file = os.path.join(dirname, self.WARM_FILE)
+            self.__prewarmer = threading.Thread(target=self.__bm.prewarm, args=(self.__saved_blocks(dirname),),
+                                                name="buffer-prewarm", daemon=True)
+            self.__prewarmer.start()
         else:
             # If user provided custom block/buff sizes
-            self.__fm = FileMgr(dirname, block_size)
+            self.__fm = FileMgr(dirname, block_size, sync_policy=sync_policy or SyncPolicy.NONE)
             self.__lm = LogMgr(self.__fm, self.LOG_FILE)
             self.__bm = BufferMgr(self.__fm, self.__lm, buff_size)
             # Possibly we skip metadata manager setup or do partial init
 
+    @staticmethod
+    def __configure(dirname: str, config: Optional[DBConfig], sync_policy: Optional[SyncPolicy]) -> DBConfig:
+        """
+        Resolves the configuration to open a database with.
+
+        Args:
+            dirname (str): Directory name for the database.
+            config (Optional[DBConfig]): The requested configuration, if any.
+            sync_policy (Optional[SyncPolicy]): A sync policy overriding the configuration, if any.
+
+        Returns:
+            DBConfig: The configuration, with the block size of the existing database if there is one.
+
+        Raises:
+            ValueError: If the requested block size differs from the one of the existing database.
+        """
+        settings = os.path.join(dirname, DBConfig.CONFIG_FILE)
+        if config is None:
+            config = DBConfig.load(settings)
+        if sync_policy is not None:
+            config = config.replace(sync_policy=sync_policy)
+
+        if os.path.exists(settings):
+            recorded = DBConfig.load(settings).block_size
+        elif os.path.exists(dirname):
+            recorded = SimpleDB.BLOCK_SIZE
+        else:
+            return config  # A new database takes the configured block size
+        if config.block_size != recorded:
+            if config.is_explicit('block_size'):
+                raise ValueError(f"Database {dirname} uses {recorded}-byte blocks, "
+                                 f"not {config.block_size}-byte blocks.")
+            config = config.replace(block_size=recorded)
+        return config
+
+    def __saved_blocks(self, dirname: str) -> List[BlockID]:
+        """
+        Returns the blocks recorded in WARM_FILE at the last clean shutdown that their files still
+        hold, and removes WARM_FILE: after a crash, the next start must not read a stale list.
+
+        Args:
+            dirname (str): Directory name for the database.
+
+        Returns:
+            List[BlockID]: The blocks, hottest first.
+        """
+        path = os.path.join(dirname, self.WARM_FILE)
+        lengths = {}
+        blocks = []
+        for blk in BufferPool.load_resident(path):
+            if blk.filename not in lengths:
+                exists = os.path.exists(os.path.join(dirname, blk.filename))
+                lengths[blk.filename] = self.__fm.block_num(blk.filename) if exists else 0
+            if blk.number < lengths[blk.filename]:
+                blocks.append(blk)
+        if os.path.exists(path):
+            os.remove(path)
+        return blocks
+
+    def close(self):
+        """
+        Shut the database down cleanly, stopping the background writer, recording the blocks
+        resident in the buffer pool, syncing pending writes and closing all files.
+        """
+        if self.__prewarmer is not None:
+            self.__prewarmer.join()
+        if self.__writer is not None:
+            self.__writer.stop()
+        if self.__warm_file is not None:
+            self.__bm.save_resident(self.__warm_file)
+        self.__fm.close()
+
     @property
     def new_tx(self) -> Transaction:
         """
@@ -118,11 +240,11 @@ class SimpleDB:
         return self.__lm
 
     @property
-    def buffer_mgr(self) -> BufferMgr:
+    def buffer_mgr(self) -> BufferPool:
         """
         Return the buffer manager.
 
         Returns:
-            BufferMgr: The manager for buffer-pool operations.
+            BufferPool: The manager for buffer-pool operations.
         """
         return self.__bm
\ No newline at end of file
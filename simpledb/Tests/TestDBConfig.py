@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 16:41
+# @Author  : EvanWong
+# @File    : TestDBConfig.py
+# @Project : TestDB
+import contextlib
+import io
+import os
+
+from buffer.BufferMgr import BufferMgr
+from file.IOMode import IOMode
+from file.SyncPolicy import SyncPolicy
+from file.Tests.TempDirectory import temp_directory
+from simpledb.DBConfig import DBConfig
+from simpledb.SimpleDB import SimpleDB
+
+
+def test_derived_sizes():
+    """
+    Checks the settings derived from memory budgets, and that explicit settings win.
+    """
+    config = DBConfig(memory_budget=64 << 20)
+    assert config.block_size == DBConfig.DEFAULT_BLOCK_SIZE
+    assert config.buffer_count == int((64 << 20) * DBConfig.POOL_SHARE) // 4096
+    assert config.cache_size == int((64 << 20) * DBConfig.CACHE_SHARE)
+    assert config.log_buffer_blocks == DBConfig.MAX_LOG_BUFFER_BLOCKS
+
+    small = DBConfig(memory_budget=16 << 10)  # Too small for 8 buffers of 4 KiB
+    assert small.block_size == 1024 and small.buffer_count == 13 and small.log_buffer_blocks == 1
+
+    explicit = DBConfig(memory_budget=64 << 20, block_size=8192, buffer_count=10)
+    assert explicit.block_size == 8192 and explicit.buffer_count == 10
+    assert explicit.replace(block_size=1024).buffer_count == 10
+
+    # Blocks are read ahead by default only where the page cache does not do it
+    assert config.read_ahead == 0 and config.replace(read_ahead=8).read_ahead == 8
+    assert config.replace(io_mode=IOMode.DIRECT).read_ahead == BufferMgr.DEFAULT_READ_AHEAD
+    assert config.buffer_partitions == 1 and config.replace(buffer_partitions=4).buffer_partitions == 4
+
+    # Sizes may be given as in the INI file; settings of the wrong type are rejected
+    assert DBConfig(memory_budget='64M').buffer_count == config.buffer_count
+    for settings in (dict(memory_budget='64 MiB'), dict(buffer_count='8'), dict(io_mode='direct')):
+        try:
+            DBConfig(**settings)
+            assert False, f"{settings} must be rejected"
+        except ValueError:
+            pass
+
+
+def test_load_and_overrides():
+    """
+    Reads a configuration file, applies keyword overrides and writes it back.
+    """
+    with temp_directory("test.ini") as path:
+        with open(path, 'w') as f:
+            f.write("[simpledb]\nmemory_budget = 2M\nblock_size = 2K\nsync_policy = group\n")
+        config = DBConfig.load(path, buffer_count=100)
+        assert config.memory_budget == 2 << 20 and config.block_size == 2048
+        assert config.buffer_count == 100 and config.sync_policy == SyncPolicy.GROUP
+
+        config.save(path)
+        reloaded = DBConfig.load(path)
+        assert repr(reloaded) == repr(config)
+
+
+def test_block_size_is_recorded():
+    """
+    Reopens a database with a different configuration and checks that it keeps its block size.
+    """
+    with temp_directory("configdb") as directory:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = SimpleDB(directory, config=DBConfig(memory_budget=1 << 20, block_size=1024))
+            db.close()
+            db = SimpleDB(directory, config=DBConfig(memory_budget=4 << 20))
+        assert db.file_mgr.block_size == 1024
+        db.close()
+
+        try:
+            SimpleDB(directory, config=DBConfig(block_size=4096))
+            assert False, "a conflicting block size must be rejected"
+        except ValueError:
+            pass
+
+
+def test_reopen_with_new_budget():
+    """
+    Reopens a database with a larger memory budget and checks that the derived settings follow it,
+    while the block size stays the one the database was created with.
+    """
+    with temp_directory("budgetdb") as directory:
+        settings = os.path.join(directory, DBConfig.CONFIG_FILE)
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = SimpleDB(directory, config=DBConfig.load(settings, memory_budget=1 << 20))
+            db.close()
+            config = DBConfig.load(settings, memory_budget=256 << 20)
+            assert not config.is_explicit('buffer_count') and not config.is_explicit('cache_size')
+            assert config.block_size == DBConfig(memory_budget=1 << 20).block_size
+            db = SimpleDB(directory, config=config)
+        assert db.buffer_mgr.buffer_count == int((256 << 20) * DBConfig.POOL_SHARE) // config.block_size
+        db.close()
+
+
+if __name__ == "__main__":
+    test_derived_sizes()
+    test_load_and_overrides()
+    test_block_size_is_recorded()
+    test_reopen_with_new_budget()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/18 02:10
+# @Author  : EvanWong
+# @File    : TestWarmRestart.py
+# @Project : TestDB
+import contextlib
+import io
+import os
+import time
+
+from file.Tests.TempDirectory import temp_directory
+from plan.TablePlan import TablePlan
+from simpledb.DBConfig import DBConfig
+from simpledb.SimpleDB import SimpleDB
+
+ROWS = 300
+
+
+def scan_table(db: SimpleDB) -> int:
+    """
+    Reads every row of the test table and returns their number.
+    """
+    tx = db.new_tx
+    scan = TablePlan(tx, "t", db.metadata_mgr).open()
+    rows = 0
+    while scan.next():
+        rows += 1
+    scan.close()
+    tx.commit()
+    return rows
+
+
+def test_warm_restart():
+    """
+    Closes a database after scanning a table and checks that the reopened database reads the
+    table's blocks back into the pool, so scanning it again reads nothing.
+    """
+    with temp_directory("warmdb") as directory:
+        config = DBConfig(block_size=400, buffer_count=64)
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = SimpleDB(directory, config=config)
+            tx = db.new_tx
+            db.planner.execute_update("create table t (a int, b varchar(10))", tx)
+            for i in range(ROWS):
+                db.planner.execute_update(f"insert into t (a, b) values ({i}, 'r{i}')", tx)
+            tx.commit()
+            assert scan_table(db) == ROWS
+            db.close()
+            warm_file = os.path.join(directory, SimpleDB.WARM_FILE)
+            with open(warm_file) as f:
+                saved = f.read()
+            assert "t.tbl\t" in saved
+            with open(warm_file, "a") as f:  # Entries past the end of a file or of a removed file are skipped
+                f.write("t.tbl\t100000\nremoved.tbl\t0\n")
+
+            db = SimpleDB(directory, config=config)
+            assert not os.path.exists(warm_file)  # A crash from now on must not leave a stale list
+        blocks = {(line.split("\t")[0], int(line.split("\t")[1])) for line in saved.splitlines()}
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            resident = {(blk.filename, blk.number) for blk in db.buffer_mgr.resident_blocks()}
+            if blocks <= resident:
+                break
+            time.sleep(0.01)
+        misses = db.buffer_mgr.misses
+        assert scan_table(db) == ROWS
+        assert db.buffer_mgr.misses == misses
+        db.close()
+
+
+if __name__ == "__main__":
+    test_warm_restart()
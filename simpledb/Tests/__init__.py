@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 16:40
+# @Author  : EvanWong
+# @File    : __init__.py
+# @Project : TestDB
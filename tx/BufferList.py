@@ -4,8 +4,11 @@
 # @File    : BufferList.py
 # @Project : TestDB
 
+from typing import Optional
+
 from buffer.Buffer import Buffer
-from buffer.BufferMgr import BufferMgr
+from buffer.BufferPool import BufferPool
+from buffer.BufferRing import BufferRing
 from file.BlockID import BlockID
 
 
@@ -16,8 +19,8 @@ class BufferList:
     A pinned buffer is one that the transaction has locked and is working with.
     """
 
-    def __init__(self, bm: BufferMgr):
-        self.__bm: BufferMgr = bm  # Reference to Buffer Manager
+    def __init__(self, bm: BufferPool):
+        self.__bm: BufferPool = bm  # Reference to Buffer Manager
         self.__buffers: dict[BlockID, Buffer] = {}  # Stores pinned buffers by BlockID
         self.__pins: list[BlockID] = []  # Stores BlockIDs of pinned buffers
 
@@ -36,15 +39,16 @@ class BufferList:
         #     print(b)
         return self.__buffers.get(blk)
 
-    def pin(self, blk: BlockID):
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None):
         """ Pin a block into the buffer pool.
 
         If the buffer is not already pinned, it will be pinned and added to the buffers list.
 
         Args:
             blk (BlockID): The BlockID to pin.
+            ring (Optional[BufferRing]): The buffer ring of a bulk operation, if any.
         """
-        buff = self.__bm.pin(blk)  # Retrieve the buffer for the block
+        buff = self.__bm.pin(blk, ring)  # Retrieve the buffer for the block
         # print(f"Block {blk} pinned to {buff}")
         self.__buffers[blk] = buff
         self.__pins.append(blk)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# @Time    : 2026/10/17 13:48
+# @Author  : EvanWong
+# @File    : CommitBenchmark.py
+# @Project : TestDB
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from file.BlockID import BlockID
+from file.SyncPolicy import SyncPolicy
+from simpledb.SimpleDB import SimpleDB
+
+COMMITS = 500
+TABLE_BLOCKS = 8
+
+
+def run_commits(db: SimpleDB) -> float:
+    """
+    Runs small update transactions, each changing one integer of a block, and commits them.
+
+    Args:
+        db (SimpleDB): The database to run the transactions against.
+
+    Returns:
+        float: The number of commits per second.
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Transactions announce every commit
+        for i in range(COMMITS):
+            blk = BlockID("bench.tbl", i % TABLE_BLOCKS)
+            tx = db.new_tx
+            tx.pin(blk)
+            tx.set_int(blk, 80, i, True)
+            tx.commit()
+    elapsed = time.perf_counter() - start
+    return COMMITS / elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_directory:
+        print(f"{COMMITS} single-update transactions")
+        print(f"{'policy':>8}{'commits/s':>14}")
+        for policy in (SyncPolicy.NONE, SyncPolicy.COMMIT, SyncPolicy.GROUP):
+            with contextlib.redirect_stdout(io.StringIO()):
+                database = SimpleDB(os.path.join(base_directory, policy.name), 400, 16, sync_policy=policy)
+            rate = run_commits(database)
+            database.close()
+            print(f"{policy.name:>8}{rate:>14,.0f}")
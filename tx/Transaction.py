@@ -4,7 +4,10 @@
 # @File    : Transaction.py
 # @Project : TestDB
 
-from buffer.BufferMgr import BufferMgr
+from typing import Optional
+
+from buffer.BufferPool import BufferPool
+from buffer.BufferRing import BufferRing
 from file.BlockID import BlockID
 from file.FileMgr import FileMgr
 from log.LogMgr import LogMgr
@@ -19,14 +22,15 @@ class Transaction:
     __next_tx_num = 0
     __EOF = -1
 
-    def __init__(self, fm: FileMgr, lm: LogMgr, bm: BufferMgr):
+    def __init__(self, fm: FileMgr, lm: LogMgr, bm: BufferPool):
         """ Initialize the transaction with the provided file, log, and buffer managers. """
         self.__tx_num: int = self.__next_tx_number()
         self.__buffers: BufferList = BufferList(bm)
         self.__fm: FileMgr = fm
-        self.__bm: BufferMgr = bm
+        self.__bm: BufferPool = bm
         self.__cm: ConcurrencyMgr = ConcurrencyMgr()
         self.__rm: RecoveryMgr = RecoveryMgr(self.__tx_num, lm, bm)
+        self.__temp_files: list[str] = []  # Temporary files created by this transaction
 
     def commit(self):
         """ Commit the transaction, making all changes permanent. """
@@ -47,16 +51,18 @@ class Transaction:
         print(f"{action_message} transaction {self.__tx_num}")
         self.__cm.release()  # Release all locks held by the transaction
         self.__buffers.unpin_all() # Unpin all buffers associated with this transaction
+        for filename in list(self.__temp_files):  # Temporary data dies with the transaction
+            self.drop_temp_file(filename)
 
     def recover(self):
         """ Recover the transaction's state from logs. """
         self.__bm.flush_all(self.__tx_num)
         self.__rm.recover(self)  # Recover the transaction's state from the log
 
-    def pin(self, blk: BlockID):
-        """ Pin a block into the buffer pool. """
+    def pin(self, blk: BlockID, ring: Optional[BufferRing] = None):
+        """ Pin a block into the buffer pool, through the given ring if the access is part of a bulk operation. """
         # print("Transaction called pin")
-        self.__buffers.pin(blk)
+        self.__buffers.pin(blk, ring)
 
     def unpin(self, blk: BlockID):
         """ Unpin a block from the buffer pool. """
@@ -131,6 +137,39 @@ class Transaction:
             raise InterruptedError("Unable to acquire exclusive lock on file.")
         return self.__fm.append(filename)
 
+    def create_temp_file(self, suffix: str = "") -> str:
+        """ Create the name of a temporary file, which is deleted when the transaction ends.
+
+        Blocks of temporary files are neither locked nor logged, and the file is never synced.
+
+        Args:
+            suffix (str): A suffix to append to the generated name, e.g. a file extension.
+
+        Returns:
+            str: The name of the temporary file.
+        """
+        filename = self.__fm.next_temp_name() + suffix
+        self.__temp_files.append(filename)
+        return filename
+
+    def new_buffer_ring(self) -> BufferRing:
+        """ Create a buffer ring for a bulk operation, so it reuses a few buffers instead of flooding the pool. """
+        return self.__bm.new_ring()
+
+    def reserve_buffers(self, filename: str, frames: int) -> int:
+        """ Keep up to the given number of blocks of a file resident; see `BufferMgr.reserve`.
+
+        Returns:
+            int: The number of buffers reserved.
+        """
+        return self.__bm.reserve(filename, frames)
+
+    def drop_temp_file(self, filename: str):
+        """ Delete a temporary file of this transaction; its blocks must not be pinned. """
+        self.__bm.discard_file(filename)
+        self.__fm.remove(filename)
+        self.__temp_files.remove(filename)
+
     @property
     def block_size(self) -> int:
         """ Return the block size for the file manager. """
@@ -141,6 +180,11 @@ class Transaction:
         """ Return the number of available buffers in the buffer pool. """
         return self.__bm.available
 
+    @property
+    def buffer_count(self) -> int:
+        """ Return the total number of buffers in the buffer pool. """
+        return self.__bm.buffer_count
+
     @staticmethod
     def __next_tx_number() -> int:
         """ Generate the next unique transaction number. """
@@ -4,6 +4,7 @@
 # @File    : ConcurrencyMgr.py
 # @Project : TestDB
 from file.BlockID import BlockID
+from file.FileMgr import FileMgr
 from tx.concurrency.LockTable import LockTable
 
 
@@ -12,6 +13,7 @@ class ConcurrencyMgr:
 
     This class manages locks for individual transactions and interacts with a global lock table.
     Each transaction has its own concurrency manager that keeps track of locks held by that transaction.
+    Blocks of temporary files are private to the transaction that created them and are never locked.
 
     Attributes:
         __lock_table (LockTable): Global lock table that coordinates locks across all transactions.
@@ -38,6 +40,8 @@ class ConcurrencyMgr:
         Returns:
             bool: True if the lock was successfully acquired, False if unable to acquire the lock.
         """
+        if FileMgr.is_temp(blk.filename):
+            return True
         if blk not in list(self.__locks.keys()):  # If the block is not already locked by this transaction
             if not self.__lock_table.s_lock(blk):  # Attempt to acquire the S lock from the global lock table
                 return False  # Lock acquisition failed
@@ -57,6 +61,8 @@ class ConcurrencyMgr:
         Returns:
             bool: True if the lock was successfully acquired, False if unable to acquire the lock.
         """
+        if FileMgr.is_temp(blk.filename):
+            return True
         if blk not in list(self.__locks.keys()) or self.__locks[blk] != "X":  # If not already exclusively locked by this transaction
             # If the block is locked with an S lock, try upgrading to X lock
             if blk in list(self.__locks.keys()) and self.__locks[blk] == "S":
@@ -5,7 +5,8 @@
 # @Project : TestDB
 
 from buffer.Buffer import Buffer
-from buffer.BufferMgr import BufferMgr
+from buffer.BufferPool import BufferPool
+from file.FileMgr import FileMgr
 from log.LogMgr import LogMgr
 from tx.recovery.CommitRecord import CommitRecord
 from tx.recovery.RecordType import RecordType
@@ -27,20 +28,20 @@ class RecoveryMgr:
     Attributes:
         __tx_num (int): The transaction number associated with this recovery.
         __lm (LogMgr): The Log Manager used to write and read log records.
-        __bm (BufferMgr): The Buffer Manager responsible for managing data buffers.
+        __bm (BufferPool): The Buffer Manager responsible for managing data buffers.
     """
 
-    def __init__(self, tx_num: int, lm: LogMgr, bm: BufferMgr):
+    def __init__(self, tx_num: int, lm: LogMgr, bm: BufferPool):
         """Initialize the Recovery Manager with transaction number, LogMgr, and BufferMgr.
 
         Args:
             tx_num (int): The transaction number for the current transaction.
             lm (LogMgr): The Log Manager that handles log operations.
-            bm (BufferMgr): The Buffer Manager that handles the data buffers.
+            bm (BufferPool): The Buffer Manager that handles the data buffers.
         """
         self.__tx_num: int = tx_num
         self.__lm: LogMgr = lm
-        self.__bm: BufferMgr = bm
+        self.__bm: BufferPool = bm
 
         # Log the start of the transaction
         StartRecord.write_to_log(lm, tx_num)
@@ -49,10 +50,14 @@ class RecoveryMgr:
         """Commit the current transaction, ensuring changes are persisted and logged.
 
         This method flushes all the buffers related to the transaction and writes a commit log record.
+        The buffers are flushed and, if the sync policy asks for it, synced before the record is
+        appended: recovery only undoes, so the commit record must not become durable before the
+        transaction's data pages.
         """
-        lsn = CommitRecord.write_to_log(self.__lm, self.__tx_num)
-        self.__lm.flush(lsn)
         self.__bm.flush_all(self.__tx_num)
+        self.__lm.force_data()
+        lsn = CommitRecord.write_to_log(self.__lm, self.__tx_num)
+        self.__lm.force(lsn)
 
     def rollback(self, tx):
         """Rollback the current transaction, undoing all the changes made by the transaction.
@@ -65,8 +70,9 @@ class RecoveryMgr:
         """
         self.__do_rollback(tx)
         self.__bm.flush_all(self.__tx_num)
+        self.__lm.force_data()  # The undone pages must be durable before the rollback record
         lsn = RollbackRecord.write_to_log(self.__lm, self.__tx_num)
-        self.__lm.flush(lsn)
+        self.__lm.force(lsn)
 
     def recover(self, tx):
         """Recover the database to a consistent state, applying all the changes up until the last checkpoint.
@@ -79,9 +85,10 @@ class RecoveryMgr:
         """
         self.__do_recover(tx)
         self.__bm.flush_all(self.__tx_num)
+        self.__lm.force_data()
         # A rollback record is written at the end of recovery, but this may not always be required.
         lsn = RollbackRecord.write_to_log(self.__lm, self.__tx_num)
-        self.__lm.flush(lsn)
+        self.__lm.force(lsn)
 
     def set_int(self, buff: Buffer, offset: int) -> int:
         """Write the set int record to log.
@@ -91,8 +98,11 @@ class RecoveryMgr:
             offset (int): The offset in the block where the integer will be set.
 
         Returns:
-            int: The LSN of the log record created for this operation.
+            int: The LSN of the log record created for this operation, or -1 for a block of a
+                temporary file, which is never logged.
         """
+        if FileMgr.is_temp(buff.block.filename):
+            return -1
         val = buff.contents.get_int(offset)
         return SetIntRecord.write_to_log(self.__lm, self.__tx_num, buff.block, offset, val)
 
@@ -104,8 +114,11 @@ class RecoveryMgr:
             offset (int): The offset in the block where the string will be set.
 
         Returns:
-            int: The LSN of the log record created for this operation.
+            int: The LSN of the log record created for this operation, or -1 for a block of a
+                temporary file, which is never logged.
         """
+        if FileMgr.is_temp(buff.block.filename):
+            return -1
         val = buff.contents.get_string(offset)
         return SetStringRecord.write_to_log(self.__lm, self.__tx_num, buff.block, offset, val)
 
@@ -117,8 +130,11 @@ class RecoveryMgr:
             offset (int): The offset in the block where the float will be set.
 
         Returns:
-            int: The LSN of the log record created for this operation.
+            int: The LSN of the log record created for this operation, or -1 for a block of a
+                temporary file, which is never logged.
         """
+        if FileMgr.is_temp(buff.block.filename):
+            return -1
         val = buff.contents.get_float(offset)
         return SetFloatRecord.write_to_log(self.__lm, self.__tx_num, buff.block, offset, val)
 